@@ -0,0 +1,4 @@
+"""
+Pipeline de documentos do Túnel Santos-Guarujá: PDF -> Markdown, tradução, índices de busca e upload
+Os módulos são importados sob demanda pela CLI (tunel_docs.cli); nada pesado é carregado aqui
+"""
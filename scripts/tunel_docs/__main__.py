@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+Permite rodar a CLI com `python -m tunel_docs <comando>`
+"""
+
+from tunel_docs.cli import main
+
+if __name__ == "__main__":
+    main()
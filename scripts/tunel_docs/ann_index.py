@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Índices aproximados (ANN) gravados ao lado da matriz de embeddings
+IVF em NumPy puro e, se o hnswlib estiver instalado, HNSW; inclui benchmark de recall x latência
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+IVF_FILE = "ann_ivf.npz"
+HNSW_FILE = "ann_hnsw.bin"
+HNSW_META_FILE = "ann_hnsw.json"
+
+
+def index_fingerprint(meta: Dict) -> str:
+    """Identifica o conteúdo da matriz, para descartar um ANN de outra versão do índice"""
+    digest = hashlib.sha1(f"{meta.get('backend', 'openai')}/{meta['model']}".encode())
+    for chunk in meta['chunks']:
+        digest.update(chunk['hash'].encode())
+    return digest.hexdigest()
+
+
+def _top_rows(scores: np.ndarray, k: int) -> np.ndarray:
+    k = min(k, len(scores))
+    if k == 0:
+        return np.zeros(0, dtype=np.intp)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+class IVFIndex:
+    """
+    Arquivo invertido: k-means esférico agrupa as linhas em `nlist` listas
+
+    A consulta compara o vetor com os centróides e só calcula a similaridade
+    exata das linhas das `nprobe` listas mais próximas.
+    """
+
+    method = 'ivf'
+
+    def __init__(self, centroids: np.ndarray, order: np.ndarray, offsets: np.ndarray,
+                 fingerprint: str, nprobe: int = 8):
+        self.centroids = centroids
+        self.order = order
+        self.offsets = offsets
+        self.fingerprint = fingerprint
+        self.nprobe = nprobe
+
+    @staticmethod
+    def _assign(matrix: np.ndarray, centroids: np.ndarray, block_rows: int = 8192) -> np.ndarray:
+        """Centróide mais próximo de cada linha, em blocos para limitar a memória"""
+        assignment = np.empty(matrix.shape[0], dtype=np.int32)
+        for start in range(0, matrix.shape[0], block_rows):
+            assignment[start:start + block_rows] = np.argmax(
+                matrix[start:start + block_rows] @ centroids.T, axis=1)
+        return assignment
+
+    @staticmethod
+    def _lists(assignment: np.ndarray, nlist: int):
+        """Ordem das linhas agrupadas por lista e o início de cada lista"""
+        order = np.argsort(assignment, kind='stable').astype(np.int32)
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=nlist), out=offsets[1:])
+        return order, offsets
+
+    @classmethod
+    def train(cls, matrix: np.ndarray, fingerprint: str, nlist: Optional[int] = None,
+              iterations: int = 8, sample_size: int = 32, seed: int = 42) -> 'IVFIndex':
+        """Treina os centróides numa amostra e distribui todas as linhas (já normalizadas)"""
+        rows = matrix.shape[0]
+        nlist = max(1, min(nlist or int(4 * np.sqrt(rows)), rows))
+        rng = np.random.default_rng(seed)
+        sample = np.asarray(matrix[np.sort(rng.choice(rows, min(rows, nlist * sample_size), replace=False))])
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            order, offsets = cls._lists(cls._assign(sample, centroids), nlist)
+            filled = np.flatnonzero(offsets[1:] > offsets[:-1])
+            # Listas vazias mantêm o centróide anterior
+            sums = np.add.reduceat(sample[order], offsets[filled], axis=0)
+            centroids[filled] = sums / np.linalg.norm(sums, axis=1, keepdims=True).clip(min=1e-12)
+
+        order, offsets = cls._lists(cls._assign(matrix, centroids), nlist)
+        return cls(centroids, order, offsets, fingerprint)
+
+    def save(self, index_dir: Path):
+        tmp = index_dir / (IVF_FILE + '.tmp.npz')
+        np.savez(tmp, centroids=self.centroids, order=self.order, offsets=self.offsets,
+                 fingerprint=np.array(self.fingerprint))
+        tmp.replace(index_dir / IVF_FILE)
+
+    @classmethod
+    def load(cls, index_dir: Path) -> Optional['IVFIndex']:
+        path = index_dir / IVF_FILE
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            return cls(data['centroids'], data['order'], data['offsets'], str(data['fingerprint']))
+
+    def search(self, matrix: np.ndarray, vector: np.ndarray, k: int) -> np.ndarray:
+        probes = _top_rows(self.centroids @ vector, self.nprobe)
+        candidates = np.concatenate([self.order[self.offsets[p]:self.offsets[p + 1]] for p in probes])
+        return candidates[_top_rows(matrix[candidates] @ vector, k)]
+
+
+class HNSWIndex:
+    """Grafo HNSW do hnswlib (dependência opcional)"""
+
+    method = 'hnsw'
+
+    def __init__(self, index, fingerprint: str, ef: int = 64):
+        self.index = index
+        self.fingerprint = fingerprint
+        self.ef = ef
+
+    @staticmethod
+    def _hnswlib():
+        try:
+            import hnswlib
+        except ImportError:
+            raise ValueError("Índice HNSW requer: pip install hnswlib")
+        return hnswlib
+
+    @classmethod
+    def train(cls, matrix: np.ndarray, fingerprint: str, m: int = 16,
+              ef_construction: int = 200, threads: int = -1) -> 'HNSWIndex':
+        hnswlib = cls._hnswlib()
+        index = hnswlib.Index(space='ip', dim=matrix.shape[1])
+        index.init_index(max_elements=matrix.shape[0], ef_construction=ef_construction, M=m)
+        index.add_items(matrix, np.arange(matrix.shape[0]), num_threads=threads)
+        return cls(index, fingerprint)
+
+    def save(self, index_dir: Path):
+        self.index.save_index(str(index_dir / HNSW_FILE))
+        with open(index_dir / HNSW_META_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'dim': self.index.dim,
+                       'rows': self.index.get_current_count()}, f)
+
+    @classmethod
+    def load(cls, index_dir: Path) -> Optional['HNSWIndex']:
+        if not (index_dir / HNSW_FILE).exists() or not (index_dir / HNSW_META_FILE).exists():
+            return None
+        with open(index_dir / HNSW_META_FILE, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        index = cls._hnswlib().Index(space='ip', dim=info['dim'])
+        index.load_index(str(index_dir / HNSW_FILE), max_elements=info['rows'])
+        return cls(index, info['fingerprint'])
+
+    def search(self, matrix: np.ndarray, vector: np.ndarray, k: int) -> np.ndarray:
+        k = min(k, matrix.shape[0])
+        self.index.set_ef(max(self.ef, k))
+        labels, _ = self.index.knn_query(vector, k=k)
+        return labels[0].astype(np.intp)
+
+
+ANN_METHODS = {
+    IVFIndex.method: IVFIndex,
+    HNSWIndex.method: HNSWIndex,
+}
+
+
+def build_ann(method: str, matrix: np.ndarray, meta: Dict, index_dir: Path, **options):
+    """Treina e grava o índice aproximado para a matriz (linhas normalizadas)"""
+    if method not in ANN_METHODS:
+        raise ValueError(f"Índice ANN desconhecido: {method} (opções: {', '.join(ANN_METHODS)})")
+    start = time.perf_counter()
+    ann = ANN_METHODS[method].train(matrix, index_fingerprint(meta), **options)
+    ann.save(Path(index_dir))
+    print(f"🧭 Índice {method.upper()} salvo em {index_dir} ({time.perf_counter() - start:.1f}s)")
+    return ann
+
+
+def load_ann(index_dir: Path, meta: Dict):
+    """Carrega o primeiro índice aproximado válido para a matriz atual (ou None)"""
+    fingerprint = index_fingerprint(meta)
+    for method in ANN_METHODS.values():
+        try:
+            ann = method.load(Path(index_dir))
+        except ValueError:
+            continue
+        if ann is not None and ann.fingerprint == fingerprint:
+            return ann
+    return None
+
+
+def synthetic_matrix(rows: int, dim: int, clusters: int = 256, seed: int = 42) -> np.ndarray:
+    """Embeddings sintéticos agrupados (linhas normalizadas), para medir em escala"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    matrix = centers[rng.integers(0, clusters, rows)]
+    matrix += 0.6 * rng.standard_normal((rows, dim)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix
+
+
+def benchmark(matrix: np.ndarray, ann, queries: np.ndarray, k: int = 10,
+              settings: Optional[List[int]] = None) -> List[Dict]:
+    """Recall@k e latência de cada configuração (nprobe/ef) contra a busca exata"""
+    def measure(search) -> Dict:
+        latencies, found = [], []
+        for vector in queries:
+            start = time.perf_counter()
+            found.append(search(vector))
+            latencies.append((time.perf_counter() - start) * 1000)
+        return {'rows': found, 'mean_ms': float(np.mean(latencies)),
+                'p95_ms': float(np.percentile(latencies, 95))}
+
+    exact = measure(lambda vector: _top_rows(matrix @ vector, k))
+    results = [{'method': 'exact', 'setting': None, 'recall': 1.0,
+                'mean_ms': exact['mean_ms'], 'p95_ms': exact['p95_ms']}]
+
+    attribute = 'nprobe' if ann.method == 'ivf' else 'ef'
+    for setting in settings or [1, 4, 8, 16, 32]:
+        setattr(ann, attribute, setting)
+        run = measure(lambda vector: ann.search(matrix, vector, k))
+        recall = np.mean([len(set(a) & set(b)) / len(b) for a, b in zip(run['rows'], exact['rows'])])
+        results.append({'method': ann.method, 'setting': f"{attribute}={setting}",
+                        'recall': float(recall), 'mean_ms': run['mean_ms'], 'p95_ms': run['p95_ms']})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de recall x latência do índice ANN")
+    parser.add_argument('--index-dir', default='embedding_index')
+    parser.add_argument('--method', choices=sorted(ANN_METHODS), default='ivf')
+    parser.add_argument('--synthetic', type=int, default=0,
+                        help="Usa N linhas sintéticas em vez do índice salvo")
+    parser.add_argument('--dim', type=int, default=384, help="Dimensão das linhas sintéticas")
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('-k', '--top-k', type=int, default=10)
+    parser.add_argument('--settings', default=None,
+                        help="Valores de nprobe (IVF) ou ef (HNSW), separados por vírgula")
+    parser.add_argument('--output', default=None, help="Grava os resultados em JSON")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        matrix = synthetic_matrix(args.synthetic, args.dim)
+        meta = {'backend': 'synthetic', 'model': f"{args.synthetic}x{args.dim}", 'chunks': []}
+        source = f"sintético {matrix.shape[0]} x {matrix.shape[1]}"
+    else:
+        from tunel_docs.build_embedding_index import load_index, normalize_rows
+        meta, matrix = load_index(Path(args.index_dir))
+        if meta is None:
+            print(f"❌ Índice não encontrado em {args.index_dir}")
+            return
+        if not meta.get('normalized'):
+            matrix = normalize_rows(matrix)
+        source = f"{args.index_dir} ({matrix.shape[0]} x {matrix.shape[1]})"
+
+    print(f"📐 Benchmark ANN sobre {source}")
+    start = time.perf_counter()
+    ann = ANN_METHODS[args.method].train(matrix, index_fingerprint(meta))
+    print(f"  Construção {args.method.upper()}: {time.perf_counter() - start:.1f}s")
+
+    # Consultas: linhas do próprio índice com ruído, como perguntas próximas de algum chunk
+    rng = np.random.default_rng(7)
+    queries = matrix[rng.choice(matrix.shape[0], args.queries)]
+    queries = queries + 0.05 * rng.standard_normal(queries.shape).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    settings = [int(s) for s in args.settings.split(',')] if args.settings else None
+    results = benchmark(matrix, ann, queries, args.top_k, settings)
+
+    print(f"\n  {'Configuração':<14} {'Recall@' + str(args.top_k):>10} {'Média':>10} {'p95':>10}")
+    for result in results:
+        print(f"  {result['setting'] or 'exata':<14} {result['recall']:>10.3f} "
+              f"{result['mean_ms']:>8.2f}ms {result['p95_ms']:>8.2f}ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'source': source, 'k': args.top_k, 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Benchmark do pipeline PDF -> Markdown sobre um corpus sintético
+Mede páginas/s, MB/s e pico de memória (RSS) por etapa e compara com execuções anteriores
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from tunel_docs.convert_all_pdfs import MAX_TRANSLATED_PAGE_CHARS, translate_text
+from tunel_docs.document_model import (detect_languages, extract_document, load_document, model_path,
+                                       page_markdown, page_text, render_markdown, save_document,
+                                       set_translation)
+from tunel_docs.synthetic_corpus import generate_corpus
+from tunel_docs.translation_backends import StubBackend
+
+# Métricas em que um valor menor indica regressão
+THROUGHPUT_METRICS = ['pages_per_sec', 'mb_per_sec']
+
+# Módulos cujo custo de importação é acompanhado (workers curtos pagam isso a cada processo)
+IMPORT_MODULES = ['cli', 'convert_all_pdfs', 'translation_backends', 'pdf_translator_v2',
+                  'pdf_translator_google', 'setup_openai_assistant', 'chunk_store', 'search_index']
+
+# Dependências pesadas que só devem carregar quando usadas
+HEAVY_MODULES = ['fitz', 'pymupdf', 'openai', 'deep_translator', 'dotenv', 'numpy']
+
+# Variações de importação abaixo disso são ruído
+IMPORT_NOISE_MS = 5.0
+
+
+def reset_peak_rss() -> bool:
+    """Zera o pico de RSS do processo (Linux); retorna False se não suportado"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """Pico de RSS do processo em MB"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS informa em bytes, Linux em KB
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_stage(name: str, fn: Callable[..., int], nbytes: int, *args) -> Dict:
+    """Executa uma etapa (fn(*args) retorna as páginas processadas) medindo tempo, vazão e memória"""
+    isolated = reset_peak_rss()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    pages = fn(*args)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    result = {
+        'stage': name,
+        'wall_s': round(wall, 4),
+        'cpu_s': round(cpu, 4),
+        'pages': pages,
+        'mb': round(nbytes / 1e6, 4),
+        'pages_per_sec': round(pages / wall, 2) if wall else None,
+        'mb_per_sec': round(nbytes / 1e6 / wall, 3) if wall else None,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        # Sem clear_refs o pico é o do processo inteiro até aqui
+        'peak_rss_isolated': isolated,
+    }
+    print(f"  {name:<10} {result['wall_s']:>8.3f}s {result['pages_per_sec'] or 0:>10.1f} pág/s "
+          f"{result['mb_per_sec'] or 0:>8.2f} MB/s {result['peak_rss_mb']:>8.1f} MB")
+    return result
+
+
+def import_time(module: str, repeat: int = 3) -> Dict:
+    """
+    Tempo de importação de um módulo do pacote num interpretador novo (python -X importtime)
+
+    Usa o menor tempo cumulativo entre as repetições e lista as dependências
+    pesadas que a importação carregou.
+    """
+    scripts_dir = Path(__file__).parents[1]
+    qualified = f"{__package__}.{module}"
+    best = None
+    loaded: List[str] = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {qualified}'],
+                              cwd=scripts_dir, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return {'module': module, 'error': proc.stderr.strip().splitlines()[-1][:80]}
+        # Linhas no formato "import time: self [us] | cumulative | nome"
+        cumulative = {}
+        for line in proc.stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line:
+                continue
+            _, total, name = line[len('import time:'):].split('|')
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total)
+        loaded = [name for name in HEAVY_MODULES if name in cumulative]
+        micros = cumulative.get(qualified)
+        if micros is not None and (best is None or micros < best):
+            best = micros
+    return {'module': module, 'import_ms': round(best / 1000, 2) if best is not None else None,
+            'heavy': loaded}
+
+
+def run_import_benchmark(modules: List[str] = IMPORT_MODULES, repeat: int = 3) -> Dict:
+    """Mede o tempo de importação de cada módulo acompanhado"""
+    print(f"\n⏱️  Tempo de importação (python -X importtime, melhor de {repeat})")
+    results = {}
+    for module in modules:
+        result = import_time(module, repeat)
+        results[module] = result
+        if 'error' in result:
+            print(f"  {module:<24} ❌ {result['error']}")
+        else:
+            heavy = f" (carrega {', '.join(result['heavy'])})" if result['heavy'] else ""
+            print(f"  {module:<24} {result['import_ms'] or 0:>8.1f} ms{heavy}")
+    return results
+
+
+def run_benchmark(corpus_dir: Path, documents: int, stub_latency: float = 0.0) -> Dict:
+    """
+    Gera (ou reaproveita) o corpus e executa as etapas da conversão
+
+    Mesmo caminho do convert_all_pdfs: extração do modelo, detecção de
+    idioma, formatação e tradução das páginas em inglês, renderização do
+    Markdown e releitura do modelo gravado (o que uma nova execução faz em vez
+    de reabrir o PDF). Cada etapa conta as páginas e os bytes que de fato processou.
+    """
+    import fitz  # PyMuPDF
+
+    paths = generate_corpus(corpus_dir, documents)
+    pdf_bytes = sum(p.stat().st_size for p in paths)
+    models_dir = corpus_dir / 'models'
+
+    models: List[Dict] = []
+    english: List[tuple] = []
+    rendered: List[str] = []
+
+    def extract(paths):
+        models.extend(extract_document(str(path), detect=False) for path in paths)
+        return sum(len(document['pages']) for document in models)
+
+    def detect(models):
+        for document in models:
+            detect_languages(document)
+        return sum(len(document['pages']) for document in models)
+
+    def format_all(pages):
+        # Como o pdf_to_markdown: formata as páginas em inglês e só traduz as que cabem
+        for page in pages:
+            text = page_markdown(page)
+            if len(text) < MAX_TRANSLATED_PAGE_CHARS:
+                english.append((page, text))
+        return len(pages)
+
+    def translate_all(english):
+        for page, text in english:
+            translated, ok = translate_text(text, backend='stub', language='en')
+            if ok:
+                set_translation(page, translated, 'stub', StubBackend.model)
+        return len(english)
+
+    def render_all(models):
+        rendered.extend(render_markdown(document) for document in models)
+        return sum(len(document['pages']) for document in models)
+
+    def load_all(model_files):
+        return sum(len(load_document(path)['pages']) for path in model_files)
+
+    StubBackend.latency = stub_latency
+    print(f"📦 Corpus: {len(paths)} PDFs, {pdf_bytes / 1e6:.2f} MB em {corpus_dir}")
+    print(f"  {'Etapa':<10} {'Tempo':>9} {'Vazão':>15} {'Vazão':>13} {'Pico RSS':>11}")
+
+    # A extração inclui abrir o PDF; a detecção de idioma é medida à parte
+    stages = [run_stage('extract', extract, pdf_bytes, paths)]
+    pages = sum(len(document['pages']) for document in models)
+    text_bytes = sum(len(page_text(page).encode('utf-8')) for document in models for page in document['pages'])
+    stages.append(run_stage('detect', detect, text_bytes, models))
+    en_pages = [page for document in models for page in document['pages'] if page['language'] == 'en']
+    stages.append(run_stage('format', format_all, sum(len(page_text(page).encode('utf-8')) for page in en_pages),
+                            en_pages))
+    stages.append(run_stage('translate', translate_all, sum(len(t.encode('utf-8')) for _, t in english), english))
+    stages.append(run_stage('render', render_all, text_bytes, models))
+
+    model_files = []
+    for path, document in zip(paths, models):
+        model_files.append(model_path(models_dir, Path(path.name).with_suffix('.md')))
+        save_document(document, model_files[-1])
+    stages.append(run_stage('load_model', load_all, sum(p.stat().st_size for p in model_files), model_files))
+
+    return {
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pymupdf': fitz.VersionBind,
+        },
+        'corpus': {
+            'documents': len(paths),
+            'pages': pages,
+            'pdf_mb': round(pdf_bytes / 1e6, 3),
+            'english_pages': len(english),
+        },
+        'stub_latency': stub_latency,
+        'stages': {stage['stage']: stage for stage in stages},
+    }
+
+
+def save_results(results: Dict, output_dir: Path) -> Path:
+    """Grava os resultados com carimbo de data"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"bench_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def latest_results(output_dir: Path) -> Optional[Path]:
+    """Resultado mais recente salvo no diretório"""
+    files = sorted(output_dir.glob('bench_*.json'))
+    return files[-1] if files else None
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Lista as etapas cuja vazão caiu (ou importações que ficaram mais lentas) mais que `threshold`"""
+    regressions = []
+    for module, entry in results.get('imports', {}).items():
+        old = baseline.get('imports', {}).get(module, {}).get('import_ms')
+        new = entry.get('import_ms')
+        if old and new is not None and new > old * (1 + threshold) and new - old > IMPORT_NOISE_MS:
+            regressions.append(f"import {module}: {old} ms -> {new} ms ({(new - old) / old:+.0%})")
+    for name, stage in results['stages'].items():
+        previous = baseline.get('stages', {}).get(name)
+        if not previous:
+            continue
+        for metric in THROUGHPUT_METRICS:
+            old, new = previous.get(metric), stage.get(metric)
+            if old and new is not None and new < old * (1 - threshold):
+                regressions.append(f"{name}.{metric}: {old} -> {new} ({(new - old) / old:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline PDF -> Markdown")
+    parser.add_argument('--documents', type=int, default=12,
+                        help="Quantidade de PDFs sintéticos")
+    parser.add_argument('--corpus-dir', default=None,
+                        help="Diretório do corpus (reaproveitado entre execuções); padrão: temporário")
+    parser.add_argument('--output-dir', default='bench_results',
+                        help="Onde salvar os resultados")
+    parser.add_argument('--baseline', default=None,
+                        help="Resultado para comparação (padrão: o mais recente em --output-dir)")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Queda de vazão tolerada antes de acusar regressão")
+    parser.add_argument('--stub-latency', type=float, default=0.0,
+                        help="Latência simulada por requisição do tradutor local")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="Sai com código 1 se houver regressão")
+    parser.add_argument('--skip-imports', action='store_true',
+                        help="Não mede o tempo de importação dos módulos")
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    baseline_path = Path(args.baseline) if args.baseline else latest_results(output_dir)
+
+    print("🏁 Benchmark do pipeline PDF -> Markdown")
+    print("=" * 60)
+    if args.corpus_dir:
+        results = run_benchmark(Path(args.corpus_dir), args.documents, args.stub_latency)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = run_benchmark(Path(tmp), args.documents, args.stub_latency)
+    if not args.skip_imports:
+        results['imports'] = run_import_benchmark()
+
+    saved = save_results(results, output_dir)
+    print(f"\n💾 Resultados salvos em {saved}")
+
+    if baseline_path and baseline_path.exists():
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        print(f"📐 Comparação com {baseline_path.name}:")
+        if regressions:
+            for regression in regressions:
+                print(f"  ⚠️  {regression}")
+            if args.fail_on_regression:
+                sys.exit(1)
+        else:
+            print(f"  ✅ Nenhuma regressão acima de {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
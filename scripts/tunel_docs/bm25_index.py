@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Índice invertido BM25 sobre os mesmos chunks do índice de embeddings
+Termos sem acento (como normalize_filenames), sem stopwords e reduzidos ao radical
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from tunel_docs.build_embedding_index import chunk_metadata, load_chunks
+from tunel_docs.normalize_filenames import remove_accents
+
+POSTINGS_FILE = "bm25.npz"
+META_FILE = "bm25_meta.json"
+
+# Já sem acentos, pois a comparação é feita depois de remove_accents
+STOPWORDS = frozenset("""
+a ao aos aquela aquelas aquele aqueles aquilo as ate com como da das de dela delas dele deles
+depois do dos e ela elas ele eles em entre era eram essa essas esse esses esta estas este estes
+eu foi foram ha isso isto ja lhe lhes mais mas me mesmo meu minha muito na nao nas nem no nos
+nossa nosso num numa o os ou para pela pelas pelo pelos por qual quando que quem se sem ser seu
+seus sua suas sao so tambem te tem tu um uma umas uns voce vos sobre apos cada onde sera serao
+pode podem deve devem esta estao sido ter the of and to in is for on with by that this be are
+""".split())
+
+# Sufixos derivacionais, do mais longo para o mais curto
+SUFFIXES = ('amentos', 'imentos', 'amento', 'imento', 'mentos', 'mente', 'mento', 'acao', 'icao',
+            'idade', 'ismo', 'ista', 'avel', 'ivel', 'ador', 'edor', 'idor', 'ante', 'ente',
+            'oso', 'osa', 'ivo', 'iva')
+PLURALS = (('oes', 'ao'), ('aes', 'ao'), ('ais', 'al'), ('eis', 'el'), ('ois', 'ol'),
+           ('ns', 'm'), ('res', 'r'), ('zes', 'z'), ('ses', 's'), ('s', ''))
+
+TOKEN = re.compile(r'\w+')
+
+
+@lru_cache(maxsize=200000)
+def stem(word: str) -> str:
+    """Radicalizador leve para português: plural, sufixos comuns e vogal final"""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement in PLURALS:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:len(word) - len(suffix)] + replacement
+            break
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            word = word[:-len(suffix)]
+            break
+    if len(word) > 4 and word[-1] in 'aeo':
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Termos indexáveis do texto"""
+    words = TOKEN.findall(remove_accents(text).lower())
+    return [stem(word) for word in words if len(word) > 1 and word not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Listas de postings em arrays contíguos: `doc_ids` e `tfs` de todos os termos
+    concatenados, com `offsets[i]:offsets[i + 1]` delimitando o termo i
+    """
+
+    def __init__(self, chunks: List[Dict], vocabulary: Dict[str, int], offsets: np.ndarray,
+                 doc_ids: np.ndarray, tfs: np.ndarray, doc_lengths: np.ndarray,
+                 k1: float = 1.5, b: float = 0.75):
+        self.chunks = chunks
+        self.vocabulary = vocabulary
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.tfs = tfs
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+        self.average_length = float(doc_lengths.mean()) if len(doc_lengths) else 0.0
+
+    @classmethod
+    def build(cls, chunks: List[Dict], **params) -> 'BM25Index':
+        """Indexa os chunks (dicionários com 'content')"""
+        postings: Dict[str, List] = {}
+        doc_lengths = np.zeros(len(chunks), dtype=np.uint32)
+        for doc, chunk in enumerate(chunks):
+            terms = tokenize(chunk['content'])
+            doc_lengths[doc] = len(terms)
+            counts: Dict[str, int] = {}
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            for term, count in counts.items():
+                postings.setdefault(term, []).append((doc, count))
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum([len(postings[t]) for t in terms], out=offsets[1:])
+        doc_ids = np.empty(offsets[-1], dtype=np.int32)
+        tfs = np.empty(offsets[-1], dtype=np.uint16)
+        for i, term in enumerate(terms):
+            entries = np.asarray(postings[term])
+            doc_ids[offsets[i]:offsets[i + 1]] = entries[:, 0]
+            tfs[offsets[i]:offsets[i + 1]] = np.minimum(entries[:, 1], np.iinfo(np.uint16).max)
+
+        metadata = [chunk_metadata(chunk) for chunk in chunks]
+        return cls(metadata, {t: i for i, t in enumerate(terms)}, offsets, doc_ids, tfs,
+                   doc_lengths, **params)
+
+    def save(self, index_dir: Path):
+        index_dir.mkdir(parents=True, exist_ok=True)
+        # Vocabulário como um único bloco UTF-8 separado por '\n', na ordem dos offsets
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        vocabulary = np.frombuffer('\n'.join(terms).encode('utf-8'), dtype=np.uint8)
+        tmp = index_dir / (POSTINGS_FILE + '.tmp.npz')
+        np.savez_compressed(tmp, vocabulary=vocabulary, offsets=self.offsets, doc_ids=self.doc_ids,
+                            tfs=self.tfs, doc_lengths=self.doc_lengths)
+        tmp.replace(index_dir / POSTINGS_FILE)
+        with open(index_dir / META_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'k1': self.k1, 'b': self.b, 'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                       'chunks': self.chunks}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, index_dir: Path) -> 'BM25Index':
+        index_dir = Path(index_dir)
+        if not (index_dir / POSTINGS_FILE).exists() or not (index_dir / META_FILE).exists():
+            raise ValueError(f"Índice BM25 não encontrado em {index_dir}; rode 'tunel-docs index bm25 build'")
+        with open(index_dir / META_FILE, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with np.load(index_dir / POSTINGS_FILE) as data:
+            blob = data['vocabulary'].tobytes().decode('utf-8')
+            terms = blob.split('\n') if blob else []
+            return cls(meta['chunks'], {t: i for i, t in enumerate(terms)}, data['offsets'],
+                       data['doc_ids'], data['tfs'], data['doc_lengths'], k1=meta['k1'], b=meta['b'])
+
+    def postings(self, term: str):
+        """(doc_ids, tfs) do termo já normalizado; vazios se ausente"""
+        i = self.vocabulary.get(term)
+        if i is None:
+            return self.doc_ids[:0], self.tfs[:0]
+        return (self.doc_ids[self.offsets[i]:self.offsets[i + 1]],
+                self.tfs[self.offsets[i]:self.offsets[i + 1]])
+
+    def scores(self, query: str, require_all: bool = False) -> Dict[int, float]:
+        """Pontuação BM25 dos chunks que contêm algum (ou, com require_all, todos) termo"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.chunks:
+            return {}
+        lists = [self.postings(term) for term in terms]
+        candidates = None
+        if require_all:
+            # Interseção das postings, começando pela menor
+            for ids, _ in sorted(lists, key=lambda entry: len(entry[0])):
+                candidates = ids if candidates is None else np.intersect1d(candidates, ids, assume_unique=True)
+            if not len(candidates):
+                return {}
+
+        n = len(self.chunks)
+        doc_ids = np.concatenate([ids for ids, _ in lists])
+        weights = []
+        for ids, tfs in lists:
+            idf = np.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+            tf = tfs.astype(np.float32)
+            norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[ids] / self.average_length)
+            weights.append(idf * tf * (self.k1 + 1) / (tf + norm))
+        weights = np.concatenate(weights) if weights else np.zeros(0)
+
+        if candidates is not None:
+            keep = np.isin(doc_ids, candidates)
+            doc_ids, weights = doc_ids[keep], weights[keep]
+        if not len(doc_ids):
+            return {}
+        unique, inverse = np.unique(doc_ids, return_inverse=True)
+        totals = np.bincount(inverse, weights=weights)
+        return dict(zip(unique.tolist(), totals.tolist()))
+
+    def search(self, query: str, k: int = 5, require_all: bool = False) -> List[Dict]:
+        """Top-k chunks por BM25"""
+        scores = self.scores(query, require_all)
+        if not scores:
+            return []
+        docs = np.fromiter(scores.keys(), dtype=np.int64, count=len(scores))
+        values = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+        k = min(k, len(docs))
+        best = np.argpartition(-values, k - 1)[:k]
+        best = best[np.argsort(-values[best], kind='stable')]
+        return [dict(self.chunks[docs[i]], score=float(values[i])) for i in best]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Índice BM25 dos documentos")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help="Constrói o índice")
+    build.add_argument('--docs-dir', default='PDF_Markdown_Traduzido')
+    build.add_argument('--index-dir', default='bm25_index')
+
+    search = subparsers.add_parser('search', help="Consulta o índice")
+    search.add_argument('query')
+    search.add_argument('-k', '--top-k', type=int, default=5)
+    search.add_argument('--index-dir', default='bm25_index')
+    search.add_argument('--all-terms', action='store_true',
+                        help="Só chunks que contêm todos os termos da consulta")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        docs_dir = Path(args.docs_dir)
+        if not docs_dir.exists():
+            print(f"❌ Diretório {docs_dir} não encontrado!")
+            sys.exit(1)
+        start = time.perf_counter()
+        index = BM25Index.build(load_chunks(docs_dir))
+        index.save(Path(args.index_dir))
+        size = sum(p.stat().st_size for p in Path(args.index_dir).iterdir()) / 1e6
+        print(f"💾 Índice BM25 salvo em {args.index_dir}: {len(index.chunks)} chunks, "
+              f"{len(index.vocabulary)} termos, {size:.1f} MB ({time.perf_counter() - start:.1f}s)")
+        return
+
+    try:
+        index = BM25Index.load(Path(args.index_dir))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    start = time.perf_counter()
+    results = index.search(args.query, args.top_k, args.all_terms)
+    print(f"\n🔎 {args.query}")
+    for rank, result in enumerate(results, 1):
+        print(f"  {rank:>2}. {result['score']:.4f}  {result['id']}")
+    print(f"\n⏱️  {(time.perf_counter() - start) * 1000:.1f} ms sobre {len(index.chunks)} chunks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Constrói o índice de embeddings pré-computado usado pela busca semântica do servidor
+Divide o Markdown como o server.js, gera embeddings em lotes e grava uma matriz float32 (.npy)
+com as linhas já normalizadas, para a busca ler o arquivo mapeado sem copiá-lo
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from tunel_docs.chunk_store import CHUNK_STORE_FILE, content_hash, load_chunk_store
+from tunel_docs.embedding_backends import EMBEDDERS, create_embedder, embed_in_batches
+
+MATRIX_FILE = "embeddings.npy"
+META_FILE = "embeddings_meta.json"
+# Metadados de cada chunk copiados para os índices (os do chunk store são opcionais)
+CHUNK_FIELDS = ('id', 'file', 'title', 'hash', 'row', 'source_pdf', 'page', 'heading_path', 'language')
+
+
+def js_length(text: str) -> int:
+    """Comprimento em unidades UTF-16, como `String.length` no JavaScript"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def split_into_chunks(text: str, max_length: int = 1000) -> List[str]:
+    """Mesma divisão de `splitIntoChunks` do server.js (parágrafos até max_length)"""
+    chunks = []
+    current_chunk = ''
+
+    for paragraph in text.split('\n\n'):
+        if js_length(current_chunk + paragraph) > max_length and current_chunk:
+            chunks.append(current_chunk.strip())
+            current_chunk = paragraph
+        else:
+            current_chunk += ('\n\n' if current_chunk else '') + paragraph
+
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+
+    return chunks
+
+
+def load_chunks(docs_dir: Path) -> List[Dict]:
+    """
+    Chunks dos .md do diretório e subpastas (ids pelo caminho relativo)
+
+    Usa o chunk store gerado por chunk_store.py quando existir; senão
+    divide os arquivos como o `splitIntoChunks` do servidor.
+    """
+    store = Path(docs_dir) / CHUNK_STORE_FILE
+    if store.exists():
+        return load_chunk_store(store)
+
+    chunks = []
+    for path in sorted(Path(docs_dir).rglob('*.md')):
+        relative = path.relative_to(docs_dir).as_posix()
+        content = path.read_text(encoding='utf-8')
+        for index, chunk in enumerate(split_into_chunks(content, 1000)):
+            chunks.append({
+                'id': f"{relative}-{index}",
+                'file': relative,
+                'title': path.stem,
+                'hash': content_hash(chunk),
+                'content': chunk,
+            })
+    return chunks
+
+
+def normalize_rows(matrix: np.ndarray, block_rows: int = 65536,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Copia a matriz (possivelmente mapeada em memória) com linhas de norma 1, em blocos
+
+    Com `out=matrix` a normalização é feita no lugar, sem a cópia.
+    """
+    normalized = np.empty(matrix.shape, dtype=np.float32) if out is None else out
+    for start in range(0, matrix.shape[0], block_rows):
+        block = np.asarray(matrix[start:start + block_rows], dtype=np.float32)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        np.divide(block, norms, out=normalized[start:start + block_rows])
+    return normalized
+
+
+def chunk_metadata(chunk: Dict) -> Dict:
+    """Campos do chunk guardados nos índices (sem o conteúdo)"""
+    return {key: chunk[key] for key in CHUNK_FIELDS if key in chunk}
+
+
+def load_index(index_dir: Path):
+    """Carrega (metadados, matriz mapeada em memória) ou (None, None)"""
+    meta_path = index_dir / META_FILE
+    matrix_path = index_dir / MATRIX_FILE
+    if not meta_path.exists() or not matrix_path.exists():
+        return None, None
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    return meta, np.load(matrix_path, mmap_mode='r')
+
+
+def index_backend(meta: Dict) -> str:
+    """Backend que gerou o índice (índices antigos não registravam e eram da OpenAI)"""
+    return meta.get('backend', 'openai')
+
+
+def build_index(docs_dir: Path, index_dir: Path, batch_size: int = 256, backend: str = 'openai',
+                model: Optional[str] = None, workers: int = 4, rebuild: bool = False,
+                ann: Optional[str] = None) -> Dict:
+    """
+    Constrói (ou atualiza) o índice, gerando embeddings só dos chunks novos
+
+    Chunks cujo hash já existe no índice anterior reaproveitam o vetor salvo.
+    Vetores de backends ou modelos diferentes não são comparáveis, então um
+    índice existente de outra origem só é substituído com `rebuild=True`.
+    Com `ann` ('ivf' ou 'hnsw') também grava um índice aproximado ao lado da matriz.
+    """
+    embedder = create_embedder(backend, model)
+    chunks = load_chunks(docs_dir)
+    old_meta, old_matrix = load_index(index_dir)
+
+    if old_meta and (index_backend(old_meta), old_meta.get('model')) != (backend, embedder.model):
+        if not rebuild:
+            raise ValueError(
+                f"O índice em {index_dir} foi gerado por {index_backend(old_meta)}/{old_meta.get('model')}, "
+                f"não por {backend}/{embedder.model}; use --rebuild ou outro --index-dir"
+            )
+        old_meta, old_matrix = None, None
+
+    previous_rows = {}
+    if old_meta:
+        previous_rows = {chunk['hash']: chunk['row'] for chunk in old_meta['chunks']}
+
+    missing = sorted({c['hash'] for c in chunks if c['hash'] not in previous_rows})
+    reused = sum(1 for c in chunks if c['hash'] in previous_rows)
+    print(f"📚 {len(chunks)} chunks em {docs_dir}: {reused} reaproveitados, "
+          f"{len(missing)} textos únicos para gerar embedding")
+
+    new_vectors = {}
+    if missing:
+        text_by_hash = {c['hash']: c['content'] for c in chunks}
+        vectors = embed_in_batches(embedder, [text_by_hash[h] for h in missing], batch_size, workers)
+        if getattr(embedder, 'tokens', 0):
+            print(f"  🎟️  {embedder.tokens} tokens de embedding")
+        new_vectors = dict(zip(missing, vectors))
+
+    dim = (next(iter(new_vectors.values())).shape[0] if new_vectors
+           else old_matrix.shape[1] if old_matrix is not None else 0)
+    matrix = np.zeros((len(chunks), dim), dtype=np.float32)
+    for row, chunk in enumerate(chunks):
+        if chunk['hash'] in new_vectors:
+            matrix[row] = new_vectors[chunk['hash']]
+        else:
+            matrix[row] = old_matrix[previous_rows[chunk['hash']]]
+        chunk['row'] = row
+    # Vetores reaproveitados de índices antigos podem não estar normalizados
+    normalize_rows(matrix, out=matrix)
+
+    meta = {
+        'backend': backend,
+        'model': embedder.model,
+        'dim': dim,
+        'normalized': True,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'chunks': [chunk_metadata(chunk) for chunk in chunks],
+    }
+
+    # Grava em arquivos temporários para não corromper o índice em uso
+    index_dir.mkdir(parents=True, exist_ok=True)
+    tmp_matrix = index_dir / (MATRIX_FILE + '.tmp')
+    with open(tmp_matrix, 'wb') as f:
+        np.save(f, matrix)
+    tmp_meta = index_dir / (META_FILE + '.tmp')
+    with open(tmp_meta, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    del old_matrix
+    tmp_matrix.replace(index_dir / MATRIX_FILE)
+    tmp_meta.replace(index_dir / META_FILE)
+
+    print(f"💾 Índice salvo em {index_dir}: {matrix.shape[0]} x {dim} float32 "
+          f"({matrix.nbytes / 1e6:.1f} MB)")
+
+    if ann:
+        from tunel_docs.ann_index import build_ann
+        build_ann(ann, matrix, meta, index_dir)
+    return meta
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Constrói o índice de embeddings dos documentos")
+    parser.add_argument('--docs-dir', default='PDF_Markdown_Traduzido')
+    parser.add_argument('--index-dir', default='embedding_index')
+    parser.add_argument('--batch-size', type=int, default=256,
+                        help="Chunks por lote de embedding")
+    parser.add_argument('--backend', choices=sorted(EMBEDDERS), default='openai',
+                        help="Backend de embedding (hashing e sentence-transformers rodam sem rede)")
+    parser.add_argument('--model', default=None,
+                        help="Modelo do backend (padrão: o do backend escolhido)")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Lotes processados em paralelo")
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Descarta um índice existente gerado por outro backend/modelo")
+    parser.add_argument('--ann', choices=['ivf', 'hnsw'], default=None,
+                        help="Também constrói um índice aproximado para buscas em corpus grande")
+    args = parser.parse_args()
+
+    docs_dir = Path(args.docs_dir)
+    if not docs_dir.exists():
+        print(f"❌ Diretório {docs_dir} não encontrado!")
+        return
+    try:
+        build_index(docs_dir, Path(args.index_dir), args.batch_size, args.backend,
+                    args.model, args.workers, args.rebuild, args.ann)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
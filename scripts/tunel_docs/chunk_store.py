@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Divide o Markdown convertido em chunks respeitando títulos e páginas
+Grava um chunk store (JSON Lines) com página, caminho de títulos, PDF de origem e offsets em bytes
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from tunel_docs.document_model import find_model, load_document
+
+CHUNK_STORE_FILE = "chunks.jsonl"
+
+PAGE_HEADING = re.compile(r'^##\s+Página\s+(\d+)\s*$')
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*$')
+# Marcadores como "*[Página sem texto ou contém apenas imagens]*"
+PLACEHOLDER = re.compile(r'^\*\[.*\]\*$')
+# Links das imagens extraídas (image_assets): "![Página 3, figura 1](../assets/abc.png)"
+IMAGE_LINK = re.compile(r'^!\[[^\]]*\]\([^)]*\)$')
+
+
+def content_hash(text: str) -> str:
+    """SHA-1 do conteúdo do chunk (mesmo cálculo feito no servidor)"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _blocks(text: str) -> Iterator[Dict]:
+    """
+    Blocos do documento em ordem: títulos (uma linha) e parágrafos (linhas
+    não vazias consecutivas), com posições em caracteres e em bytes
+    """
+    char_pos = byte_pos = 0
+    paragraph = None
+    in_comment = False
+
+    def close(block):
+        block['text'] = text[block['start']:block['end']]
+        return block
+
+    for line in text.splitlines(keepends=True):
+        start, start_byte = char_pos, byte_pos
+        char_pos += len(line)
+        byte_pos += len(line.encode('utf-8'))
+        content = line.rstrip('\r\n')
+        end, end_byte = start + len(content), start_byte + len(content.encode('utf-8'))
+        stripped = content.strip()
+
+        if in_comment or stripped.startswith('<!--'):
+            in_comment = '-->' not in stripped
+            stripped = ''
+        heading = HEADING.match(stripped) if stripped else None
+
+        if not stripped or heading or PLACEHOLDER.match(stripped) or IMAGE_LINK.match(stripped):
+            if paragraph:
+                yield close(paragraph)
+                paragraph = None
+            if heading:
+                page = PAGE_HEADING.match(stripped)
+                yield close({'kind': 'page' if page else f"h{len(heading.group(1))}",
+                             'value': int(page.group(1)) if page else heading.group(2),
+                             'start': start, 'end': end, 'start_byte': start_byte, 'end_byte': end_byte})
+            continue
+
+        if paragraph is None:
+            paragraph = {'kind': 'text', 'start': start, 'start_byte': start_byte}
+        paragraph['end'], paragraph['end_byte'] = end, end_byte
+
+    if paragraph:
+        yield close(paragraph)
+
+
+def _split_block(block: Dict, max_chars: int) -> List[Dict]:
+    """Quebra um parágrafo maior que `max_chars` em linhas (ou em cortes no último espaço)"""
+    text = block['text']
+    pieces = []
+    start = 0
+    while start < len(text):
+        end = start + max_chars
+        if end < len(text):
+            cut = text.rfind('\n', start, end)
+            if cut <= start:
+                cut = text.rfind(' ', start, end)
+            end = cut if cut > start else end
+        else:
+            end = len(text)
+        piece_start = start
+        while piece_start < end and text[piece_start].isspace():
+            piece_start += 1
+        if piece_start < end:
+            pieces.append({
+                'kind': 'text',
+                'text': text[piece_start:end],
+                'start': block['start'] + piece_start,
+                'end': block['start'] + end,
+                'start_byte': block['start_byte'] + len(text[:piece_start].encode('utf-8')),
+                'end_byte': block['start_byte'] + len(text[:end].encode('utf-8')),
+            })
+        start = end
+    return pieces
+
+
+def chunk_markdown(text: str, file: str, max_chars: int = 1000, overlap: int = 150) -> List[Dict]:
+    """
+    Divide um documento em chunks de até ~`max_chars` caracteres
+
+    Um chunk nunca atravessa páginas e, a partir de um terço do tamanho,
+    termina antes de um título. Quando um trecho corrido precisa ser
+    quebrado, o chunk seguinte repete os últimos parágrafos (até `overlap`).
+    """
+    title = Path(file).stem
+    source_pdf = None
+    page = None
+    sections: List[tuple] = []
+    chunks: List[Dict] = []
+    current: List[Dict] = []
+    state = {'path': [], 'page': None}
+
+    def size(blocks):
+        return sum(len(block['text']) for block in blocks)
+
+    def flush(keep_overlap: bool = False):
+        nonlocal current
+        # Títulos no fim do chunk pertencem ao texto que vem depois
+        carried: List[Dict] = []
+        while keep_overlap and current and current[-1]['kind'] != 'text':
+            carried.insert(0, current.pop())
+        if not any(block['kind'] == 'text' for block in current):
+            current = carried
+            return
+        first, last = current[0], current[-1]
+        content = text[first['start']:last['end']]
+        chunks.append({
+            'id': f"{file}-{len(chunks)}",
+            'file': file,
+            'title': title,
+            'source_pdf': source_pdf,
+            'page': state['page'],
+            'heading_path': state['path'],
+            'start_byte': first['start_byte'],
+            'end_byte': last['end_byte'],
+            'hash': content_hash(content),
+            'content': content,
+        })
+        tail: List[Dict] = []
+        if keep_overlap:
+            for block in reversed(current):
+                if block['kind'] != 'text' or size(tail) + len(block['text']) > overlap:
+                    break
+                tail.insert(0, block)
+        current = tail + carried
+        state['path'] = [name for _, name in sections]
+
+    def append(block):
+        if not current:
+            state['path'] = [name for _, name in sections]
+            state['page'] = page
+        current.append(block)
+
+    for block in _blocks(text):
+        kind = block['kind']
+        if kind == 'h1':
+            flush()
+            source_pdf = f"{block['value']}.pdf"
+            sections = []
+        elif kind == 'page':
+            flush()
+            page = block['value']
+            sections = []
+        elif kind != 'text':
+            level = int(kind[1])
+            if size(current) >= max_chars // 3:
+                flush()
+            # Um título substitui os de mesmo nível ou abaixo
+            sections = [(lvl, name) for lvl, name in sections if lvl < level] + [(level, block['value'])]
+            append(block)
+        else:
+            for piece in (_split_block(block, max_chars) if len(block['text']) > max_chars else [block]):
+                if current and size(current) + len(piece['text']) > max_chars:
+                    flush(keep_overlap=True)
+                    # A sobreposição não pode empurrar o chunk além do limite
+                    while current and size(current) + len(piece['text']) > max_chars:
+                        current.pop(0)
+                append(piece)
+    flush()
+    return chunks
+
+
+def annotate_languages(chunks: List[Dict], document: Dict):
+    """Idioma original da página e se ela foi traduzida, a partir do modelo do documento"""
+    pages = {page['number']: page for page in document['pages']}
+    for chunk in chunks:
+        page = pages.get(chunk['page'])
+        if page:
+            chunk['language'] = page['language']
+            chunk['translated'] = page.get('translation') is not None
+
+
+def build_chunk_store(docs_dir: Path, output: Optional[Path] = None, max_chars: int = 1000,
+                      overlap: int = 150) -> Path:
+    """
+    Gera o chunk store dos .md do diretório e subpastas (o `file` de cada
+    chunk é o caminho relativo, o mesmo `document` do corpus_export)
+
+    Documentos com modelo extraído (ver document_model) ganham o idioma de cada página.
+    """
+    docs_dir = Path(docs_dir)
+    output = Path(output) if output else docs_dir / CHUNK_STORE_FILE
+    total = files = 0
+    tmp = output.with_name(output.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for path in sorted(docs_dir.rglob('*.md')):
+            relative = path.relative_to(docs_dir)
+            content = path.read_text(encoding='utf-8')
+            chunks = chunk_markdown(content, relative.as_posix(), max_chars, overlap)
+            model = find_model(docs_dir, relative)
+            if model:
+                annotate_languages(chunks, load_document(model))
+            for chunk in chunks:
+                f.write(json.dumps(chunk, ensure_ascii=False) + '\n')
+                total += 1
+            files += 1
+    tmp.replace(output)
+    print(f"🧩 {total} chunks de {files} arquivos em {output}")
+    return output
+
+
+def load_chunk_store(path: Path) -> List[Dict]:
+    """Lê os chunks gravados por `build_chunk_store`"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera o chunk store dos documentos Markdown")
+    parser.add_argument('--docs-dir', default='PDF_Markdown_Traduzido')
+    parser.add_argument('--output', default=None,
+                        help=f"Arquivo JSONL (padrão: {CHUNK_STORE_FILE} dentro de --docs-dir)")
+    parser.add_argument('--max-chars', type=int, default=1000, help="Tamanho máximo de cada chunk")
+    parser.add_argument('--overlap', type=int, default=150,
+                        help="Caracteres repetidos entre chunks de um mesmo trecho")
+    args = parser.parse_args()
+
+    docs_dir = Path(args.docs_dir)
+    if not docs_dir.exists():
+        print(f"❌ Diretório {docs_dir} não encontrado!")
+        sys.exit(1)
+    build_chunk_store(docs_dir, args.output, args.max_chars, args.overlap)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+CLI única do pipeline de documentos: tunel-docs convert|translate|index|upload|bench
+Cada subcomando só importa o módulo de que precisa (fitz, openai etc. não pesam no início)
+"""
+
+import importlib
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# subcomando -> (módulo, função, argumentos fixos, descrição)
+COMMANDS: Dict[str, Tuple[str, str, List[str], str]] = {
+    'convert': ('convert_all_pdfs', 'main', ['--no-translate'], "Converte os PDFs para Markdown sem traduzir"),
+    'translate': ('convert_all_pdfs', 'main', [], "Converte os PDFs para Markdown traduzindo o inglês"),
+    'render': ('document_model', 'main', ['render'], "Regrava o Markdown a partir dos modelos, sem reabrir os PDFs"),
+    'images': ('image_assets', 'main', [], "Extrai as imagens dos PDFs para a pasta de assets"),
+    'quality': ('translation_quality', 'main', [], "Aponta traduções que ficaram em inglês ou foram cortadas"),
+    'export': ('corpus_export', 'main', ['export'], "Exporta o corpus (páginas e chunks) para Parquet/Arrow"),
+    'stats': ('corpus_export', 'main', ['stats'], "Estatísticas do corpus exportado"),
+    'upload': ('setup_openai_assistant', 'cli', [], "Envia os documentos ao Vector Store (use 'upload sync' para sincronizar)"),
+    'bench': ('benchmark_pipeline', 'main', [], "Benchmark do pipeline sobre um corpus sintético"),
+    'normalize': ('normalize_filenames', 'main', [], "Normaliza nomes de arquivos e pastas"),
+}
+
+INDEX_COMMANDS: Dict[str, Tuple[str, str]] = {
+    'chunks': ('chunk_store', "Gera chunks.jsonl por página e título"),
+    'embeddings': ('build_embedding_index', "Atualiza o índice de embeddings"),
+    'bm25': ('bm25_index', "Constrói ou consulta o índice BM25"),
+    'ann': ('ann_index', "Constrói o índice aproximado (IVF/HNSW) e mede recall"),
+    'search': ('search_index', "Consulta o índice de embeddings"),
+    'hybrid': ('hybrid_search', "Busca híbrida BM25 + vetores e avaliação"),
+}
+
+
+def print_usage():
+    print("Uso: tunel-docs <comando> [opções]\n")
+    print("Comandos:")
+    for name, (_, _, _, description) in COMMANDS.items():
+        print(f"  {name:<12} {description}")
+    print(f"  {'index':<12} Índices de busca: {'|'.join(INDEX_COMMANDS)}")
+    for name, (_, description) in INDEX_COMMANDS.items():
+        print(f"    {name:<10} {description}")
+    print("\nUse 'tunel-docs <comando> --help' para as opções de cada comando")
+
+
+def resolve(argv: List[str]) -> Optional[Tuple[str, str, List[str], str]]:
+    """(módulo, função, argv repassado, nome do programa) para a linha de comando"""
+    if not argv or argv[0] not in COMMANDS and argv[0] != 'index':
+        return None
+    command, rest = argv[0], argv[1:]
+    if command == 'index':
+        if not rest or rest[0] not in INDEX_COMMANDS:
+            return None
+        module, _ = INDEX_COMMANDS[rest[0]]
+        return module, 'main', rest[1:], f"tunel-docs index {rest[0]}"
+    module, function, fixed, _ = COMMANDS[command]
+    return module, function, fixed + rest, f"tunel-docs {command}"
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    target = resolve(argv)
+    if target is None:
+        print_usage()
+        sys.exit(0 if not argv or argv[0] in ('-h', '--help') else 2)
+
+    module_name, function, args, prog = target
+    # Os scripts leem sys.argv com argparse; o nome do programa aparece no --help
+    sys.argv = [prog] + args
+    module = importlib.import_module(f"{__package__}.{module_name}")
+    return getattr(module, function)()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Manifesto da conversão: de qual PDF veio cada arquivo Markdown
+Os nomes de saída são normalizados na escrita, sem uma passada de renomeação depois
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from tunel_docs.normalize_filenames import normalize_name
+
+MANIFEST_FILE = "conversion_manifest.json"
+
+
+def normalized_output(relative_pdf: Path) -> Path:
+    """Caminho .md normalizado (pastas e arquivo) para um PDF relativo à origem"""
+    parts = [normalize_name(part) or part for part in relative_pdf.parent.parts]
+    name = normalize_name(relative_pdf.with_suffix('.md').name)
+    if name.startswith('.'):
+        name = relative_pdf.with_suffix('.md').name
+    return Path(*parts, name)
+
+
+class ConversionManifest:
+    """
+    Mapeia PDF de origem -> Markdown de saída, com metadados por documento
+
+    Um documento já registrado mantém sua saída entre execuções; saídas
+    novas que colidiriam com outra ganham um sufixo numérico.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        # Pasta de origem (absoluta) da conversão; os campos 'source' são relativos a ela
+        self.source_root: Optional[str] = None
+        self.documents: Dict[str, Dict] = {}
+        self._outputs = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> 'ConversionManifest':
+        manifest = cls(path)
+        if manifest.path and manifest.path.exists():
+            with open(manifest.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            manifest.documents = data.get('documents', {})
+            manifest.source_root = data.get('source_root')
+            manifest._outputs = {entry['output'] for entry in manifest.documents.values() if 'output' in entry}
+        return manifest
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = {'version': 1, 'documents': self.documents}
+            if self.source_root:
+                data['source_root'] = self.source_root
+            tmp = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            tmp.replace(self.path)
+
+    def assign(self, source: Path, source_root: Path) -> Path:
+        """Saída (relativa à pasta de destino) reservada para o PDF"""
+        key = str(source)
+        with self._lock:
+            entry = self.documents.get(key)
+            if entry:
+                return Path(entry['output'])
+            output = normalized_output(Path(source).relative_to(source_root))
+            candidate, counter = output, 1
+            while str(candidate) in self._outputs:
+                candidate = output.with_name(f"{output.stem}_{counter}{output.suffix}")
+                counter += 1
+            self._outputs.add(str(candidate))
+            self.documents[key] = {'output': str(candidate), 'original_name': Path(source).name}
+            return candidate
+
+    def record(self, pdf_file: Path, **fields):
+        """Atualiza os metadados de um documento já atribuído"""
+        with self._lock:
+            entry = self.documents.setdefault(str(pdf_file), {'original_name': Path(pdf_file).name})
+            entry.update(fields, converted_at=time.strftime('%Y-%m-%d %H:%M:%S'))
+
+    def get(self, source: Path) -> Optional[Dict]:
+        return self.documents.get(str(source))
+
+    def source_path(self, source: str) -> Path:
+        """PDF de um documento, pela pasta de origem do manifesto (não pelo diretório atual)"""
+        entry = self.documents.get(str(source))
+        if self.source_root and entry and 'source' in entry:
+            return Path(self.source_root) / entry['source']
+        return Path(source)
+
+    def original_names(self) -> Dict[str, str]:
+        """Saída normalizada -> nome original do PDF"""
+        return {entry['output']: entry['original_name'] for entry in self.documents.values()
+                if 'output' in entry}
@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+"""
+Script robusto para converter todos os PDFs para Markdown com tradução
+Continua de onde parou se interrompido
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import time
+import json
+from tunel_docs.translation_memory import REUSE_THRESHOLD, TranslationMemory, paragraph_spans
+from tunel_docs.pipeline_profiler import StageProfiler
+from tunel_docs.cost_ledger import CostLedger, estimate_cost
+from tunel_docs.translation_backends import BACKENDS, create_backend
+from tunel_docs.conversion_manifest import MANIFEST_FILE, ConversionManifest
+from tunel_docs.pdf_text import MAX_TRANSLATED_PAGE_CHARS, detect_language, format_page
+from tunel_docs.image_assets import extract_assets
+from tunel_docs.translation_quality import MIN_LENGTH_RATIO, check_corpus, print_report
+from tunel_docs.document_model import (ASSETS_DIR, asset_prefix, extract_document, find_model, is_current,
+                                       iter_models, load_document, model_path, page_hash, page_markdown,
+                                       render_bilingual, render_markdown, save_document, set_translation,
+                                       splice_translations)
+import argparse
+import math
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+DEFAULT_SOURCE_DIR = "PDF"
+DEFAULT_TARGET_DIR = "PDF_Markdown_PT"
+LEDGER_FILE = "conversion_ledger.json"
+MEMORY_FILE = "translation_memory.json"
+
+
+def translate_chunk(translator, text: str) -> str:
+    """Traduz um bloco; falha (em vez de devolver o inglês) se o tradutor não responder"""
+    translated = translator.translate(text)
+    if not translated or not translated.strip():
+        raise ValueError(f"Tradução vazia ({translator.name})")
+    return translated
+
+def translate_chunks(translator, text: str, max_chunk_size: int = 4900) -> str:
+    """
+    Traduz texto dividindo em blocos de até max_chunk_size caracteres
+    
+    Um bloco que falha interrompe a tradução toda: o texto original nunca é
+    devolvido como se fosse a tradução.
+    """
+    # Texto pequeno
+    if len(text) <= max_chunk_size:
+        return translate_chunk(translator, text)
+    
+    # Texto grande - divide em chunks
+    chunks = []
+    lines = text.split('\n')
+    current_chunk = []
+    current_size = 0
+    
+    for line in lines:
+        line_size = len(line)
+        # Linhas vazias seguem no próximo bloco (um bloco sem texto não é traduzido)
+        if current_size + line_size > max_chunk_size and current_size:
+            # Traduz o chunk atual
+            chunks.append(translate_chunk(translator, '\n'.join(current_chunk)))
+            current_chunk = [line]
+            current_size = line_size
+            time.sleep(0.1)
+        else:
+            current_chunk.append(line)
+            current_size += line_size
+    
+    # Traduz o último chunk
+    if current_chunk:
+        chunks.append(translate_chunk(translator, '\n'.join(current_chunk)))
+    
+    return '\n'.join(chunks)
+
+def translate_text(text: str, max_chunk_size: Optional[int] = None,
+                   memory: Optional[TranslationMemory] = None,
+                   language: Optional[str] = None,
+                   backend: str = 'google',
+                   ledger: Optional[CostLedger] = None,
+                   document: Optional[str] = None,
+                   review: Optional[List[Dict]] = None) -> Tuple[str, bool]:
+    """
+    Traduz texto usando o backend escolhido com tratamento de erros
+    
+    Parágrafos que a memória reaproveitou por semelhança vão para `review`.
+    """
+    
+    if not text or len(text.strip()) < 10:
+        return text, False
+    
+    if language is None:
+        language = detect_language(text)
+    if language == 'pt':
+        return text, False
+    
+    try:
+        translator = create_backend(backend, ledger=ledger, document=document)
+        max_chunk_size = max_chunk_size or translator.max_chunk_size
+        
+        if memory is None:
+            return translate_chunks(translator, text, max_chunk_size), True
+        
+        # Só o texto ainda não visto no corpus vai para o tradutor
+        translated = memory.translate(
+            text, lambda pending: translate_chunks(translator, pending, max_chunk_size), review
+        )
+        return translated, True
+        
+    except Exception as e:
+        return text, False
+
+def pdf_to_markdown(pdf_path: str, output_path: str, translate: bool = True,
+                    memory: Optional[TranslationMemory] = None,
+                    profiler: Optional[StageProfiler] = None,
+                    backend: str = 'google',
+                    ledger: Optional[CostLedger] = None,
+                    model_file: Optional[str] = None,
+                    bilingual_path: Optional[str] = None,
+                    prefix: str = f"{ASSETS_DIR}/",
+                    manifest: Optional[ConversionManifest] = None) -> bool:
+    """
+    Converte PDF para Markdown com tradução opcional
+    
+    A extração gera o modelo do documento (páginas, blocos e linhas); com
+    `model_file`, o modelo é gravado junto com as traduções (e o backend que
+    traduziu cada página) e reaproveitado enquanto o PDF não mudar. Numa nova
+    revisão do PDF, só as páginas cujo texto mudou são traduzidas de novo; as
+    demais herdam a tradução do modelo anterior. Com `manifest`, registra o hash
+    de cada página e as páginas alteradas. Com `bilingual_path`, grava também o
+    Markdown com original e tradução lado a lado.
+    """
+    if profiler is None:
+        profiler = StageProfiler(enabled=False)
+    
+    try:
+        document = previous = None
+        changed = None
+        if model_file and os.path.exists(model_file):
+            with profiler.stage(pdf_path, 'load_model', os.path.getsize(model_file)):
+                document = load_document(model_file)
+            if not is_current(document, pdf_path):
+                document, previous = None, document
+        if document is None:
+            document = extract_document(pdf_path, profiler=profiler)
+            if previous is not None:
+                changed = splice_translations(document, previous)
+                print(f"    ♻️  Nova revisão: {len(changed)} de {len(document['pages'])} páginas alteradas")
+        
+        document['translate'] = translate
+        
+        # Traduz as páginas em inglês que ainda não têm tradução
+        pages_translated = 0
+        if translate:
+            for page in document['pages']:
+                if page['language'] != 'en' or page['translation'] is not None:
+                    continue
+                with profiler.stage(pdf_path, 'format'):
+                    page_text = page_markdown(page)
+                if profiler.enabled:
+                    profiler.add_bytes(pdf_path, 'format', len(page_text.encode('utf-8')))
+                # Limita páginas muito grandes
+                if len(page_text) >= MAX_TRANSLATED_PAGE_CHARS:
+                    continue
+                review = []
+                with profiler.stage(pdf_path, 'translate', len(page_text.encode('utf-8'))):
+                    translated_text, was_translated = translate_text(
+                        page_text, memory=memory, language='en',
+                        backend=backend, ledger=ledger, document=pdf_path, review=review
+                    )
+                if was_translated:
+                    set_translation(page, translated_text, backend, BACKENDS[backend].model, review)
+                    pages_translated += 1
+        
+        # Salva arquivo
+        with profiler.stage(pdf_path, 'render'):
+            output = render_markdown(document, translate=translate, prefix=prefix)
+            bilingual = render_bilingual(document) if bilingual_path else None
+        if profiler.enabled:
+            profiler.add_bytes(pdf_path, 'render', len(output.encode('utf-8')))
+        with profiler.stage(pdf_path, 'write', len(output.encode('utf-8'))):
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(output)
+            if model_file:
+                save_document(document, model_file)
+            if bilingual_path:
+                Path(bilingual_path).parent.mkdir(parents=True, exist_ok=True)
+                with open(bilingual_path, 'w', encoding='utf-8') as f:
+                    f.write(bilingual)
+        
+        if manifest is not None:
+            fields = {'pages': [page_hash(page) for page in document['pages']]}
+            if changed is not None:
+                fields['changed_pages'] = changed
+            if bilingual_path:
+                fields['bilingual'] = str(bilingual_path)
+            manifest.record(Path(pdf_path), **fields)
+        
+        if pages_translated > 0:
+            print(f"    ✅ {pages_translated} páginas traduzidas")
+        
+        return True
+        
+    except Exception as e:
+        print(f"  ❌ Erro: {str(e)[:50]}")
+        return False
+
+def get_progress_file(target_path: Optional[Path] = None):
+    """Retorna o caminho do arquivo de progresso (um por pasta de destino fora da padrão)"""
+    if target_path is None or Path(target_path) == Path(DEFAULT_TARGET_DIR):
+        return Path("conversion_progress.json")
+    return Path(target_path) / "conversion_progress.json"
+
+def load_progress(target_path: Optional[Path] = None):
+    """Carrega o progresso salvo"""
+    progress_file = get_progress_file(target_path)
+    if progress_file.exists():
+        with open(progress_file, 'r') as f:
+            return set(json.load(f))
+    return set()
+
+def save_progress(completed_files, target_path: Optional[Path] = None):
+    """Salva o progresso"""
+    with open(get_progress_file(target_path), 'w') as f:
+        json.dump(list(completed_files), f)
+
+def get_ledger_file(target_path: Path) -> Path:
+    """Retorna o caminho do livro-razão de custo, junto ao manifesto"""
+    return Path(target_path) / LEDGER_FILE
+
+def get_manifest_file(target_path: Path) -> Path:
+    """Retorna o caminho do manifesto (origem -> saída normalizada), junto à saída"""
+    return target_path / MANIFEST_FILE
+
+def get_memory_file():
+    """Retorna o caminho padrão da memória de tradução (mantida entre execuções)"""
+    return Path(MEMORY_FILE)
+
+def load_memory(memory_file: Optional[str],
+                reuse_threshold: Optional[float] = REUSE_THRESHOLD) -> Optional[TranslationMemory]:
+    """
+    Carrega a memória de tradução; sem arquivo, a conversão roda sem memória
+    
+    Com `reuse_threshold` None, só parágrafos idênticos são reaproveitados.
+    """
+    if not memory_file:
+        return None
+    return TranslationMemory.load(Path(memory_file), reuse_threshold=reuse_threshold)
+
+def plan_document(pdf_path: str) -> dict:
+    """Extrai o texto e detecta o idioma de um PDF sem traduzir nada"""
+    start = time.perf_counter()
+    result = {'path': pdf_path, 'pages': 0, 'chars': 0, 'en_pages': [], 'error': None}
+    try:
+        import fitz
+        doc = fitz.open(pdf_path)
+        for page in doc:
+            result['pages'] += 1
+            text = page.get_text()
+            if not text.strip():
+                continue
+            page_text = format_page(text)
+            result['chars'] += len(page_text)
+            if (len(page_text) < MAX_TRANSLATED_PAGE_CHARS and len(page_text.strip()) >= 10
+                    and detect_language(page_text) == 'en'):
+                result['en_pages'].append(page_text)
+        doc.close()
+    except Exception as e:
+        result['error'] = str(e)[:50]
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def count_chunks(text: str, max_chunk_size: int) -> int:
+    """Quantidade de requisições que translate_chunks faria para o texto"""
+    if not text:
+        return 0
+    if len(text) <= max_chunk_size:
+        return 1
+    chunks = 1
+    current_size = 0
+    for line in text.split('\n'):
+        if current_size + len(line) > max_chunk_size and current_size:
+            chunks += 1
+            current_size = len(line)
+        else:
+            current_size += len(line)
+    return chunks
+
+def estimate_tokens(chars: int) -> int:
+    """Estimativa grosseira de tokens (~4 caracteres por token)"""
+    return math.ceil(chars / 4)
+
+def typical_latency(backend: str, target_path: Path) -> float:
+    """Latência mediana por requisição observada na última execução do ledger"""
+    backend_class = BACKENDS[backend]
+    ledger_file = get_ledger_file(target_path)
+    if ledger_file.exists():
+        with open(ledger_file, 'r', encoding='utf-8') as f:
+            runs = json.load(f).get('runs', [])
+        for run in reversed(runs):
+            usage = run.get('backends', {}).get(f"{backend}:{backend_class.model}")
+            if usage and usage['requests']:
+                return usage['latency_p50']
+    return backend_class.typical_latency
+
+def plan_conversion(pdf_files, backend: str = 'google', workers: int = 1,
+                    target_path: Path = Path(DEFAULT_TARGET_DIR),
+                    memory_file: Optional[str] = MEMORY_FILE):
+    """
+    Estima páginas, caracteres, tokens, requisições, custo e tempo da conversão
+    
+    Apenas extrai o texto e detecta o idioma (em paralelo); nada é traduzido
+    nem gravado. Parágrafos já presentes na memória de tradução não são contados.
+    """
+    backend_class = BACKENDS[backend]
+    memory = load_memory(memory_file)
+    latency = typical_latency(backend, target_path)
+    
+    print(f"🧮 Planejando {len(pdf_files)} arquivos com {workers} worker(s) "
+          f"(backend {backend}, ~{latency:.1f}s por requisição)")
+    print("=" * 60)
+    
+    totals = {'pages': 0, 'chars': 0, 'en_pages': 0, 'new_chars': 0, 'chunks': 0,
+              'prompt_tokens': 0, 'completion_tokens': 0, 'seconds': 0.0, 'cost': 0.0}
+    rows = []
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(plan_document, [str(f) for f in pdf_files]):
+            if result['error']:
+                print(f"  ⚠️  {Path(result['path']).name[:50]}: {result['error']}")
+                continue
+            
+            new_chars = 0
+            chunks = 0
+            for page_text in result['en_pages']:
+                lines = page_text.split('\n')
+                paragraphs = ['\n'.join(lines[start:end]) for start, end in paragraph_spans(lines)]
+                pending_text = '\n'.join(paragraph for paragraph in paragraphs
+                                         if memory is None or memory.lookup(paragraph) is None)
+                new_chars += len(pending_text)
+                chunks += count_chunks(pending_text, backend_class.max_chunk_size)
+            
+            prompt_tokens = estimate_tokens(new_chars)
+            # Português costuma gerar ~20% mais tokens que o inglês de origem
+            completion_tokens = math.ceil(prompt_tokens * 1.2)
+            cost = estimate_cost(backend_class.model, prompt_tokens, completion_tokens, new_chars)
+            row = {
+                'name': Path(result['path']).name,
+                'pages': result['pages'],
+                'chars': result['chars'],
+                'en_pages': len(result['en_pages']),
+                'new_chars': new_chars,
+                'chunks': chunks,
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'seconds': result['seconds'] + chunks * latency,
+                'cost': cost,
+            }
+            rows.append(row)
+            for key in totals:
+                totals[key] += row[key]
+    
+    print(f"  {'Arquivo':<40} {'Págs':>5} {'Inglês':>6} {'Caract.':>9} {'Req.':>5} {'Tokens':>8} {'Tempo':>8}")
+    for row in sorted(rows, key=lambda r: r['seconds'], reverse=True):
+        print(f"  {row['name'][:40]:<40} {row['pages']:>5} {row['en_pages']:>6} {row['new_chars']:>9} "
+              f"{row['chunks']:>5} {row['prompt_tokens'] + row['completion_tokens']:>8} "
+              f"{row['seconds']:>7.0f}s")
+    
+    wall_time = totals['seconds'] / max(workers, 1)
+    print("\n" + "=" * 60)
+    print(f"📊 ESTIMATIVA TOTAL")
+    print(f"  📄 Páginas: {totals['pages']} ({totals['en_pages']} em inglês)")
+    print(f"  🔤 Caracteres: {totals['chars']} ({totals['new_chars']} a traduzir, fora da memória)")
+    print(f"  📦 Chunks/requisições: {totals['chunks']}")
+    print(f"  🎟️  Tokens: ~{totals['prompt_tokens']} de entrada, ~{totals['completion_tokens']} de saída")
+    print(f"  💰 Custo estimado: US$ {totals['cost']:.4f}")
+    print(f"  ⏱️  Tempo estimado com {workers} worker(s): {wall_time / 60:.1f} min")
+    return totals
+
+def convert_all_pdfs(profiler: Optional[StageProfiler] = None, backend: str = 'google',
+                     budget: Optional[float] = None, workers: int = 1, plan: bool = False,
+                     source_dir: str = DEFAULT_SOURCE_DIR, target_dir: str = DEFAULT_TARGET_DIR,
+                     translate: bool = True, bilingual_dir: Optional[str] = None,
+                     images: bool = False, memory_file: Optional[str] = MEMORY_FILE,
+                     reuse_threshold: Optional[float] = REUSE_THRESHOLD):
+    """
+    Converte todos os PDFs com continuação automática
+
+    A memória de tradução fica em `memory_file`; com None, nada é reaproveitado
+    entre páginas e documentos. Parágrafos com similaridade a partir de
+    `reuse_threshold` com um já traduzido herdam a tradução e ficam marcados
+    para revisão (None: só reaproveita parágrafos idênticos).
+    """
+    source_path = Path(source_dir)
+    target_path = Path(target_dir)
+    
+    # Carrega progresso anterior
+    completed = load_progress(target_path)
+    
+    # Lista todos os PDFs
+    pdf_files = list(source_path.rglob('*.pdf'))
+    total = len(pdf_files)
+    
+    # Filtra arquivos já processados
+    pending_files = [f for f in pdf_files if str(f) not in completed]
+    already_done = len(completed)
+    
+    if plan:
+        return plan_conversion(pending_files, backend=backend, workers=workers, target_path=target_path,
+                               memory_file=memory_file)
+    
+    target_path.mkdir(parents=True, exist_ok=True)
+    
+    # Memória de tradução compartilhada por todo o corpus
+    memory = load_memory(memory_file, reuse_threshold)
+    
+    # Custo e tokens desta execução
+    ledger = CostLedger(get_ledger_file(target_path), budget=budget)
+    
+    # Nomes de saída normalizados na escrita (sem renomear a árvore depois)
+    manifest = ConversionManifest.load(get_manifest_file(target_path))
+    manifest.source_root = str(source_path.resolve())
+    for pdf_file in pending_files:
+        manifest.assign(pdf_file, source_path)
+    manifest.save()
+    
+    print(f"🚀 Conversão de PDFs para Markdown{' com Tradução' if translate else ''}")
+    print(f"📊 Status: {already_done}/{total} já convertidos")
+    print(f"📝 Pendentes: {len(pending_files)} arquivos")
+    if memory is not None:
+        print(f"🧠 Memória de tradução: {len(memory)} segmentos conhecidos ({memory_file})")
+    else:
+        print("🧠 Memória de tradução desativada")
+    if translate:
+        print(f"🌐 Backend de tradução: {backend} ({workers} worker(s))")
+    if budget is not None:
+        print(f"💵 Orçamento: US$ {budget:.2f}")
+    print("=" * 60)
+    
+    successful = already_done
+    failed = 0
+    
+    def convert_one(idx, pdf_file):
+        relative_path = pdf_file.relative_to(source_path)
+        output = manifest.assign(pdf_file, source_path)
+        target_file = target_path / output
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        model_file = find_model(target_path, output) or model_path(target_path, output)
+        bilingual_path = Path(bilingual_dir) / output if bilingual_dir else None
+        
+        current_total = already_done + idx
+        print(f"\n[{current_total}/{total}] {relative_path.name[:50]}")
+        
+        ok = pdf_to_markdown(str(pdf_file), str(target_file), translate=translate,
+                             memory=memory, profiler=profiler,
+                             backend=backend, ledger=ledger, model_file=str(model_file),
+                             bilingual_path=bilingual_path, prefix=asset_prefix(output),
+                             manifest=manifest)
+        if ok:
+            manifest.record(pdf_file, source=str(relative_path),
+                            model=str(model_file.relative_to(target_path)))
+        return pdf_file, target_file, ok
+    
+    queue = iter(enumerate(pending_files, 1))
+    submitted = 0
+    handled = 0
+    executor = ThreadPoolExecutor(max_workers=workers)
+    in_flight = set()
+    
+    try:
+        while True:
+            # Mantém no máximo `workers` arquivos em andamento
+            while len(in_flight) < workers:
+                item = next(queue, None)
+                if item is None:
+                    break
+                # Não agenda novas traduções se o próximo documento, somado aos que
+                # ainda estão em andamento, estourar o orçamento
+                if ledger.budget_reached(in_flight=len(in_flight)):
+                    print(f"\n💵 Orçamento atingido (projeção US$ "
+                          f"{ledger.projected_cost(len(in_flight) + 1):.4f}) - "
+                          f"{len(pending_files) - submitted} arquivos ficam para a próxima execução")
+                    queue = iter(())
+                    break
+                in_flight.add(executor.submit(convert_one, *item))
+                submitted += 1
+            
+            if not in_flight:
+                break
+            
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                handled += 1
+                try:
+                    pdf_file, target_file, ok = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"  ❌ Erro inesperado: {str(e)[:50]}")
+                    continue
+                
+                if ok:
+                    successful += 1
+                    completed.add(str(pdf_file))
+                    save_progress(completed, target_path)
+                    if memory is not None:
+                        memory.save()
+                    ledger.save()
+                    manifest.save()
+                    print(f"  ✅ Salvo: {target_file.name}")
+                else:
+                    failed += 1
+                    print(f"  ⚠️  Falhou - continuando...")
+                
+                # Pequena pausa para não sobrecarregar
+                if handled % 10 == 0:
+                    time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interrompido pelo usuário")
+        print(f"Progresso salvo: {successful}/{total}")
+        print("Execute novamente para continuar de onde parou")
+        executor.shutdown(wait=False, cancel_futures=True)
+        save_progress(completed, target_path)
+        if memory is not None:
+            memory.save()
+        ledger.save()
+        manifest.save()
+        sys.exit(0)
+    executor.shutdown()
+    
+    # Resultado final
+    print("\n" + "=" * 60)
+    print(f"✨ CONVERSÃO CONCLUÍDA!")
+    print(f"  ✅ Sucesso: {successful}")
+    print(f"  ❌ Falhas: {failed}")
+    print(f"  📁 Arquivos em: {target_path}/")
+    if memory is not None:
+        stats = memory.stats
+        print(f"  ♻️  Reaproveitamento da memória: {memory.reuse_ratio:.1%} "
+              f"({stats['reused_segments']} segmentos reutilizados, "
+              f"{stats['translated_segments']} traduzidos em {stats['requests']} requisições, "
+              f"{stats['near_duplicates']} quase duplicados, "
+              f"{stats['fuzzy_reused']} reaproveitados para revisão)")
+    ledger.save()
+    ledger.print_summary()
+    
+    # Remove arquivo de progresso ao terminar (mantém se ainda há pendentes)
+    progress_file = get_progress_file(target_path)
+    if progress_file.exists() and successful + failed >= total:
+        progress_file.unlink()
+    
+    if images:
+        image_stats = extract_assets(target_path, workers=max(workers, 2))
+        print(f"  🖼️  Imagens: {image_stats['images']} em {image_stats['documents']} documentos "
+              f"({image_stats['written']} novas, {image_stats['skipped']} documentos já extraídos)")
+
+def retranslate_flagged(target_dir: str = DEFAULT_TARGET_DIR, backend: str = 'google',
+                        budget: Optional[float] = None, min_ratio: float = MIN_LENGTH_RATIO,
+                        memory_file: Optional[str] = MEMORY_FILE) -> int:
+    """
+    Traduz de novo as páginas apontadas pela verificação de qualidade
+
+    Trabalha só sobre os modelos (sem reabrir os PDFs). Os parágrafos com
+    linhas reprovadas saem da memória de tradução antes, para não voltar a
+    tradução ruim, e quase duplicados não são reaproveitados. O
+    Markdown, a versão bilíngue (se a conversão gravou uma) e o manifesto são
+    atualizados. Devolve quantas páginas continuam suspeitas.
+    """
+    target_path = Path(target_dir)
+    flags = check_corpus(target_path, min_ratio)
+    print_report(flags)
+    if not flags:
+        return 0
+    
+    memory = load_memory(memory_file, reuse_threshold=None)
+    ledger = CostLedger(get_ledger_file(target_path), budget=budget)
+    manifest = ConversionManifest.load(get_manifest_file(target_path))
+    by_document = {}
+    for entry in flags:
+        by_document.setdefault(entry['document'], []).append(entry)
+    models = {output.as_posix(): path for output, path in iter_models(target_path)}
+    
+    print(f"\n🔁 Traduzindo de novo {len(flags)} páginas de {len(by_document)} documentos ({backend})")
+    for name, entries in by_document.items():
+        if ledger.budget_reached():
+            print(f"💵 Orçamento atingido - {name} e seguintes ficam para a próxima execução")
+            break
+        model = models[name]
+        document = load_document(model)
+        pages = {page['number']: page for page in document['pages']}
+        retranslated = []
+        for entry in entries:
+            page = pages[entry['page']]
+            source = page_markdown(page)
+            lines = source.split('\n')
+            if memory is not None:
+                flagged = set(entry['segments'] or range(len(lines)))
+                for start, end in paragraph_spans(lines):
+                    if flagged.intersection(range(start, end)):
+                        memory.forget('\n'.join(lines[start:end]))
+            translated, ok = translate_text(source, memory=memory, language='en', backend=backend,
+                                            ledger=ledger, document=document['source'])
+            if ok:
+                set_translation(page, translated, backend, BACKENDS[backend].model)
+                retranslated.append(page['number'])
+        save_document(document, model)
+        output = Path(name)
+        (target_path / output).write_text(
+            render_markdown(document, prefix=asset_prefix(output)), encoding='utf-8')
+        
+        converted = manifest.get(Path(document['source']))
+        if converted is not None:
+            if converted.get('bilingual'):
+                bilingual_path = Path(converted['bilingual'])
+                bilingual_path.parent.mkdir(parents=True, exist_ok=True)
+                bilingual_path.write_text(render_bilingual(document), encoding='utf-8')
+            manifest.record(Path(document['source']), retranslated_pages=retranslated)
+        print(f"  ✅ {name}: {len(retranslated)} de {len(entries)} páginas")
+    if memory is not None:
+        memory.save()
+    ledger.save()
+    manifest.save()
+    
+    remaining = check_corpus(target_path, min_ratio, documents=list(by_document))
+    if remaining:
+        print(f"⚠️  {len(remaining)} páginas continuam suspeitas (veja 'tunel-docs quality')")
+    else:
+        print("✅ Todas as páginas apontadas foram traduzidas de novo")
+    return len(remaining)
+
+def parse_args():
+    """Lê as opções de linha de comando"""
+    parser = argparse.ArgumentParser(description="Converte todos os PDFs para Markdown com tradução")
+    parser.add_argument('--profile', action='store_true',
+                        help="Mede tempo de parede, CPU e bytes por etapa e documento")
+    parser.add_argument('--profile-dir', default='profile_reports',
+                        help="Diretório dos relatórios de profiling (JSON/CSV)")
+    parser.add_argument('--top', type=int, default=10,
+                        help="Quantidade de documentos mais lentos exibidos no resumo")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='google',
+                        help="Backend de tradução")
+    parser.add_argument('--budget', type=float, default=None,
+                        help="Custo máximo em USD; para de agendar traduções ao atingir a projeção")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Quantidade de arquivos processados em paralelo")
+    parser.add_argument('--plan', action='store_true',
+                        help="Apenas estima páginas, tokens, requisições e tempo, sem traduzir")
+    parser.add_argument('--source-dir', default=DEFAULT_SOURCE_DIR,
+                        help="Pasta com os PDFs de origem")
+    parser.add_argument('--output-dir', default=DEFAULT_TARGET_DIR,
+                        help="Pasta de saída dos arquivos Markdown")
+    parser.add_argument('--no-translate', action='store_true',
+                        help="Apenas converte para Markdown, sem traduzir")
+    parser.add_argument('--bilingual-dir', default=None,
+                        help="Grava também o Markdown bilíngue (original e tradução lado a lado) nesta pasta")
+    parser.add_argument('--images', action='store_true',
+                        help="Extrai as imagens dos PDFs para a pasta assets e as liga ao Markdown")
+    parser.add_argument('--retranslate-flagged', action='store_true',
+                        help="Só traduz de novo as páginas em inglês ou cortadas (ver tunel-docs quality)")
+    parser.add_argument('--memory-file', default=MEMORY_FILE,
+                        help="Arquivo da memória de tradução compartilhada entre execuções")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Não usa nem grava a memória de tradução")
+    parser.add_argument('--fuzzy-reuse', type=float, default=REUSE_THRESHOLD,
+                        help="Similaridade mínima (0 a 1) para reaproveitar a tradução de um parágrafo "
+                             "quase idêntico, marcado para revisão; 0 desativa")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    profiler = StageProfiler(enabled=args.profile)
+    memory_file = None if args.no_memory else args.memory_file
+    
+    if args.retranslate_flagged:
+        retranslate_flagged(args.output_dir, backend=args.backend, budget=args.budget,
+                            memory_file=memory_file)
+        return
+    
+    if not args.plan:
+        print("Iniciando conversão de todos os PDFs...")
+        print("Pressione Ctrl+C a qualquer momento para pausar")
+        print("")
+    try:
+        convert_all_pdfs(profiler=profiler, backend=args.backend, budget=args.budget,
+                         workers=args.workers, plan=args.plan, source_dir=args.source_dir,
+                         target_dir=args.output_dir, translate=not args.no_translate,
+                         bilingual_dir=args.bilingual_dir, images=args.images, memory_file=memory_file,
+                         reuse_threshold=args.fuzzy_reuse or None)
+    finally:
+        # Gera o relatório também quando a execução é interrompida
+        if args.profile:
+            profiler.print_summary(top=args.top)
+            report = profiler.write_reports(Path(args.profile_dir))
+            if report:
+                print(f"\n📈 Relatório de profiling: {report} (e .csv)")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Exporta o corpus convertido para um dataset colunar (Parquet ou Arrow) e calcula estatísticas
+Uma tabela de páginas e uma de chunks, lidas de uma vez (memory map) em vez de centenas de .md
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from tunel_docs.chunk_store import IMAGE_LINK, PAGE_HEADING, PLACEHOLDER, chunk_markdown, content_hash
+from tunel_docs.document_model import find_model, load_document
+from tunel_docs.pdf_text import detect_language
+
+CORPUS_DIR = "corpus"
+TABLES = ('pages', 'chunks')
+FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Exportação do corpus requer: pip install pyarrow")
+    return pyarrow
+
+
+def split_pages(text: str) -> Iterator[tuple]:
+    """(número da página, conteúdo) das seções '## Página N' de um Markdown convertido"""
+    number, lines = None, []
+    for line in text.splitlines():
+        match = PAGE_HEADING.match(line.strip())
+        if match:
+            if number is not None:
+                yield number, '\n'.join(lines).strip()
+            number, lines = int(match.group(1)), []
+        elif number is not None:
+            lines.append(line)
+    if number is not None:
+        yield number, '\n'.join(lines).strip()
+
+
+def corpus_rows(docs_dir: Path, max_chars: int = 1000, overlap: int = 150) -> Dict[str, Dict[str, List]]:
+    """
+    Colunas das tabelas de páginas e chunks de todos os .md (incluindo subpastas)
+
+    Com o modelo do documento, `language` é o idioma original da página e
+    `translated` indica se ela foi traduzida; sem ele, `language` é o idioma
+    detectado no texto e `translated` fica nulo.
+    """
+    docs_dir = Path(docs_dir)
+    pages = {key: [] for key in ('document', 'source_pdf', 'page', 'language', 'translated',
+                                 'translation_backend', 'chars', 'hash', 'content')}
+    chunks = {key: [] for key in ('chunk_id', 'document', 'page', 'heading_path', 'language',
+                                  'translated', 'start_byte', 'end_byte', 'hash', 'content')}
+
+    for path in sorted(docs_dir.rglob('*.md')):
+        document = path.relative_to(docs_dir).as_posix()
+        text = path.read_text(encoding='utf-8')
+        model = find_model(docs_dir, path.relative_to(docs_dir))
+        model_pages = {page['number']: page for page in load_document(model)['pages']} if model else {}
+        source_pdf = f"{text.splitlines()[0].lstrip('# ').strip()}.pdf" if text.strip() else None
+
+        info = {}
+        for number, content in split_pages(text):
+            # Só o texto da página: sem marcadores nem links de imagens
+            content = '\n'.join(line for line in content.splitlines()
+                                 if not IMAGE_LINK.match(line.strip())).strip()
+            if PLACEHOLDER.match(content):
+                content = ''
+            model_page = model_pages.get(number)
+            backend = None
+            if model_page:
+                language = model_page['language']
+                translated = model_page.get('translation') is not None
+                backend = model_page.get('translation_backend')
+            else:
+                language = detect_language(content) if content else None
+                translated = None
+            info[number] = (language, translated)
+            pages['document'].append(document)
+            pages['source_pdf'].append(source_pdf)
+            pages['page'].append(number)
+            pages['language'].append(language)
+            pages['translated'].append(translated)
+            pages['translation_backend'].append(backend)
+            pages['chars'].append(len(content))
+            pages['hash'].append(content_hash(content))
+            pages['content'].append(content)
+
+        for chunk in chunk_markdown(text, document, max_chars, overlap):
+            language, translated = info.get(chunk['page'], (None, None))
+            chunks['chunk_id'].append(chunk['id'])
+            chunks['document'].append(document)
+            chunks['page'].append(chunk['page'])
+            chunks['heading_path'].append(chunk['heading_path'])
+            chunks['language'].append(language)
+            chunks['translated'].append(translated)
+            chunks['start_byte'].append(chunk['start_byte'])
+            chunks['end_byte'].append(chunk['end_byte'])
+            chunks['hash'].append(chunk['hash'])
+            chunks['content'].append(chunk['content'])
+
+    return {'pages': pages, 'chunks': chunks}
+
+
+def _schemas(pa) -> Dict:
+    return {
+        'pages': pa.schema([
+            ('document', pa.string()), ('source_pdf', pa.string()), ('page', pa.int32()),
+            ('language', pa.string()), ('translated', pa.bool_()),
+            ('translation_backend', pa.string()), ('chars', pa.int32()),
+            ('hash', pa.string()), ('content', pa.large_string()),
+        ]),
+        'chunks': pa.schema([
+            ('chunk_id', pa.string()), ('document', pa.string()), ('page', pa.int32()),
+            ('heading_path', pa.list_(pa.string())), ('language', pa.string()),
+            ('translated', pa.bool_()), ('start_byte', pa.int64()), ('end_byte', pa.int64()),
+            ('hash', pa.string()), ('content', pa.large_string()),
+        ]),
+    }
+
+
+def export_corpus(docs_dir: Path, output_dir: Optional[Path] = None, fmt: str = 'parquet',
+                  max_chars: int = 1000, overlap: int = 150) -> Path:
+    """Grava pages e chunks em `output_dir` (padrão: <docs_dir>/corpus) no formato escolhido"""
+    pa = _pyarrow()
+    docs_dir = Path(docs_dir)
+    output_dir = Path(output_dir) if output_dir else docs_dir / CORPUS_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rows = corpus_rows(docs_dir, max_chars, overlap)
+    schemas = _schemas(pa)
+
+    for name in TABLES:
+        table = pa.Table.from_pydict(rows[name], schema=schemas[name])
+        path = output_dir / f"{name}{FORMATS[fmt]}"
+        tmp = path.with_name(path.name + '.tmp')
+        if fmt == 'parquet':
+            pa.parquet.write_table(table, tmp, compression='zstd')
+        else:
+            with pa.ipc.new_file(str(tmp), table.schema) as writer:
+                writer.write_table(table)
+        tmp.replace(path)
+        print(f"📦 {name}: {table.num_rows} linhas em {path}")
+    return output_dir
+
+
+def load_corpus(corpus_dir: Path, table: str = 'chunks', columns: Optional[List[str]] = None):
+    """Lê uma tabela do dataset (memory map; sem cópia no formato Arrow)"""
+    pa = _pyarrow()
+    corpus_dir = Path(corpus_dir)
+    for fmt, suffix in FORMATS.items():
+        path = corpus_dir / f"{table}{suffix}"
+        if not path.exists():
+            continue
+        if fmt == 'parquet':
+            return pa.parquet.read_table(path, columns=columns, memory_map=True)
+        data = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+        return data.select(columns) if columns else data
+    raise FileNotFoundError(f"Tabela '{table}' não encontrada em {corpus_dir}")
+
+
+def corpus_stats(corpus_dir: Path) -> Dict:
+    """Páginas por documento, cobertura de tradução e volume por idioma (consultas vetorizadas)"""
+    pa = _pyarrow()
+    pc = pa.compute
+    pages = load_corpus(corpus_dir, 'pages', ['document', 'language', 'translated', 'chars'])
+    chunks = load_corpus(corpus_dir, 'chunks', ['document'])
+
+    per_document = pages.group_by('document').aggregate([('chars', 'count'), ('chars', 'sum')])
+    counts = per_document['chars_count']
+    english = pc.equal(pages['language'], 'en')
+    translated = pc.and_(english, pc.fill_null(pages['translated'], False))
+    known = pc.sum(pc.and_(english, pc.is_valid(pages['translated']))).as_py() or 0
+    by_language = pages.group_by('language').aggregate([('chars', 'count'), ('chars', 'sum')])
+    largest = per_document.sort_by([('chars_count', 'descending')]).slice(0, 5)
+
+    return {
+        'documents': per_document.num_rows,
+        'pages': pages.num_rows,
+        'chunks': chunks.num_rows,
+        'empty_pages': pc.sum(pc.equal(pages['chars'], 0)).as_py() or 0,
+        'pages_per_document': {
+            'min': pc.min(counts).as_py(),
+            'mean': round(pc.mean(counts).as_py() or 0, 1),
+            'max': pc.max(counts).as_py(),
+        },
+        'english_pages': pc.sum(english).as_py() or 0,
+        # Só conta páginas em inglês com modelo (em que a tradução é conhecida)
+        'translation_coverage': round(pc.sum(translated).as_py() / known, 3) if known else None,
+        'by_language': {row['language'] or '-': {'pages': row['chars_count'], 'chars': row['chars_sum']}
+                        for row in by_language.to_pylist()},
+        'largest_documents': [(row['document'], row['chars_count']) for row in largest.to_pylist()],
+    }
+
+
+def print_stats(stats: Dict):
+    print(f"📚 {stats['documents']} documentos, {stats['pages']} páginas "
+          f"({stats['empty_pages']} sem texto), {stats['chunks']} chunks")
+    per_document = stats['pages_per_document']
+    print(f"📄 Páginas por documento: mín {per_document['min']}, média {per_document['mean']}, "
+          f"máx {per_document['max']}")
+    coverage = stats['translation_coverage']
+    print(f"🌐 Páginas em inglês: {stats['english_pages']}"
+          + (f" (tradução em {coverage:.1%})" if coverage is not None else ""))
+    for language, entry in sorted(stats['by_language'].items()):
+        print(f"  {language:<4} {entry['pages']:>6} páginas {entry['chars']:>10} caracteres")
+    print("🏔️  Maiores documentos:")
+    for document, count in stats['largest_documents']:
+        print(f"  {count:>5} páginas  {document}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta o corpus para Parquet/Arrow e mostra estatísticas")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export = subparsers.add_parser('export', help="Gera o dataset de páginas e chunks")
+    export.add_argument('--docs-dir', default='PDF_Markdown_Traduzido')
+    export.add_argument('--output-dir', default=None,
+                        help=f"Pasta do dataset (padrão: {CORPUS_DIR} dentro de --docs-dir)")
+    export.add_argument('--format', choices=sorted(FORMATS), default='parquet')
+    export.add_argument('--max-chars', type=int, default=1000, help="Tamanho máximo de cada chunk")
+    export.add_argument('--overlap', type=int, default=150)
+
+    stats = subparsers.add_parser('stats', help="Estatísticas do dataset exportado")
+    stats.add_argument('corpus_dir', nargs='?', default=str(Path('PDF_Markdown_Traduzido') / CORPUS_DIR))
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'export':
+            docs_dir = Path(args.docs_dir)
+            if not docs_dir.exists():
+                print(f"❌ Diretório {docs_dir} não encontrado!")
+                sys.exit(1)
+            corpus_dir = export_corpus(docs_dir, args.output_dir, args.format, args.max_chars, args.overlap)
+            print_stats(corpus_stats(corpus_dir))
+        else:
+            print_stats(corpus_stats(Path(args.corpus_dir)))
+    except (ValueError, FileNotFoundError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
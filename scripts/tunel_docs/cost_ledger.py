@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Contabilidade de custo e tokens das traduções
+Registra tokens, requisições, latência e custo estimado por documento, backend e execução
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Preços em USD por 1 milhão de tokens (entrada/saída) ou de caracteres
+PRICES = {
+    'gpt-3.5-turbo': {'prompt': 0.50, 'completion': 1.50},
+    'gpt-4o-mini': {'prompt': 0.15, 'completion': 0.60},
+    'text-embedding-3-small': {'prompt': 0.02, 'completion': 0.0},
+    # deep_translator usa o endpoint gratuito do Google Translate
+    'google-translate': {'characters': 0.0},
+}
+
+
+def estimate_cost(model: str, prompt_tokens: int = 0, completion_tokens: int = 0,
+                  characters: int = 0) -> float:
+    """Custo estimado em USD de uma requisição"""
+    price = PRICES.get(model, {})
+    return (prompt_tokens * price.get('prompt', 0.0)
+            + completion_tokens * price.get('completion', 0.0)
+            + characters * price.get('characters', 0.0)) / 1_000_000
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentil pelo método do posto mais próximo"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class _Usage:
+    """Acumulador de uso de um documento ou backend"""
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.characters = 0
+        self.cost = 0.0
+        self.latencies: List[float] = []
+
+    def add(self, prompt_tokens, completion_tokens, characters, latency, cost):
+        self.requests += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.characters += characters
+        self.cost += cost
+        self.latencies.append(latency)
+
+    def to_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'characters': self.characters,
+            'cost_usd': round(self.cost, 6),
+            'latency_p50': round(percentile(self.latencies, 50), 4),
+            'latency_p90': round(percentile(self.latencies, 90), 4),
+            'latency_p99': round(percentile(self.latencies, 99), 4),
+        }
+
+
+class CostLedger:
+    """
+    Livro-razão de custo de uma execução de conversão
+
+    O arquivo JSON guarda o histórico de execuções; a execução atual é
+    regravada a cada `save()`, de modo que uma interrupção não perde dados.
+    """
+
+    def __init__(self, path: Optional[Path] = None, budget: Optional[float] = None):
+        self.path = Path(path) if path else None
+        self.budget = budget
+        self.started_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.run_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self.run = _Usage()
+        self.documents: Dict[str, _Usage] = {}
+        self.backends: Dict[str, _Usage] = {}
+        self._lock = threading.Lock()
+
+    def record(self, document: Optional[str], backend: str, model: str,
+               prompt_tokens: int = 0, completion_tokens: int = 0,
+               characters: int = 0, latency: float = 0.0):
+        """Registra uma requisição de tradução"""
+        cost = estimate_cost(model, prompt_tokens, completion_tokens, characters)
+        with self._lock:
+            for usage in (self.run,
+                          self.documents.setdefault(document or '-', _Usage()),
+                          self.backends.setdefault(f"{backend}:{model}", _Usage())):
+                usage.add(prompt_tokens, completion_tokens, characters, latency, cost)
+
+    @property
+    def total_cost(self) -> float:
+        return self.run.cost
+
+    def projected_cost(self, documents: int = 1) -> float:
+        """Custo total projetado se mais `documents` documentos médios forem traduzidos"""
+        with self._lock:
+            charged = [u.cost for u in self.documents.values() if u.cost > 0]
+        average = sum(charged) / len(charged) if charged else 0.0
+        return self.total_cost + average * documents
+
+    def budget_reached(self, in_flight: int = 0) -> bool:
+        """
+        Indica se o próximo documento ultrapassaria o orçamento
+
+        Os `in_flight` documentos ainda em tradução (com vários workers) entram
+        na projeção como documentos médios inteiros.
+        """
+        return self.budget is not None and self.projected_cost(in_flight + 1) >= self.budget
+
+    def summary(self) -> Dict:
+        """Resumo da execução atual"""
+        with self._lock:
+            return {
+                'run_id': self.run_id,
+                'started_at': self.started_at,
+                'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'budget_usd': self.budget,
+                'run': self.run.to_dict(),
+                'backends': {name: usage.to_dict() for name, usage in self.backends.items()},
+                'documents': {name: usage.to_dict() for name, usage in self.documents.items()},
+            }
+
+    def save(self):
+        """Grava a execução atual no histórico do arquivo"""
+        if not self.path:
+            return
+        history = []
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                history = json.load(f).get('runs', [])
+        summary = self.summary()
+        history = [run for run in history if run.get('run_id') != self.run_id]
+        history.append(summary)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'runs': history}, f, indent=2, ensure_ascii=False)
+
+    def print_summary(self, top: int = 5):
+        """Imprime o custo da execução e os documentos mais caros"""
+        run = self.run.to_dict()
+        print(f"  💰 Custo estimado: US$ {run['cost_usd']:.4f} em {run['requests']} requisições "
+              f"({run['prompt_tokens']} tokens de entrada, {run['completion_tokens']} de saída, "
+              f"{run['characters']} caracteres)")
+        if run['requests']:
+            print(f"  ⏱️  Latência p50/p90/p99: {run['latency_p50']:.2f}s / "
+                  f"{run['latency_p90']:.2f}s / {run['latency_p99']:.2f}s")
+        for name, usage in self.backends.items():
+            print(f"     {name}: {usage.requests} requisições, US$ {usage.cost:.4f}")
+        expensive = sorted(self.documents.items(), key=lambda item: item[1].cost, reverse=True)
+        expensive = [(name, usage) for name, usage in expensive if usage.cost > 0][:top]
+        if expensive:
+            print(f"  📄 Documentos mais caros:")
+            for name, usage in expensive:
+                print(f"     US$ {usage.cost:.4f}  {Path(name).name[:50]}")
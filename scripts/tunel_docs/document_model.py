@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Modelo intermediário do documento: páginas -> blocos -> linhas, com bbox, fonte e idioma
+Gerado uma vez na extração; tradução, renderização do Markdown e indexação leem o modelo sem reabrir o PDF
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from tunel_docs.pdf_text import detect_language, format_page
+from tunel_docs.pipeline_profiler import StageProfiler
+
+MODEL_VERSION = 1
+# Modelos ficam numa pasta oculta ao lado do Markdown, com o mesmo caminho relativo
+MODEL_DIR = ".document_model"
+# Imagens extraídas (ver image_assets), compartilhadas por todo o corpus
+ASSETS_DIR = "assets"
+EMPTY_PAGE = "*[Página sem texto ou contém apenas imagens]*"
+
+
+def _msgpack():
+    """msgpack se estiver instalado (formato compacto); None usa JSON"""
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def _round_bbox(bbox) -> List[float]:
+    return [round(value, 1) for value in bbox]
+
+
+def _line(line: Dict) -> Dict:
+    """Linha do get_text('dict') com o texto dos spans e a fonte predominante"""
+    spans = [span for span in line['spans'] if span['text']]
+    main = max(spans, key=lambda span: len(span['text'])) if spans else None
+    return {
+        'text': ''.join(span['text'] for span in line['spans']),
+        'bbox': _round_bbox(line['bbox']),
+        'font': main['font'] if main else None,
+        'size': round(main['size'], 1) if main else None,
+        'flags': main['flags'] if main else 0,
+    }
+
+
+def _block_type(text: str) -> str:
+    """Mesmo critério de format_page para títulos e listas"""
+    formatted = format_page(text)
+    if formatted.startswith('### ') and '\n' not in formatted:
+        return 'heading'
+    if formatted.startswith('- '):
+        return 'list'
+    return 'text'
+
+
+def _page(number: int, page) -> Dict:
+    """Página do modelo (blocos de texto e imagens), ainda sem idioma"""
+    import fitz
+
+    data = page.get_text('dict', flags=fitz.TEXTFLAGS_TEXT)
+    blocks = []
+    for block in data['blocks']:
+        if block.get('type', 0) != 0:
+            continue
+        lines = [_line(line) for line in block['lines']]
+        blocks.append({
+            'type': _block_type('\n'.join(line['text'] for line in lines)),
+            'bbox': _round_bbox(block['bbox']),
+            'language': None,
+            'lines': lines,
+        })
+    for image in page.get_image_info(xrefs=True):
+        blocks.append({'type': 'image', 'bbox': _round_bbox(image['bbox']),
+                       'xref': image.get('xref', 0), 'lines': []})
+    return {
+        'number': number,
+        'width': round(page.rect.width, 1),
+        'height': round(page.rect.height, 1),
+        'blocks': blocks,
+        'language': None,
+        'translation': None,
+        'translation_backend': None,
+        'translated_at': None,
+    }
+
+
+def detect_languages(document: Dict) -> Dict:
+    """Detecta o idioma de cada bloco de texto e de cada página com texto"""
+    for page in document['pages']:
+        for block in page['blocks']:
+            if block['type'] != 'image':
+                block['language'] = detect_language('\n'.join(line['text'] for line in block['lines']))
+        if page_text(page).strip():
+            page['language'] = detect_language(page_markdown(page))
+    return document
+
+
+def extract_document(pdf_path: str, profiler: Optional[StageProfiler] = None,
+                     detect: bool = True) -> Dict:
+    """
+    Extrai o modelo do documento de um PDF
+
+    Com `profiler`, mede separadamente a abertura do PDF, a extração das
+    páginas e a detecção de idioma. Sem `detect`, os idiomas ficam em None
+    (ver detect_languages).
+    """
+    import fitz
+
+    if profiler is None:
+        profiler = StageProfiler(enabled=False)
+    stat = os.stat(pdf_path)
+    with profiler.stage(pdf_path, 'open', stat.st_size):
+        doc = fitz.open(pdf_path)
+    try:
+        with profiler.stage(pdf_path, 'extract'):
+            pages = [_page(number, page) for number, page in enumerate(doc, 1)]
+            metadata = {key: value for key, value in (doc.metadata or {}).items() if value}
+    finally:
+        doc.close()
+    if profiler.enabled:
+        profiler.add_bytes(pdf_path, 'extract', sum(len(page_text(page).encode('utf-8')) for page in pages))
+
+    document = {
+        'version': MODEL_VERSION,
+        'source': str(pdf_path),
+        'source_size': stat.st_size,
+        'source_mtime': stat.st_mtime,
+        'title': os.path.basename(pdf_path).replace('.pdf', ''),
+        'metadata': metadata,
+        'pages': pages,
+    }
+    if detect:
+        with profiler.stage(pdf_path, 'detect'):
+            detect_languages(document)
+    return document
+
+
+def page_text(page: Dict) -> str:
+    """Texto da página como o page.get_text() devolveria (uma linha por linha do PDF)"""
+    return ''.join(line['text'] + '\n'
+                   for block in page['blocks'] for line in block['lines'])
+
+
+def page_markdown(page: Dict) -> str:
+    """Markdown da página no idioma original"""
+    return format_page(page_text(page))
+
+
+def asset_prefix(output: Path) -> str:
+    """Caminho relativo de uma saída .md (relativa à pasta de destino) até a pasta de imagens"""
+    return '../' * len(Path(output).parent.parts) + f"{ASSETS_DIR}/"
+
+
+def image_links(page: Dict, prefix: str) -> List[str]:
+    """Links Markdown das imagens extraídas da página"""
+    assets = [block['asset'] for block in page['blocks'] if block['type'] == 'image' and block.get('asset')]
+    return [f"![Página {page['number']}, figura {idx}]({prefix}{asset})"
+            for idx, asset in enumerate(assets, 1)]
+
+
+def render_markdown(document: Dict, translate: Optional[bool] = None,
+                    prefix: str = f"{ASSETS_DIR}/") -> str:
+    """
+    Markdown do documento, usando a tradução das páginas que a tiverem
+
+    Sem `translate`, vale o modo em que o documento foi convertido. As imagens
+    extraídas entram como links no fim da página (`prefix` leva até a pasta delas).
+    """
+    if translate is None:
+        translate = document.get('translate', True)
+    content = [f"# {document['title']}\n", "<!--", "  Documento convertido de PDF para Markdown"]
+    if translate:
+        content.append("  Tradução automática aplicada quando detectado inglês")
+    content.append("-->\n")
+    for page in document['pages']:
+        content.append(f"\n## Página {page['number']}\n")
+        if not page_text(page).strip():
+            content.append(EMPTY_PAGE)
+        elif translate and page.get('translation') is not None:
+            content.append(page['translation'])
+        else:
+            content.append(page_markdown(page))
+        links = image_links(page, prefix)
+        if links:
+            content.append('\n' + '\n'.join(links))
+    return '\n'.join(content)
+
+
+def set_translation(page: Dict, translation: str, backend: str, model: str,
+                    review: Optional[List[Dict]] = None):
+    """
+    Grava a tradução da página com a procedência (backend, modelo e data)
+
+    `review` lista os parágrafos reaproveitados de traduções parecidas, a conferir.
+    """
+    page['translation'] = translation
+    page['translation_backend'] = f"{backend}:{model}"
+    page['translated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    if review:
+        page['review'] = review
+    else:
+        page.pop('review', None)
+
+
+def page_hash(page: Dict) -> str:
+    """SHA-1 do texto da página (não muda se só o layout ou as imagens mudarem)"""
+    return hashlib.sha1(page_text(page).encode('utf-8')).hexdigest()
+
+
+def splice_translations(document: Dict, previous: Dict) -> List[int]:
+    """
+    Reaproveita as traduções da versão anterior do documento nas páginas
+    cujo texto não mudou (casadas pelo hash, mesmo que tenham mudado de número)
+
+    Devolve os números das páginas novas ou alteradas.
+    """
+    translated = {}
+    for page in previous['pages']:
+        if page.get('translation') is not None:
+            translated.setdefault(page_hash(page), page)
+    known = {page_hash(page) for page in previous['pages']}
+
+    changed = []
+    for page in document['pages']:
+        digest = page_hash(page)
+        if digest not in known:
+            changed.append(page['number'])
+        source = translated.get(digest)
+        if source and page.get('translation') is None:
+            for key in ('translation', 'translation_backend', 'translated_at'):
+                page[key] = source.get(key)
+            if source.get('review'):
+                page['review'] = source['review']
+    return changed
+
+
+def provenance(document: Dict) -> List[Dict]:
+    """Por página: idioma original, se foi traduzida, por qual backend e quando"""
+    return [{
+        'page': page['number'],
+        'language': page['language'],
+        'translated': page.get('translation') is not None,
+        'backend': page.get('translation_backend'),
+        'translated_at': page.get('translated_at'),
+        'chars': len(page_markdown(page)),
+    } for page in document['pages']]
+
+
+def _cell(text: str) -> str:
+    """Texto numa célula de tabela Markdown (títulos viram negrito)"""
+    if text.startswith('### '):
+        text = f"**{text[4:]}**"
+    return text.replace('|', '\\|').replace('\n', '<br>') if text else ' '
+
+
+def render_bilingual(document: Dict) -> str:
+    """
+    Markdown bilíngue: páginas traduzidas lado a lado (original | tradução)
+
+    Quando original e tradução têm o mesmo número de linhas, cada linha vira
+    uma linha da tabela; caso contrário a página inteira ocupa uma linha só.
+    """
+    content = [f"# {document['title']}\n", "<!--", "  Documento convertido de PDF para Markdown",
+               "  Versão bilíngue: original e tradução lado a lado", "-->\n"]
+    for page in document['pages']:
+        content.append(f"\n## Página {page['number']}\n")
+        if not page_text(page).strip():
+            content.append(EMPTY_PAGE)
+            continue
+        original = page_markdown(page)
+        if page.get('translation') is None:
+            content.append(original)
+            continue
+        if page.get('translation_backend'):
+            content.append(f"*Tradução: {page['translation_backend']} ({page.get('translated_at')})*\n")
+        content.append(f"| Original ({page['language']}) | Tradução (pt) |")
+        content.append("| --- | --- |")
+        left, right = original.split('\n'), page['translation'].split('\n')
+        rows = zip(left, right) if len(left) == len(right) else [(original, page['translation'])]
+        content.extend(f"| {_cell(a)} | {_cell(b)} |" for a, b in rows)
+    return '\n'.join(content)
+
+
+def model_path(target_path: Path, output: Path) -> Path:
+    """Arquivo do modelo para uma saída Markdown (relativa à pasta de destino)"""
+    suffix = '.msgpack' if _msgpack() else '.json'
+    return Path(target_path) / MODEL_DIR / Path(output).with_suffix(suffix)
+
+
+def find_model(target_path: Path, output: Path) -> Optional[Path]:
+    """Modelo já gravado para a saída, em qualquer um dos formatos"""
+    base = Path(target_path) / MODEL_DIR / Path(output)
+    for suffix in ('.msgpack', '.json'):
+        path = base.with_suffix(suffix)
+        if path.exists():
+            return path
+    return None
+
+
+def save_document(document: Dict, path: Path):
+    """Grava o modelo (msgpack ou JSON, conforme a extensão) de forma atômica"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    if path.suffix == '.msgpack':
+        with open(tmp, 'wb') as f:
+            f.write(_msgpack().packb(document, use_bin_type=True))
+    else:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+    tmp.replace(path)
+
+
+def load_document(path: Path) -> Dict:
+    path = Path(path)
+    if path.suffix == '.msgpack':
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise ValueError(f"{path.name} requer: pip install msgpack")
+        with open(path, 'rb') as f:
+            return msgpack.unpackb(f.read(), raw=False)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def is_current(document: Dict, pdf_path: str) -> bool:
+    """O modelo ainda corresponde ao PDF (mesmo tamanho e data de modificação)?"""
+    try:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return False
+    return (document.get('version') == MODEL_VERSION and document.get('source_size') == stat.st_size
+            and document.get('source_mtime') == stat.st_mtime)
+
+
+def iter_models(target_path: Path):
+    """(saída .md relativa, caminho do modelo) de todos os modelos da pasta de destino"""
+    root = Path(target_path) / MODEL_DIR
+    for path in sorted(root.rglob('*')):
+        if path.suffix in ('.msgpack', '.json'):
+            yield path.relative_to(root).with_suffix('.md'), path
+
+
+def render_all(target_path: Path, translate: Optional[bool] = None,
+               bilingual_dir: Optional[Path] = None) -> int:
+    """
+    Regrava o Markdown de todos os modelos, sem abrir os PDFs
+
+    Com `bilingual_dir`, grava lá as versões bilíngues (mesmos caminhos relativos)
+    em vez de regravar o Markdown da pasta de destino.
+    """
+    target_path = Path(target_path)
+    count = 0
+    for output, path in iter_models(target_path):
+        document = load_document(path)
+        if bilingual_dir:
+            output_path = Path(bilingual_dir) / output
+            markdown = render_bilingual(document)
+        else:
+            output_path = target_path / output
+            markdown = render_markdown(document, translate=translate, prefix=asset_prefix(output))
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(markdown, encoding='utf-8')
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Modelo intermediário dos documentos")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    render = subparsers.add_parser('render', help="Regrava o Markdown a partir dos modelos")
+    render.add_argument('--output-dir', default="PDF_Markdown_PT", help="Pasta de saída da conversão")
+    render.add_argument('--no-translate', action='store_true', help="Usa o texto original das páginas")
+    render.add_argument('--bilingual-dir', default=None,
+                        help="Grava nesta pasta o Markdown bilíngue (original e tradução lado a lado)")
+
+    pages = subparsers.add_parser('pages', help="Procedência da tradução de cada página de um modelo")
+    pages.add_argument('model')
+
+    extract = subparsers.add_parser('extract', help="Extrai o modelo de um PDF")
+    extract.add_argument('pdf')
+    extract.add_argument('--output', default=None, help="Arquivo de saída (padrão: ao lado do PDF)")
+    args = parser.parse_args()
+
+    if args.command == 'render':
+        target_path = Path(args.output_dir)
+        if not (target_path / MODEL_DIR).exists():
+            print(f"❌ Nenhum modelo em {target_path / MODEL_DIR}")
+            sys.exit(1)
+        count = render_all(target_path, translate=False if args.no_translate else None,
+                           bilingual_dir=args.bilingual_dir)
+        print(f"📝 {count} documentos renderizados em {args.bilingual_dir or target_path}/")
+    elif args.command == 'pages':
+        print(f"  {'Pág.':>5} {'Idioma':<7} {'Caract.':>8}  Tradução")
+        for entry in provenance(load_document(Path(args.model))):
+            translation = (f"{entry['backend'] or '?'} em {entry['translated_at'] or '?'}"
+                           if entry['translated'] else '-')
+            print(f"  {entry['page']:>5} {entry['language'] or '-':<7} {entry['chars']:>8}  {translation}")
+    else:
+        document = extract_document(args.pdf)
+        suffix = '.msgpack' if _msgpack() else '.json'
+        output = Path(args.output) if args.output else Path(args.pdf).with_suffix(suffix)
+        save_document(document, output)
+        blocks = sum(len(page['blocks']) for page in document['pages'])
+        print(f"🧱 {len(document['pages'])} páginas, {blocks} blocos em {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Backends de embedding usados pelo índice semântico
+Cada backend expõe `embed(texts)` e devolve uma matriz float32 (uma linha por texto)
+"""
+
+import os
+import re
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from tunel_docs.normalize_filenames import remove_accents
+
+
+class OpenAIEmbedder:
+    """API de embeddings da OpenAI (requer rede e OPENAI_API_KEY)"""
+
+    name = 'openai'
+    default_model = 'text-embedding-3-small'
+
+    def __init__(self, model: Optional[str] = None):
+        from openai import OpenAI
+        self.model = model or self.default_model
+        self._client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self._lock = threading.Lock()
+        self.tokens = 0
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        response = self._client.embeddings.create(model=self.model, input=texts)
+        with self._lock:
+            self.tokens += response.usage.total_tokens
+        vectors = [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+        return np.asarray(vectors, dtype=np.float32)
+
+
+class HashingEmbedder:
+    """
+    Embedding local e determinístico, sem rede nem modelo para baixar
+
+    Palavras e bigramas (sem acento, em minúsculas) são projetados em `dim`
+    posições por hashing com sinal; o peso é o TF sublinear e cada vetor é
+    normalizado. Não depende do corpus, então vetores antigos continuam válidos.
+    """
+
+    name = 'hashing'
+    default_model = 'hashing-512'
+    # Trabalho de CPU em Python: lotes em paralelo só rendem em processos separados
+    cpu_bound = True
+    _WORD = re.compile(r'\w+')
+
+    def __init__(self, model: Optional[str] = None):
+        self.model = model or self.default_model
+        try:
+            self.dim = int(self.model.rsplit('-', 1)[1])
+        except (IndexError, ValueError):
+            raise ValueError(f"Modelo de hashing inválido: {self.model} (use hashing-<dimensão>)")
+
+    def _features(self, text: str) -> List[str]:
+        words = self._WORD.findall(remove_accents(text).lower())
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        features = [self._features(text) for text in texts]
+        sizes = np.fromiter((len(found) for found in features), dtype=np.int64, count=len(texts))
+        if not sizes.sum():
+            return matrix
+
+        # Cada feature distinta do lote é hasheada uma vez; a contagem por
+        # (texto, hash), o TF e a projeção são feitos de uma vez para o lote
+        vocabulary = {}
+        codes = np.fromiter((vocabulary.setdefault(feature, len(vocabulary))
+                             for found in features for feature in found),
+                            dtype=np.int64, count=int(sizes.sum()))
+        vocabulary_hashes = np.fromiter((zlib.crc32(feature.encode('utf-8')) for feature in vocabulary),
+                                        dtype=np.int64, count=len(vocabulary))
+        keys = np.repeat(np.arange(len(texts), dtype=np.int64), sizes) << 32 | vocabulary_hashes[codes]
+        keys, counts = np.unique(keys, return_counts=True)
+        rows, hashes = keys >> 32, keys & 0xFFFFFFFF
+
+        weights = (1 + np.log(counts)).astype(np.float32)
+        # O bit mais alto do hash decide o sinal, reduzindo o viés das colisões
+        weights[hashes >> 31 == 1] *= -1
+        np.add.at(matrix, (rows, hashes % self.dim), weights)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return matrix / norms
+
+
+class SentenceTransformerEmbedder:
+    """Modelo local do sentence-transformers (opcional, roda na CPU)"""
+
+    name = 'sentence-transformers'
+    default_model = 'paraphrase-multilingual-MiniLM-L12-v2'
+
+    def __init__(self, model: Optional[str] = None):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ValueError("Backend sentence-transformers requer: pip install sentence-transformers")
+        self.model = model or self.default_model
+        self._model = SentenceTransformer(self.model, device='cpu')
+        self._lock = threading.Lock()
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        # O modelo já paraleliza internamente; um lote por vez evita disputa de threads
+        with self._lock:
+            vectors = self._model.encode(texts, batch_size=len(texts), normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+EMBEDDERS = {
+    OpenAIEmbedder.name: OpenAIEmbedder,
+    HashingEmbedder.name: HashingEmbedder,
+    SentenceTransformerEmbedder.name: SentenceTransformerEmbedder,
+}
+
+
+def create_embedder(name: str, model: Optional[str] = None):
+    """Instancia o backend de embedding pelo nome"""
+    if name not in EMBEDDERS:
+        raise ValueError(f"Backend de embedding desconhecido: {name} (opções: {', '.join(EMBEDDERS)})")
+    return EMBEDDERS[name](model)
+
+
+def embed_in_batches(embedder, texts: List[str], batch_size: int = 256, workers: int = 4) -> np.ndarray:
+    """
+    Gera embeddings em lotes de `batch_size`, com até `workers` lotes em paralelo
+
+    Backends de rede usam threads; os que calculam em Python (`cpu_bound`)
+    usam processos, já que threads disputariam o GIL.
+    """
+    batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+    if not batches:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    results = []
+    done = 0
+    pool = ProcessPoolExecutor if getattr(embedder, 'cpu_bound', False) and len(batches) > 1 else ThreadPoolExecutor
+    with pool(max_workers=workers) as executor:
+        # map preserva a ordem dos lotes
+        for vectors in executor.map(embedder.embed, batches):
+            results.append(vectors)
+            done += len(vectors)
+            print(f"  🔢 {done}/{len(texts)} chunks")
+    return np.vstack(results)
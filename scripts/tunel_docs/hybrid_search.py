@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Busca híbrida: BM25 e embeddings em paralelo, combinados por reciprocal rank fusion (RRF)
+Inclui uma avaliação de recall@k e latência sobre perguntas rotuladas
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from tunel_docs.bm25_index import BM25Index
+from tunel_docs.normalize_filenames import normalize_name
+from tunel_docs.search_index import SearchIndex
+
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(rankings: Sequence[List[str]], k: int = RRF_K,
+                           weights: Optional[Sequence[float]] = None) -> List[tuple]:
+    """Combina rankings de IDs: cada um soma weight / (k + posição) ao ID; retorna (id, score) ordenado"""
+    weights = weights or [1.0] * len(rankings)
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item in enumerate(ranking, 1):
+            fused[item] = fused.get(item, 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda entry: (-entry[1], entry[0]))
+
+
+class HybridSearcher:
+    """Consulta os dois índices ao mesmo tempo e funde os resultados"""
+
+    def __init__(self, bm25_dir: Path, embedding_dir: Path, exact: bool = False):
+        self.bm25 = BM25Index.load(bm25_dir)
+        self.vectors = SearchIndex(embedding_dir, exact=exact)
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+    def close(self):
+        self._executor.shutdown()
+
+    def search_bm25(self, query: str, k: int = 5) -> List[Dict]:
+        return self.bm25.search(query, k)
+
+    def search_vector(self, query: str, k: int = 5) -> List[Dict]:
+        return self.vectors.search(query, k)
+
+    def search(self, query: str, k: int = 5, candidates: int = 50) -> List[Dict]:
+        """Top-k por RRF sobre os `candidates` melhores de cada índice"""
+        lexical = self._executor.submit(self.bm25.search, query, candidates)
+        semantic = self._executor.submit(self.vectors.search, query, candidates)
+        lexical, semantic = lexical.result(), semantic.result()
+
+        chunks = {result['id']: result for result in semantic + lexical}
+        ranks = [{result['id']: rank for rank, result in enumerate(results, 1)}
+                 for results in (lexical, semantic)]
+        fused = reciprocal_rank_fusion([[r['id'] for r in lexical], [r['id'] for r in semantic]])
+
+        results = []
+        for chunk_id, score in fused[:k]:
+            result = {key: value for key, value in chunks[chunk_id].items() if key != 'score'}
+            result.update(score=score, bm25_rank=ranks[0].get(chunk_id), vector_rank=ranks[1].get(chunk_id))
+            results.append(result)
+        return results
+
+
+def load_questions(path: Path) -> List[Dict]:
+    """Perguntas rotuladas em JSON Lines: {"question": ..., "relevant": [trechos de nomes de arquivo]}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _fold(name: str) -> str:
+    return normalize_name(name).replace('-', '_')
+
+
+def is_relevant(result: Dict, label: str) -> bool:
+    """O rótulo casa com o ID do chunk ou com parte do nome normalizado do arquivo"""
+    return result['id'] == label or _fold(label) in _fold(result['file'])
+
+
+def evaluate(searchers: Dict, questions: List[Dict], ks: Sequence[int] = (1, 5, 10)) -> Dict[str, Dict]:
+    """
+    Mede cada método de busca sobre as perguntas
+
+    recall@k é a fração dos rótulos de cada pergunta encontrados entre os k
+    primeiros resultados (média entre perguntas); MRR usa o primeiro acerto.
+    """
+    depth = max(ks)
+    report = {}
+    for name, search in searchers.items():
+        latencies, recalls, reciprocal_ranks = [], {k: [] for k in ks}, []
+        for item in questions:
+            start = time.perf_counter()
+            results = search(item['question'], depth)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            labels = item['relevant']
+            for k in ks:
+                found = sum(1 for label in labels if any(is_relevant(r, label) for r in results[:k]))
+                recalls[k].append(found / len(labels))
+            first = next((rank for rank, r in enumerate(results, 1)
+                          if any(is_relevant(r, label) for label in labels)), None)
+            reciprocal_ranks.append(1 / first if first else 0.0)
+
+        report[name] = {
+            **{f"recall@{k}": float(np.mean(values)) for k, values in recalls.items()},
+            'mrr': float(np.mean(reciprocal_ranks)),
+            'mean_ms': float(np.mean(latencies)),
+            'p95_ms': float(np.percentile(latencies, 95)),
+        }
+    return report
+
+
+def print_report(report: Dict[str, Dict]):
+    columns = [key for key in next(iter(report.values())) if key.startswith('recall@')] + ['mrr']
+    print(f"  {'Método':<8}" + ''.join(f"{c:>11}" for c in columns) + f"{'Média':>10}{'p95':>10}")
+    for name, metrics in report.items():
+        print(f"  {name:<8}" + ''.join(f"{metrics[c]:>11.3f}" for c in columns)
+              + f"{metrics['mean_ms']:>8.1f}ms{metrics['p95_ms']:>8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca híbrida BM25 + embeddings")
+    parser.add_argument('query', nargs='?', help="Consulta (omitida com --evaluate)")
+    parser.add_argument('-k', '--top-k', type=int, default=5)
+    parser.add_argument('--bm25-dir', default='bm25_index')
+    parser.add_argument('--index-dir', default='embedding_index')
+    parser.add_argument('--exact', action='store_true', help="Ignora o índice aproximado")
+    parser.add_argument('--evaluate', nargs='?', const=str(Path(__file__).parent / 'retrieval_questions.jsonl'),
+                        default=None, help="Avalia BM25, vetorial e híbrida nas perguntas rotuladas")
+    parser.add_argument('--output', default=None, help="Grava o relatório da avaliação em JSON")
+    args = parser.parse_args()
+
+    if not args.query and not args.evaluate:
+        parser.error("informe uma consulta ou --evaluate")
+
+    try:
+        searcher = HybridSearcher(Path(args.bm25_dir), Path(args.index_dir), exact=args.exact)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    try:
+        if args.evaluate:
+            questions = load_questions(Path(args.evaluate))
+            print(f"📋 Avaliação com {len(questions)} perguntas rotuladas ({args.evaluate})")
+            report = evaluate({'bm25': searcher.search_bm25, 'vetorial': searcher.search_vector,
+                               'híbrida': searcher.search}, questions)
+            print_report(report)
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False)
+            return
+
+        start = time.perf_counter()
+        results = searcher.search(args.query, args.top_k)
+        print(f"\n🔎 {args.query}")
+        for rank, result in enumerate(results, 1):
+            print(f"  {rank:>2}. {result['score']:.4f}  {result['id']}  "
+                  f"(BM25 #{result['bm25_rank'] or '-'}, vetorial #{result['vector_rank'] or '-'})")
+        print(f"\n⏱️  {(time.perf_counter() - start) * 1000:.1f} ms")
+    finally:
+        searcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Extrai as imagens embutidas nos PDFs para a pasta de assets e as liga ao Markdown
+Cada imagem é gravada uma única vez (nome pelo hash do conteúdo, em todo o corpus)
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tunel_docs.conversion_manifest import MANIFEST_FILE, ConversionManifest
+from tunel_docs.document_model import (ASSETS_DIR, MODEL_DIR, asset_prefix, is_current, iter_models,
+                                       load_document, render_markdown, save_document)
+
+# Formatos mantidos como estão; o resto (JPX, JBIG2, CMYK, com máscara...) vira PNG
+KEPT_FORMATS = {'png': 'png', 'jpeg': 'jpg'}
+
+
+def _image_bytes(pdf, xref: int) -> Optional[Tuple[bytes, str]]:
+    """(conteúdo, extensão) da imagem em um formato que o navegador abre"""
+    import fitz
+
+    image = pdf.extract_image(xref)
+    if not image or not image.get('image'):
+        return None
+    if image['ext'] in KEPT_FORMATS and not image.get('smask'):
+        return image['image'], KEPT_FORMATS[image['ext']]
+
+    pixmap = fitz.Pixmap(pdf, xref)
+    if pixmap.colorspace and pixmap.colorspace.n > 3:
+        pixmap = fitz.Pixmap(fitz.csRGB, pixmap)
+    if image.get('smask'):
+        pixmap = fitz.Pixmap(pixmap, fitz.Pixmap(pdf, image['smask']))
+    return pixmap.tobytes('png'), 'png'
+
+
+def _write_asset(assets_dir: Path, data: bytes, ext: str) -> Tuple[str, bool]:
+    """Grava o asset se ainda não existir; (nome, se foi gravado agora)"""
+    name = f"{hashlib.sha1(data).hexdigest()[:16]}.{ext}"
+    path = assets_dir / name
+    if path.exists():
+        return name, False
+    # Temporário por processo: dois workers podem encontrar a mesma imagem
+    tmp = path.with_name(f"{name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return name, True
+
+
+def extract_document_images(pdf_path: str, assets_dir: str, min_size: int = 32) -> Dict:
+    """
+    Extrai as imagens de um PDF (roda em um processo do pool)
+
+    Imagens repetidas no documento (mesmo xref) são extraídas uma vez; as
+    menores que `min_size` pixels (ícones, marcadores) são ignoradas.
+    """
+    import fitz
+
+    assets_dir = Path(assets_dir)
+    names = {}
+    pages = {}
+    written = 0
+    with fitz.open(pdf_path) as pdf:
+        for page in pdf:
+            blocks = []
+            for info in page.get_image_info(xrefs=True):
+                xref = info.get('xref', 0)
+                # xref 0: imagem inline no conteúdo da página, sem objeto próprio
+                if not xref or min(info['width'], info['height']) < min_size:
+                    continue
+                if xref not in names:
+                    extracted = _image_bytes(pdf, xref)
+                    names[xref] = None
+                    if extracted:
+                        names[xref], new = _write_asset(assets_dir, *extracted)
+                        written += new
+                if names[xref]:
+                    blocks.append({'type': 'image', 'bbox': [round(v, 1) for v in info['bbox']],
+                                   'xref': xref, 'asset': names[xref], 'lines': []})
+            pages[page.number + 1] = blocks
+    return {'pages': pages, 'images': len([n for n in names.values() if n]), 'written': written}
+
+
+def document_assets(document: Dict) -> List[str]:
+    return [block['asset'] for page in document['pages'] for block in page['blocks']
+            if block['type'] == 'image' and block.get('asset')]
+
+
+def apply_images(document: Dict, pages: Dict[int, List[Dict]]):
+    """Troca os blocos de imagem das páginas pelos extraídos (com o asset)"""
+    for page in document['pages']:
+        blocks = [block for block in page['blocks'] if block['type'] != 'image']
+        page['blocks'] = blocks + pages.get(page['number'], [])
+    document['images_extracted'] = True
+
+
+def _extract(job: Tuple[str, str, int]) -> Dict:
+    pdf_path, assets_dir, min_size = job
+    try:
+        return extract_document_images(pdf_path, assets_dir, min_size)
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def extract_assets(target_path: Path, workers: int = 4, min_size: int = 32, force: bool = False) -> Dict:
+    """
+    Extrai as imagens de todos os documentos convertidos, em paralelo
+
+    Documentos já extraídos (com todos os assets presentes) são pulados, a não
+    ser com `force`. O modelo é atualizado e o Markdown regravado com os links.
+    Os PDFs são localizados pela pasta de origem gravada no manifesto.
+    """
+    target_path = Path(target_path)
+    assets_dir = target_path / ASSETS_DIR
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    manifest = ConversionManifest.load(target_path / MANIFEST_FILE)
+    stats = {'documents': 0, 'skipped': 0, 'stale': 0, 'failed': 0, 'images': 0, 'written': 0}
+
+    pending = []
+    for output, path in iter_models(target_path):
+        document = load_document(path)
+        source = str(manifest.source_path(document['source']))
+        if not is_current(document, source):
+            # PDF mudou ou sumiu: a conversão precisa rodar de novo antes
+            stats['stale'] += 1
+            continue
+        if (not force and document.get('images_extracted')
+                and all((assets_dir / name).exists() for name in document_assets(document))):
+            stats['skipped'] += 1
+            continue
+        pending.append((output, path, source))
+
+    jobs = [(source, str(assets_dir), min_size) for _, _, source in pending]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_extract, jobs))
+    else:
+        results = [_extract(job) for job in jobs]
+
+    for (output, path, _), result in zip(pending, results):
+        if 'error' in result:
+            stats['failed'] += 1
+            print(f"  ⚠️  {output}: {result['error'][:80]}")
+            continue
+        document = load_document(path)
+        apply_images(document, result['pages'])
+        save_document(document, path)
+        markdown = render_markdown(document, prefix=asset_prefix(output))
+        (target_path / output).write_text(markdown, encoding='utf-8')
+        stats['documents'] += 1
+        stats['images'] += result['images']
+        stats['written'] += result['written']
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extrai as imagens dos PDFs convertidos para a pasta de assets")
+    parser.add_argument('--output-dir', default="PDF_Markdown_PT", help="Pasta de saída da conversão")
+    parser.add_argument('--workers', type=int, default=4, help="Processos em paralelo")
+    parser.add_argument('--min-size', type=int, default=32,
+                        help="Ignora imagens com largura ou altura menor que isso (pixels)")
+    parser.add_argument('--force', action='store_true', help="Extrai de novo mesmo os documentos já extraídos")
+    args = parser.parse_args()
+
+    target_path = Path(args.output_dir)
+    if not (target_path / MODEL_DIR).exists():
+        print(f"❌ Nenhum modelo em {target_path / MODEL_DIR} (rode a conversão antes)")
+        sys.exit(1)
+
+    stats = extract_assets(target_path, workers=args.workers, min_size=args.min_size, force=args.force)
+    print(f"🖼️  {stats['documents']} documentos processados, {stats['images']} imagens "
+          f"({stats['written']} novas em {target_path / ASSETS_DIR}/)")
+    if stats['skipped']:
+        print(f"⏭️  {stats['skipped']} documentos já extraídos")
+    if stats['stale']:
+        print(f"⚠️  {stats['stale']} modelos desatualizados (converta os PDFs de novo)")
+    if stats['failed']:
+        print(f"❌ {stats['failed']} documentos com erro")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import re
+import time
+import unicodedata
+from pathlib import Path
+
+def remove_accents(text):
+    """Remove acentos de um texto"""
+    nfkd = unicodedata.normalize('NFKD', text)
+    return ''.join([c for c in nfkd if not unicodedata.combining(c)])
+
+def normalize_name(name):
+    """Normaliza nome removendo acentos, espaços e caracteres especiais"""
+    # Remove extensão para processar
+    if '.' in name:
+        base, ext = os.path.splitext(name)
+    else:
+        base = name
+        ext = ''
+    
+    # Remove acentos
+    normalized = remove_accents(base)
+    
+    # Substitui espaços e caracteres especiais por underscore
+    normalized = re.sub(r'[^\w\-]', '_', normalized)
+    
+    # Remove underscores múltiplos
+    normalized = re.sub(r'_+', '_', normalized)
+    
+    # Remove underscore do início e fim
+    normalized = normalized.strip('_')
+    
+    # Converte para minúsculas
+    normalized = normalized.lower()
+    
+    # Adiciona extensão de volta
+    if ext:
+        normalized = normalized + ext.lower()
+    
+    return normalized
+
+def _unique_name(name, taken):
+    """Primeiro nome livre entre `name`, `base_1.ext`, `base_2.ext`..."""
+    if name not in taken:
+        return name
+    base_name, ext = os.path.splitext(name)
+    counter = 1
+    while f"{base_name}_{counter}{ext}" in taken:
+        counter += 1
+    return f"{base_name}_{counter}{ext}"
+
+def plan_renames(root_path):
+    """
+    Calcula todas as renomeações numa única passada, sem tocar no disco
+    
+    Colisões são resolvidas contra os nomes já existentes na pasta e contra
+    os nomes já planejados para ela. O plano vem do mais profundo para o mais
+    raso, de modo que os caminhos de origem continuam válidos durante a execução.
+    """
+    root_path = Path(root_path)
+    plan = []
+    # Nome final de cada pasta, para montar o caminho de destino no relatório
+    new_dirs = {root_path: Path('.')}
+    
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirpath = Path(dirpath)
+        depth = len(dirpath.relative_to(root_path).parts) + 1
+        taken = set(dirnames) | set(filenames)
+        
+        entries = [('dir', name) for name in sorted(dirnames)] + [('file', name) for name in sorted(filenames)]
+        for path_type, old_name in entries:
+            new_name = normalize_name(old_name)
+            if not new_name or new_name.startswith('.') and not old_name.startswith('.'):
+                new_name = old_name
+            if new_name != old_name:
+                new_name = _unique_name(new_name, taken)
+                taken.add(new_name)
+                plan.append({
+                    'type': path_type,
+                    'depth': depth,
+                    'source': str((dirpath / old_name).relative_to(root_path)),
+                    'target': str(new_dirs[dirpath] / new_name),
+                    'new_name': new_name,
+                })
+            if path_type == 'dir':
+                new_dirs[dirpath / old_name] = new_dirs[dirpath] / new_name
+    
+    plan.sort(key=lambda entry: entry['depth'], reverse=True)
+    return plan
+
+def print_plan(plan):
+    """Relatório do dry-run"""
+    for entry in plan:
+        icon = '📁' if entry['type'] == 'dir' else '📄'
+        print(f"{icon} {entry['source']} -> {entry['target']}")
+    print(f"\n{len(plan)} renomeações planejadas")
+
+def apply_plan(root_path, plan, log_path=None):
+    """
+    Executa o plano, registrando cada renomeação (JSON Lines) para permitir desfazer
+    
+    Returns:
+        Quantidade de itens renomeados
+    """
+    root_path = Path(root_path)
+    log = open(log_path, 'a', encoding='utf-8') if log_path else None
+    rename_count = 0
+    try:
+        for entry in plan:
+            old_path = root_path / entry['source']
+            new_path = old_path.parent / entry['new_name']
+            if new_path.exists():
+                print(f"Erro ao renomear {old_path}: {new_path.name} já existe")
+                continue
+            try:
+                os.rename(old_path, new_path)
+            except Exception as e:
+                print(f"Erro ao renomear {old_path}: {e}")
+                continue
+            if log:
+                log.write(json.dumps({'old': str(old_path.relative_to(root_path)),
+                                      'new': str(new_path.relative_to(root_path))},
+                                     ensure_ascii=False) + '\n')
+                log.flush()
+            print(f"Renomeado: {old_path.name} -> {new_path.name}")
+            rename_count += 1
+    finally:
+        if log:
+            log.close()
+    return rename_count
+
+def undo_renames(root_path, log_path):
+    """Desfaz as renomeações registradas no log, da última para a primeira"""
+    root_path = Path(root_path)
+    with open(log_path, 'r', encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    
+    restored = 0
+    for entry in reversed(entries):
+        new_path, old_path = root_path / entry['new'], root_path / entry['old']
+        if not new_path.exists() or old_path.exists():
+            print(f"Não foi possível restaurar {entry['old']}")
+            continue
+        os.rename(new_path, old_path)
+        restored += 1
+    return restored
+
+def rename_files_and_folders(root_path, log_path=None):
+    """Renomeia todos os arquivos e pastas recursivamente"""
+    return apply_plan(root_path, plan_renames(root_path), log_path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Normaliza nomes de arquivos e pastas")
+    parser.add_argument('target_dir', nargs='?', default="PDF_Markdown_Traduzido")
+    parser.add_argument('--dry-run', action='store_true', help="Só mostra o plano, sem renomear")
+    parser.add_argument('--report', default=None, help="Grava o plano em JSON")
+    parser.add_argument('--log', default=None,
+                        help="Log das renomeações (padrão: rename_log_<data>.jsonl)")
+    parser.add_argument('--undo', default=None, metavar='LOG', help="Desfaz as renomeações de um log")
+    args = parser.parse_args()
+    
+    target_dir = args.target_dir
+    if not os.path.exists(target_dir):
+        print(f"Diretório {target_dir} não encontrado!")
+        exit(1)
+    
+    if args.undo:
+        count = undo_renames(target_dir, args.undo)
+        print(f"Total de arquivos/pastas restaurados: {count}")
+        return
+    
+    plan = plan_renames(target_dir)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=2, ensure_ascii=False)
+    
+    if args.dry_run:
+        print_plan(plan)
+        return
+    
+    log_path = args.log or f"rename_log_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+    print(f"Normalizando nomes em {target_dir}...")
+    print("-" * 50)
+    
+    count = apply_plan(target_dir, plan, log_path)
+    
+    print("-" * 50)
+    print(f"Total de arquivos/pastas renomeados: {count}")
+    if count:
+        print(f"Para desfazer: tunel-docs normalize {target_dir} --undo {log_path}")
+
+if __name__ == "__main__":
+    main()
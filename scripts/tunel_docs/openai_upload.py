@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Upload concorrente e retomável dos arquivos Markdown para a OpenAI
+Pula arquivos cujo hash de conteúdo não mudou desde o último envio
+"""
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 do conteúdo do arquivo"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def upload_file(client, path: Path, retries: int = 3, backoff: float = 1.0) -> str:
+    """Envia um arquivo com novas tentativas e espera exponencial; retorna o ID"""
+    for attempt in range(retries + 1):
+        try:
+            with open(path, 'rb') as file:
+                response = client.files.create(file=file, purpose='assistants')
+            return response.id
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * (2 ** attempt))
+
+
+def upload_files(client, markdown_dir: Path, previous: Optional[List[Dict]] = None,
+                 workers: int = 8, retries: int = 3, backoff: float = 1.0,
+                 on_uploaded: Optional[Callable[[List[Dict]], None]] = None,
+                 files: Optional[List[Path]] = None) -> List[Dict]:
+    """
+    Envia os arquivos .md de `markdown_dir` em paralelo
+
+    Args:
+        client: Cliente OpenAI (ou compatível com `files.create`)
+        markdown_dir: Raiz da árvore de Markdown
+        previous: Entradas salvas anteriormente ({'id', 'filename', 'hash', ...})
+        workers: Tamanho do pool de uploads
+        retries: Novas tentativas por arquivo
+        backoff: Espera inicial entre tentativas (dobra a cada uma)
+        on_uploaded: Chamado com a lista parcial após cada upload (para salvar progresso)
+        files: Arquivos a considerar (padrão: todos os .md da árvore)
+
+    Returns:
+        Entradas de todos os arquivos enviados ou reaproveitados
+    """
+    markdown_dir = Path(markdown_dir)
+    if files is None:
+        files = sorted(markdown_dir.rglob('*.md'))
+    known = {entry['filename']: entry for entry in (previous or []) if entry.get('hash')}
+
+    results: List[Dict] = []
+    to_upload = []
+    for path in files:
+        relative_path = str(path.relative_to(markdown_dir))
+        digest = file_hash(path)
+        entry = known.get(relative_path)
+        if entry and entry['hash'] == digest:
+            results.append(entry)
+        else:
+            to_upload.append((path, relative_path, digest))
+
+    print(f"📁 {len(files)} arquivos markdown: {len(results)} inalterados, "
+          f"{len(to_upload)} para enviar ({workers} em paralelo)\n")
+
+    lock = threading.Lock()
+    failed = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(upload_file, client, path, retries, backoff): (path, relative_path, digest)
+                   for path, relative_path, digest in to_upload}
+        for done, future in enumerate(as_completed(futures), 1):
+            path, relative_path, digest = futures[future]
+            try:
+                file_id = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"  [{done}/{len(to_upload)}] ❌ Erro ao enviar {relative_path}: {e}")
+                continue
+            entry = {
+                'id': file_id,
+                'filename': relative_path,
+                'full_path': str(path),
+                'hash': digest,
+            }
+            with lock:
+                results.append(entry)
+                if on_uploaded:
+                    on_uploaded(list(results))
+            print(f"  [{done}/{len(to_upload)}] ✅ {relative_path} -> {file_id}")
+
+    if failed:
+        print(f"\n⚠️  {failed} arquivos falharam após {retries} novas tentativas")
+    return results
+
+
+def merge_entries(saved: List[Dict], updates: List[Dict]) -> List[Dict]:
+    """
+    Atualiza as entradas salvas com as desta execução, sem descartar as demais
+
+    Uma entrada com ID novo guarda em 'replaces' os IDs das versões
+    anteriores, para que os arquivos antigos possam ser apagados depois.
+    """
+    merged = {entry['filename']: entry for entry in saved}
+    for entry in updates:
+        old = merged.get(entry['filename'])
+        if old:
+            replaces = old.get('replaces', []) + ([old['id']] if old['id'] != entry['id'] else [])
+            if replaces:
+                entry = dict(entry, replaces=replaces)
+        merged[entry['filename']] = entry
+    return sorted(merged.values(), key=lambda entry: entry['filename'])
+
+
+def superseded_ids(saved: List[Dict], current: List[Dict]) -> List[str]:
+    """IDs das entradas salvas (e das versões que substituíram) fora da lista atual"""
+    keep = {entry['id'] for entry in current}
+    ids = []
+    for entry in saved:
+        ids.extend(file_id for file_id in [entry['id']] + entry.get('replaces', []) if file_id not in keep)
+    return ids
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Funções de texto compartilhadas pelos conversores de PDF
+Detecção de idioma e formatação Markdown básica de uma página
+"""
+
+import re
+from typing import Sequence
+
+# Páginas maiores que isso não são traduzidas
+MAX_TRANSLATED_PAGE_CHARS = 10000
+
+# Palavras chave em inglês
+EN_KEYWORDS = ['the ', ' of ', ' and ', ' to ', ' in ', ' is ', ' for ', ' with ']
+
+
+def detect_language(text: str) -> str:
+    """Detecta idioma do texto de forma rápida"""
+    if not text or len(text) < 30:
+        return 'pt'
+
+    # Analisa apenas os primeiros 300 caracteres
+    sample = text[:300].lower()
+    en_count = sum(1 for kw in EN_KEYWORDS if kw in sample)
+
+    # Se tem muitas palavras em inglês, é inglês
+    return 'en' if en_count >= 3 else 'pt'
+
+
+def english_mask(texts: Sequence[str]):
+    """Mesmo critério de detect_language para vários textos de uma vez (array booleano)"""
+    import numpy as np
+
+    samples = np.array([text[:300].lower() for text in texts], dtype=str)
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    en_count = np.zeros(len(texts), dtype=np.int64)
+    for kw in EN_KEYWORDS:
+        en_count += np.char.find(samples, kw) >= 0
+    return (lengths >= 30) & (en_count >= 3)
+
+
+def format_page(text: str) -> str:
+    """Aplica a formatação Markdown básica ao texto extraído de uma página"""
+    lines = text.split('\n')
+    processed = []
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Formatação básica
+        if line.isupper() and 3 < len(line) < 100:
+            processed.append(f"### {line}")
+        elif re.match(r'^\d+\.?\s+', line):
+            processed.append(line)
+        elif re.match(r'^[•·▪▫◦‣⁃]\s+', line):
+            item = re.sub(r'^[•·▪▫◦‣⁃]\s+', '', line)
+            processed.append(f"- {item}")
+        else:
+            processed.append(line)
+
+    return '\n'.join(processed)
+
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Script para converter arquivos PDF para Markdown
+Mantido por compatibilidade: usa o pipeline do convert_all_pdfs (prefira `tunel-docs convert`)
+"""
+
+import os
+import sys
+from typing import Optional
+
+from tunel_docs import convert_all_pdfs as pipeline
+
+SOURCE_DIR = "PDF"
+TARGET_DIR = "PDF_Markdown"
+
+
+def pdf_to_markdown(pdf_path: str, output_path: Optional[str] = None) -> bool:
+    """Converte um arquivo PDF para Markdown (sem `output_path`, grava ao lado do PDF)"""
+    if output_path is None:
+        output_path = pdf_path.replace('.pdf', '.md')
+    return pipeline.pdf_to_markdown(pdf_path, output_path, translate=False)
+
+
+def convert_all_pdfs(source_dir: str, target_dir: str):
+    """Converte todos os PDFs em um diretório e subdiretórios"""
+    pipeline.convert_all_pdfs(source_dir=source_dir, target_dir=target_dir, translate=False)
+
+
+def main():
+    print(f"ℹ️  Script legado: equivale a `tunel-docs convert --output-dir {TARGET_DIR}`")
+    if not os.path.exists(SOURCE_DIR):
+        print(f"Erro: O diretório '{SOURCE_DIR}' não foi encontrado!")
+        sys.exit(1)
+    convert_all_pdfs(SOURCE_DIR, TARGET_DIR)
+
+
+if __name__ == "__main__":
+    main()
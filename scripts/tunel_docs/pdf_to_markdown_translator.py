@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Script para converter arquivos PDF para Markdown com tradução automática via OpenAI
+Mantido por compatibilidade: usa o pipeline do convert_all_pdfs (prefira `tunel-docs translate --backend openai`)
+"""
+
+import os
+import sys
+from typing import Optional
+
+from tunel_docs import convert_all_pdfs as pipeline
+from tunel_docs.translation_backends import load_env
+
+SOURCE_DIR = "PDF"
+TARGET_DIR = "PDF_Markdown"
+
+
+def openai_available() -> bool:
+    """A OPENAI_API_KEY está no ambiente (ou no .env)? Avisa quando não está"""
+    load_env()
+    if os.getenv('OPENAI_API_KEY'):
+        return True
+    print("⚠️  ATENÇÃO: OPENAI_API_KEY não encontrada no ambiente.")
+    print("   Para usar tradução automática, crie um arquivo .env com:")
+    print("   OPENAI_API_KEY=sua_chave_aqui")
+    print("   Continuando sem tradução...")
+    print("")
+    return False
+
+
+def pdf_to_markdown(pdf_path: str, output_path: Optional[str] = None, translate: bool = True) -> bool:
+    """Converte um arquivo PDF para Markdown, traduzindo as páginas em inglês"""
+    if output_path is None:
+        output_path = pdf_path.replace('.pdf', '.md')
+    return pipeline.pdf_to_markdown(pdf_path, output_path, translate=translate, backend='openai')
+
+
+def convert_all_pdfs(source_dir: str, target_dir: str, translate: bool = True):
+    """Converte todos os PDFs em um diretório e subdiretórios"""
+    translate = translate and openai_available()
+    pipeline.convert_all_pdfs(backend='openai', source_dir=source_dir, target_dir=target_dir,
+                              translate=translate)
+
+
+def main():
+    print(f"ℹ️  Script legado: equivale a `tunel-docs translate --backend openai --output-dir {TARGET_DIR}`")
+    if not os.path.exists(SOURCE_DIR):
+        print(f"Erro: O diretório '{SOURCE_DIR}' não foi encontrado!")
+        sys.exit(1)
+    convert_all_pdfs(SOURCE_DIR, TARGET_DIR, translate=True)
+
+
+if __name__ == "__main__":
+    main()
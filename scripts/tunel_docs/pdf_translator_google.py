@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Script para converter PDFs para Markdown com tradução usando Google Translate
+Mantido por compatibilidade: usa o pipeline do convert_all_pdfs (prefira `tunel-docs translate --backend google`)
+"""
+
+import os
+import sys
+from typing import Optional
+
+from tunel_docs import convert_all_pdfs as pipeline
+
+SOURCE_DIR = "PDF"
+TARGET_DIR = "PDF_Markdown_PT"
+AUTO_TARGET_DIR = "PDF_Markdown_Traduzido"
+
+
+def pdf_to_markdown(pdf_path: str, output_path: Optional[str] = None, translate: bool = True) -> bool:
+    """Converte um arquivo PDF para Markdown, traduzindo as páginas em inglês"""
+    if output_path is None:
+        output_path = pdf_path.replace('.pdf', '.md')
+    return pipeline.pdf_to_markdown(pdf_path, output_path, translate=translate, backend='google')
+
+
+def convert_all_pdfs(source_dir: str, target_dir: str, translate: bool = True):
+    """Converte todos os PDFs (continua de onde parou, como o convert_all_pdfs)"""
+    pipeline.convert_all_pdfs(backend='google', source_dir=source_dir, target_dir=target_dir,
+                              translate=translate)
+
+
+def main():
+    print("ℹ️  Script legado: prefira `tunel-docs translate --backend google`")
+    if len(sys.argv) > 1 and sys.argv[1] != "--auto":
+        # Teste com arquivo específico
+        test_file = sys.argv[1]
+        if not os.path.exists(test_file):
+            print(f"❌ Arquivo não encontrado: {test_file}")
+            return
+        print(f"Testando: {test_file}")
+        output = test_file.replace('.pdf', '_translated.md')
+        if pdf_to_markdown(test_file, output, translate=True):
+            print(f"✅ Convertido: {output}")
+        return
+
+    if not os.path.exists(SOURCE_DIR):
+        print(f"❌ Diretório '{SOURCE_DIR}' não encontrado!")
+        sys.exit(1)
+    target = AUTO_TARGET_DIR if sys.argv[1:] == ["--auto"] else TARGET_DIR
+    convert_all_pdfs(SOURCE_DIR, target, translate=True)
+
+
+if __name__ == "__main__":
+    main()
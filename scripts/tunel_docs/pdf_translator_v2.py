@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Script para converter arquivos PDF para Markdown com tradução automática via OpenAI
+Mantido por compatibilidade: usa o pipeline do convert_all_pdfs (prefira `tunel-docs translate --backend openai`)
+"""
+
+import os
+import sys
+from typing import Optional
+
+from tunel_docs import convert_all_pdfs as pipeline
+from tunel_docs.cost_ledger import CostLedger
+
+SOURCE_DIR = "PDF"
+TARGET_DIR = "PDF_Markdown_Translated"
+
+
+def pdf_to_markdown(pdf_path: str, output_path: Optional[str] = None, translate: bool = True,
+                    ledger: Optional[CostLedger] = None) -> bool:
+    """Converte um arquivo PDF para Markdown, traduzindo as páginas em inglês"""
+    if output_path is None:
+        output_path = pdf_path.replace('.pdf', '.md')
+    return pipeline.pdf_to_markdown(pdf_path, output_path, translate=translate,
+                                    backend='openai', ledger=ledger)
+
+
+def convert_all_pdfs(source_dir: str, target_dir: str, translate: bool = True):
+    """Converte todos os PDFs em um diretório (custo registrado no ledger da pasta de destino)"""
+    pipeline.convert_all_pdfs(backend='openai', source_dir=source_dir, target_dir=target_dir,
+                              translate=translate)
+
+
+def main():
+    print(f"ℹ️  Script legado: equivale a `tunel-docs translate --backend openai --output-dir {TARGET_DIR}`")
+    if len(sys.argv) > 1:
+        # Modo teste com arquivo específico
+        test_file = sys.argv[1]
+        if not os.path.exists(test_file):
+            print(f"Arquivo não encontrado: {test_file}")
+            return
+        print(f"Testando conversão de: {test_file}")
+        output = test_file.replace('.pdf', '_translated.md')
+        if pdf_to_markdown(test_file, output, translate=True):
+            print(f"✓ Arquivo convertido: {output}")
+        else:
+            print("✗ Erro na conversão")
+        return
+
+    if not os.path.exists(SOURCE_DIR):
+        print(f"Erro: Diretório '{SOURCE_DIR}' não encontrado!")
+        sys.exit(1)
+    convert_all_pdfs(SOURCE_DIR, TARGET_DIR, translate=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Instrumentação por etapa do pipeline de conversão
+Mede tempo de parede, tempo de CPU e bytes processados por documento e etapa
+"""
+
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Ordem canônica das etapas no relatório (as do pdf_to_markdown do convert_all_pdfs)
+STAGES = ['load_model', 'open', 'extract', 'detect', 'format', 'translate', 'render', 'write']
+
+
+class StageProfiler:
+    """
+    Acumula medições por (documento, etapa)
+
+    Quando desabilitado, `stage()` não mede nada, de modo que o pipeline pode
+    usar sempre o mesmo código com custo desprezível.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.records: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, document: str, name: str, nbytes: int = 0):
+        """Mede o bloco como uma chamada da etapa `name` do documento"""
+        if not self.enabled:
+            yield
+            return
+        wall_start = time.perf_counter()
+        # thread_time mede só a thread atual, correto também com pools de threads
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(document, name,
+                        wall=time.perf_counter() - wall_start,
+                        cpu=time.thread_time() - cpu_start,
+                        nbytes=nbytes)
+
+    def record(self, document: str, name: str, wall: float = 0.0, cpu: float = 0.0, nbytes: int = 0):
+        """Registra uma medição já feita"""
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self.records.setdefault(document, {}).setdefault(
+                name, {'wall': 0.0, 'cpu': 0.0, 'bytes': 0, 'calls': 0})
+            entry['wall'] += wall
+            entry['cpu'] += cpu
+            entry['bytes'] += nbytes
+            entry['calls'] += 1
+
+    def add_bytes(self, document: str, name: str, nbytes: int):
+        """Soma bytes a uma etapa sem contar uma nova chamada"""
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self.records.setdefault(document, {}).setdefault(
+                name, {'wall': 0.0, 'cpu': 0.0, 'bytes': 0, 'calls': 0})
+            entry['bytes'] += nbytes
+
+    def document_totals(self) -> List[Dict]:
+        """Totais por documento, do mais lento para o mais rápido"""
+        totals = []
+        for document, stages in self.records.items():
+            totals.append({
+                'document': document,
+                'wall': sum(s['wall'] for s in stages.values()),
+                'cpu': sum(s['cpu'] for s in stages.values()),
+                'slowest_stage': max(stages, key=lambda n: stages[n]['wall']) if stages else None,
+            })
+        totals.sort(key=lambda t: t['wall'], reverse=True)
+        return totals
+
+    def stage_totals(self) -> Dict[str, Dict[str, float]]:
+        """Totais por etapa somando todos os documentos"""
+        totals: Dict[str, Dict[str, float]] = {}
+        for stages in self.records.values():
+            for name, entry in stages.items():
+                total = totals.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'bytes': 0, 'calls': 0})
+                for key in total:
+                    total[key] += entry[key]
+        return dict(sorted(totals.items(), key=lambda item: _stage_order(item[0])))
+
+    def rows(self) -> List[Dict]:
+        """Linhas planas (documento, etapa) para exportação"""
+        rows = []
+        for document, stages in self.records.items():
+            for name in sorted(stages, key=_stage_order):
+                entry = stages[name]
+                rows.append({
+                    'document': document,
+                    'stage': name,
+                    'wall_s': round(entry['wall'], 6),
+                    'cpu_s': round(entry['cpu'], 6),
+                    'bytes': entry['bytes'],
+                    'calls': entry['calls'],
+                })
+        return rows
+
+    def write_json(self, path: Path):
+        """Grava o relatório completo em JSON"""
+        report = {
+            'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'stages': self.stage_totals(),
+            'documents': self.records,
+            'slowest': self.document_totals(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    def write_csv(self, path: Path):
+        """Grava uma linha por (documento, etapa) em CSV"""
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['document', 'stage', 'wall_s', 'cpu_s', 'bytes', 'calls'])
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+    def write_reports(self, output_dir: Path, prefix: str = 'profile') -> Optional[Path]:
+        """Grava JSON e CSV com carimbo de data e retorna o caminho do JSON"""
+        if not self.enabled or not self.records:
+            return None
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        json_path = output_dir / f"{prefix}_{stamp}.json"
+        self.write_json(json_path)
+        self.write_csv(output_dir / f"{prefix}_{stamp}.csv")
+        return json_path
+
+    def print_summary(self, top: int = 10):
+        """Imprime os totais por etapa e os N documentos mais lentos"""
+        if not self.enabled or not self.records:
+            return
+        print("\n⏱️  Tempo por etapa:")
+        print(f"  {'Etapa':<12} {'Parede (s)':>11} {'CPU (s)':>9} {'MB':>9} {'Chamadas':>9}")
+        for name, entry in self.stage_totals().items():
+            print(f"  {name:<12} {entry['wall']:>11.2f} {entry['cpu']:>9.2f} "
+                  f"{entry['bytes'] / 1e6:>9.2f} {entry['calls']:>9}")
+
+        print(f"\n🐢 {top} documentos mais lentos:")
+        for idx, total in enumerate(self.document_totals()[:top], 1):
+            print(f"  {idx:>2}. {total['wall']:>8.2f}s  CPU {total['cpu']:>7.2f}s  "
+                  f"[{total['slowest_stage']}]  {Path(total['document']).name[:50]}")
+
+
+def _stage_order(name: str) -> int:
+    return STAGES.index(name) if name in STAGES else len(STAGES)
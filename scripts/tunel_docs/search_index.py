@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Busca semântica top-k sobre o índice de embeddings pré-computado
+Uma consulta é um único produto matriz-vetor sobre as linhas já normalizadas,
+lidas direto do arquivo mapeado em memória
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from tunel_docs.ann_index import load_ann
+from tunel_docs.build_embedding_index import index_backend, load_chunks, load_index, normalize_rows
+from tunel_docs.embedding_backends import create_embedder
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Índices dos k maiores valores de cada linha, em ordem decrescente"""
+    k = min(k, scores.shape[-1])
+    if k == 0:
+        return np.zeros(scores.shape[:-1] + (0,), dtype=np.intp)
+    candidates = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=-1), axis=-1, kind='stable')
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+class SearchIndex:
+    """
+    Índice carregado na memória, pronto para consultas por similaridade de cosseno
+
+    Se houver um índice aproximado válido para a matriz atual, consultas
+    individuais o utilizam; `exact=True` força a busca exata.
+    """
+
+    def __init__(self, index_dir: Path, embedder=None, exact: bool = False):
+        meta, matrix = load_index(Path(index_dir))
+        if meta is None:
+            raise ValueError(f"Índice não encontrado em {index_dir}; rode 'tunel-docs index embeddings'")
+        self.meta = meta
+        self.chunks = meta['chunks']
+        # Índices antigos guardavam os vetores sem normalizar: só esses são copiados para a memória
+        self.matrix = matrix if meta.get('normalized') else normalize_rows(matrix)
+        # O embedder das consultas precisa ser o mesmo que gerou o índice
+        self.embedder = embedder or create_embedder(index_backend(meta), meta['model'])
+        self.ann = None if exact else load_ann(Path(index_dir), meta)
+
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        vectors = np.asarray(self.embedder.embed(queries), dtype=np.float32)
+        return normalize_rows(vectors)
+
+    def _results(self, scores: np.ndarray, rows: np.ndarray) -> List[Dict]:
+        return [dict(self.chunks[row], score=float(scores[row])) for row in rows]
+
+    def search_vector(self, vector: np.ndarray, k: int = 5) -> List[Dict]:
+        """Top-k para um vetor de consulta já normalizado"""
+        if self.ann is not None:
+            rows = self.ann.search(self.matrix, vector, k)
+            return [dict(self.chunks[row], score=float(self.matrix[row] @ vector)) for row in rows]
+        scores = self.matrix @ vector
+        return self._results(scores, top_k(scores, k))
+
+    def search(self, query: str, k: int = 5) -> List[Dict]:
+        """Top-k chunks mais similares à consulta"""
+        return self.search_vector(self.embed_queries([query])[0], k)
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Dict]]:
+        """Top-k de várias consultas com um único produto de matrizes"""
+        if not queries:
+            return []
+        scores = self.embed_queries(queries) @ self.matrix.T
+        rows = top_k(scores, k)
+        return [self._results(scores[i], rows[i]) for i in range(len(queries))]
+
+
+def print_results(query: str, results: List[Dict], texts: Optional[Dict[str, str]] = None):
+    print(f"\n🔎 {query}")
+    for rank, result in enumerate(results, 1):
+        print(f"  {rank:>2}. {result['score']:.4f}  {result['id']}")
+        if texts and result['id'] in texts:
+            snippet = ' '.join(texts[result['id']].split())[:200]
+            print(f"      {snippet}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca semântica no corpus de Markdown")
+    parser.add_argument('query', nargs='?', help="Consulta (omitida com --batch)")
+    parser.add_argument('-k', '--top-k', type=int, default=5, help="Resultados por consulta")
+    parser.add_argument('--index-dir', default='embedding_index')
+    parser.add_argument('--batch', default=None,
+                        help="Arquivo com uma consulta por linha; resultados em JSON Lines")
+    parser.add_argument('--output', default=None, help="Saída do modo batch (padrão: stdout)")
+    parser.add_argument('--exact', action='store_true',
+                        help="Ignora o índice aproximado e compara com todos os chunks")
+    parser.add_argument('--show-text', action='store_true', help="Mostra um trecho de cada chunk")
+    parser.add_argument('--docs-dir', default='PDF_Markdown_Traduzido',
+                        help="Markdown de origem, usado por --show-text")
+    args = parser.parse_args()
+
+    if not args.query and not args.batch:
+        parser.error("informe uma consulta ou --batch")
+
+    try:
+        index = SearchIndex(Path(args.index_dir), exact=args.exact)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            queries = [line.strip() for line in f if line.strip()]
+        start = time.perf_counter()
+        all_results = index.search_batch(queries, args.top_k)
+        elapsed = time.perf_counter() - start
+        output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            for query, results in zip(queries, all_results):
+                output.write(json.dumps({'query': query, 'results': results}, ensure_ascii=False) + '\n')
+        finally:
+            if args.output:
+                output.close()
+        print(f"⏱️  {len(queries)} consultas em {elapsed:.3f}s "
+              f"({len(queries) / elapsed if elapsed else 0:.1f} consultas/s)", file=sys.stderr)
+        return
+
+    texts = None
+    if args.show_text:
+        texts = {chunk['id']: chunk['content'] for chunk in load_chunks(Path(args.docs_dir))}
+    start = time.perf_counter()
+    results = index.search(args.query, args.top_k)
+    print_results(args.query, results, texts)
+    mode = index.ann.method.upper() if index.ann else 'exata'
+    print(f"\n⏱️  {(time.perf_counter() - start) * 1000:.1f} ms sobre {len(index.chunks)} chunks (busca {mode})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Script para configurar o assistente da OpenAI com File Search
+Este script deve ser executado apenas uma vez para criar o assistente e fazer upload dos documentos
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+import json
+from tunel_docs.openai_upload import merge_entries, superseded_ids, upload_files
+from tunel_docs.translation_backends import ENV_FILE
+from tunel_docs.vector_store_sync import ingest_files, sync_vector_store, vector_stores
+
+# Arquivos do projeto, relativos ao diretório em que o comando roda (a raiz do projeto)
+ENV_PATH = Path(ENV_FILE)
+CONFIG_FILE = ".openai_config.json"
+MARKDOWN_DIR = "PDF_Markdown_Traduzido"
+
+_client = None
+
+def load_env():
+    """Carrega a OPENAI_API_KEY do .env do diretório atual para o ambiente"""
+    from dotenv import dotenv_values
+    print(f"Carregando .env de: {ENV_PATH}")
+    config = dotenv_values(str(ENV_PATH))
+    print(f"Variáveis carregadas do .env: {list(config.keys())}")
+    
+    # Define manualmente a variável de ambiente
+    if 'OPENAI_API_KEY' in config:
+        os.environ['OPENAI_API_KEY'] = config['OPENAI_API_KEY']
+        print(f"API Key definida manualmente: {config['OPENAI_API_KEY'][:20]}...")
+
+def get_client():
+    """Cliente OpenAI criado no primeiro uso"""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    return _client
+
+def get_config_file():
+    """Retorna o caminho do arquivo de configuração"""
+    return Path(CONFIG_FILE)
+
+def save_upload_progress(file_ids):
+    """Grava os arquivos já enviados para permitir retomar o upload"""
+    config_file = get_config_file()
+    config = {}
+    if config_file.exists():
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+    # Mantém as entradas ainda não reenviadas (e os IDs antigos dos alterados)
+    config['files'] = merge_entries(config.get('files', []), file_ids)
+    config.setdefault('created_at', time.strftime('%Y-%m-%d %H:%M:%S'))
+    with open(config_file, 'w') as f:
+        json.dump(config, f, indent=2)
+
+def delete_files(file_ids):
+    """Apaga da OpenAI os arquivos que não fazem mais parte da configuração"""
+    for file_id in file_ids:
+        try:
+            get_client().files.delete(file_id)
+        except Exception as e:
+            print(f"  ⚠️  Não foi possível apagar {file_id}: {e}")
+    if file_ids:
+        print(f"🗑️  {len(file_ids)} arquivos antigos apagados")
+
+def upload_files_to_openai(previous_files=None, workers=8):
+    """Faz upload de todos os arquivos markdown para a OpenAI (incluindo subpastas)
+    
+    Arquivos cujo hash não mudou desde o último envio reaproveitam o ID salvo
+    """
+    markdown_dir = Path(MARKDOWN_DIR)
+    
+    print("📤 Iniciando upload dos arquivos...")
+    
+    return upload_files(get_client(), markdown_dir, previous=previous_files, workers=workers,
+                        on_uploaded=save_upload_progress)
+
+def create_vector_store(file_ids):
+    """Cria um Vector Store com os arquivos enviados"""
+    print("\n📊 Criando Vector Store...")
+    
+    try:
+        vector_store = vector_stores(get_client()).create(
+            name="Documentos Túnel Santos-Guarujá"
+        )
+        print(f"✅ Vector Store criado: {vector_store.id}")
+        
+        # Indexa em lotes acompanhando o status de cada um
+        summary = ingest_files(get_client(), vector_store.id, [f['id'] for f in file_ids])
+        if summary['failed']:
+            print(f"⚠️  {summary['failed']} arquivos não foram indexados: {summary['failed_ids']}")
+        if summary['pending_ids']:
+            print(f"⏳ {len(summary['pending_ids'])} arquivos ainda em indexação; 'tunel-docs upload sync' conclui depois")
+        return vector_store.id
+    except Exception as e:
+        print(f"❌ Erro ao criar Vector Store: {e}")
+        return None
+
+def create_assistant(vector_store_id):
+    """Cria o assistente com File Search habilitado"""
+    print("\n🤖 Criando assistente...")
+    
+    try:
+        assistant = get_client().beta.assistants.create(
+            name="Assistente Túnel Santos-Guarujá",
+            instructions="""Você é um assistente especializado no projeto do Túnel Imerso Santos-Guarujá. 
+            Sua função é responder perguntas sobre o projeto usando as informações dos documentos disponíveis.
+            
+            Diretrizes:
+            - Seja preciso e objetivo nas respostas
+            - Use informações dos documentos oficiais do projeto
+            - Cite valores, prazos e dados técnicos quando relevante
+            - Se não souber a resposta, indique que a informação não está disponível nos documentos
+            - Mantenha um tom profissional e amigável
+            - Responda em português brasileiro
+            
+            Contexto do projeto:
+            - Túnel imerso ligando Santos a Guarujá
+            - Primeiro túnel imerso do Brasil
+            - Investimento de aproximadamente R$ 7 bilhões
+            - PPP com concessão de 30 anos
+            - 6 faixas de rodagem, ciclovia e passagem para pedestres
+            """,
+            model="gpt-4o-mini",
+            tools=[{"type": "file_search"}],
+            tool_resources={
+                "file_search": {
+                    "vector_store_ids": [vector_store_id]
+                }
+            }
+        )
+        print(f"✅ Assistente criado: {assistant.id}")
+        return assistant.id
+    except Exception as e:
+        print(f"❌ Erro ao criar assistente: {e}")
+        return None
+
+def save_configuration(file_ids, vector_store_id, assistant_id):
+    """Salva a configuração para uso posterior"""
+    config = {
+        'assistant_id': assistant_id,
+        'vector_store_id': vector_store_id,
+        'files': file_ids,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S')
+    }
+    
+    config_file = get_config_file()
+    with open(config_file, 'w') as f:
+        json.dump(config, f, indent=2)
+    
+    print(f"\n💾 Configuração salva em {config_file}")
+    print("\n📝 Adicione estas variáveis ao seu arquivo .env:")
+    print(f"OPENAI_ASSISTANT_ID={assistant_id}")
+    print(f"OPENAI_VECTOR_STORE_ID={vector_store_id}")
+
+def sync():
+    """Sincroniza o Vector Store existente com a pasta de Markdown, sem recriá-lo"""
+    config_file = get_config_file()
+    if not config_file.exists():
+        print("❌ Nenhuma configuração encontrada. Execute a configuração completa primeiro.")
+        return
+    
+    with open(config_file, 'r') as f:
+        config = json.load(f)
+    vector_store_id = config.get('vector_store_id')
+    if not vector_store_id:
+        print("❌ A configuração não possui vector_store_id. Execute a configuração completa primeiro.")
+        return
+    
+    def save_files(files):
+        config['files'] = files
+        with open(config_file, 'w') as f:
+            json.dump(config, f, indent=2)
+    
+    markdown_dir = Path(MARKDOWN_DIR)
+    # Os IDs enviados são gravados antes da indexação (on_progress)
+    files = sync_vector_store(get_client(), markdown_dir, vector_store_id, config.get('files', []),
+                              on_progress=save_files)
+    config['synced_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    save_files(files)
+    
+    print(f"\n✨ Vector Store {vector_store_id} sincronizado ({len(config['files'])} arquivos)")
+
+def main():
+    """Função principal"""
+    print("🚀 Configurando Assistente OpenAI para o Túnel Santos-Guarujá\n")
+    
+    # Verifica se a API key está configurada
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        print("❌ OPENAI_API_KEY não encontrada no arquivo .env")
+        print("Por favor, adicione sua chave da API OpenAI ao arquivo .env")
+        print(f"Debug - Variáveis de ambiente carregadas: {list(os.environ.keys())[:10]}")
+        return
+    
+    print(f"✅ API Key encontrada: {api_key[:20]}...")
+    
+    # Verifica se já existe uma configuração
+    config_file = get_config_file()
+    previous_files = []
+    if config_file.exists():
+        with open(config_file, 'r') as f:
+            existing_config = json.load(f)
+        previous_files = existing_config.get('files', [])
+        if existing_config.get('assistant_id'):
+            print(f"⚠️  Configuração existente encontrada (criada em {existing_config['created_at']})")
+            print("   Para só atualizar os documentos, use: tunel-docs upload sync")
+            response = input("Deseja sobrescrever? (s/n): ")
+            if response.lower() != 's':
+                print("Operação cancelada.")
+                return
+        else:
+            print(f"🔁 Retomando upload interrompido ({len(previous_files)} arquivos já enviados)")
+    
+    # Upload dos arquivos (inalterados reaproveitam o ID anterior)
+    file_ids = upload_files_to_openai(previous_files)
+    if not file_ids:
+        print("❌ Nenhum arquivo foi enviado com sucesso")
+        return
+    
+    print(f"\n✅ {len(file_ids)} arquivos enviados com sucesso")
+    
+    # Entradas gravadas durante o upload, com os IDs das versões substituídas
+    saved_files = previous_files
+    if config_file.exists():
+        with open(config_file, 'r') as f:
+            saved_files = json.load(f).get('files', [])
+    
+    # Cria o Vector Store
+    vector_store_id = create_vector_store(file_ids)
+    if not vector_store_id:
+        return
+    
+    # Cria o assistente
+    assistant_id = create_assistant(vector_store_id)
+    if not assistant_id:
+        return
+    
+    # Salva a configuração
+    save_configuration(file_ids, vector_store_id, assistant_id)
+    delete_files(superseded_ids(saved_files, file_ids))
+    
+    print("\n✨ Configuração concluída com sucesso!")
+    print("Agora você pode usar o assistente no seu aplicativo.")
+
+def cli():
+    """Ponto de entrada: 'sync' só atualiza os documentos, sem recriar o assistente"""
+    load_env()
+    if len(sys.argv) > 1 and sys.argv[1] == 'sync':
+        sync()
+    else:
+        main()
+
+if __name__ == "__main__":
+    cli()
\ No newline at end of file
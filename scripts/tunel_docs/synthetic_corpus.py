@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Gerador de corpus sintético de PDFs para benchmarks do pipeline
+Cria documentos em inglês e português com tabelas e páginas só com imagem
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import List
+
+EN_SENTENCES = [
+    "The concessionaire shall build and operate the immersed tunnel between Santos and Guaruja.",
+    "The contract establishes the obligations of the parties for the concession period.",
+    "All works must comply with the environmental license issued by the state agency.",
+    "The tender notice defines the requirements for the qualification of bidders.",
+    "Payments to the private partner are subject to the performance indicators in the annex.",
+    "The port authority will coordinate the navigation channel during the construction works.",
+    "This agreement is governed by the laws of the Federative Republic of Brazil.",
+    "The immersed elements are built in a dry dock and floated to the final position.",
+]
+
+PT_SENTENCES = [
+    "A concessionária deverá construir e operar o túnel imerso entre Santos e Guarujá.",
+    "O contrato estabelece as obrigações das partes durante o prazo da concessão.",
+    "Todas as obras devem cumprir a licença ambiental emitida pelo órgão estadual.",
+    "O edital define os requisitos para a habilitação dos licitantes.",
+    "Os pagamentos ao parceiro privado estão sujeitos aos indicadores de desempenho do anexo.",
+    "A autoridade portuária coordenará o canal de navegação durante as obras.",
+    "Este acordo é regido pelas leis da República Federativa do Brasil.",
+    "Os elementos imersos são construídos em dique seco e flutuados até a posição final.",
+]
+
+# Combinações (páginas, idioma, com tabelas, fração de páginas só com imagem)
+PROFILES = [
+    (1, 'pt', False, 0.0),
+    (5, 'en', True, 0.0),
+    (12, 'pt', True, 0.1),
+    (30, 'en', False, 0.2),
+    (60, 'en', True, 0.05),
+    (8, 'pt', False, 0.5),
+]
+
+
+def _write_text_page(page, sentences: List[str], rng: random.Random, with_table: bool):
+    """Preenche uma página com título, parágrafos, lista e tabela opcional"""
+    import fitz
+
+    y = 60
+    title = rng.choice(sentences).split()[1:4]
+    page.insert_text((56, y), ' '.join(title).upper(), fontsize=13)
+    y += 28
+
+    for _ in range(rng.randint(4, 9)):
+        paragraph = ' '.join(rng.choice(sentences) for _ in range(rng.randint(2, 4)))
+        rect = fitz.Rect(56, y, page.rect.width - 56, y + 70)
+        page.insert_textbox(rect, paragraph, fontsize=10)
+        y += 74
+        if y > page.rect.height - 220:
+            break
+
+    for _ in range(3):
+        page.insert_text((66, y), f"• {rng.choice(sentences)[:70]}", fontsize=10)
+        y += 14
+
+    if with_table and y < page.rect.height - 150:
+        y += 12
+        col_width = (page.rect.width - 112) / 4
+        for row in range(5):
+            for col in range(4):
+                cell = fitz.Rect(56 + col * col_width, y, 56 + (col + 1) * col_width, y + 18)
+                page.draw_rect(cell, width=0.5)
+                value = f"Item {row}" if col == 0 else f"{rng.randint(1, 99999):,}"
+                page.insert_textbox(cell + (3, 3, -3, -3), value, fontsize=8)
+            y += 18
+
+
+def _write_image_page(page, rng: random.Random):
+    """Insere uma imagem raster sem nenhuma camada de texto"""
+    import fitz
+
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 320, 240), False)
+    pixmap.set_rect(pixmap.irect, (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+    page.insert_image(page.rect + (56, 56, -56, -56), pixmap=pixmap)
+
+
+def generate_document(path: Path, pages: int, language: str, with_tables: bool,
+                      image_ratio: float, seed: int = 0):
+    """Gera um PDF sintético"""
+    import fitz  # PyMuPDF
+
+    rng = random.Random(seed)
+    sentences = EN_SENTENCES if language == 'en' else PT_SENTENCES
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        if rng.random() < image_ratio:
+            _write_image_page(page, rng)
+        else:
+            _write_text_page(page, sentences, rng, with_tables and rng.random() < 0.5)
+    doc.save(str(path), deflate=True)
+    doc.close()
+
+
+def generate_corpus(output_dir: Path, documents: int = 12, seed: int = 42) -> List[Path]:
+    """
+    Gera `documents` PDFs alternando os perfis de tamanho e idioma
+
+    Returns:
+        Lista com os caminhos gerados
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for idx in range(documents):
+        pages, language, with_tables, image_ratio = PROFILES[idx % len(PROFILES)]
+        path = output_dir / f"sintetico_{idx:03d}_{language}_{pages}p.pdf"
+        if not path.exists():
+            generate_document(path, pages, language, with_tables, image_ratio, seed=seed + idx)
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera um corpus sintético de PDFs")
+    parser.add_argument('output_dir', nargs='?', default='PDF_Sintetico')
+    parser.add_argument('--documents', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    generated = generate_corpus(Path(args.output_dir), args.documents, args.seed)
+    total_pages = sum(PROFILES[i % len(PROFILES)][0] for i in range(args.documents))
+    print(f"✅ {len(generated)} PDFs ({total_pages} páginas) em {args.output_dir}/")
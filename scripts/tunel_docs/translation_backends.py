@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Backends de tradução usados pelo pipeline de conversão
+Cada backend expõe `translate(text)` e registra o uso no livro-razão de custo
+"""
+
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from tunel_docs.cost_ledger import CostLedger
+
+SYSTEM_PROMPT = """Você é um tradutor profissional especializado em documentos técnicos e jurídicos.
+
+Instruções:
+1. Traduza do inglês para o português do Brasil
+2. Mantenha TODA a formatação markdown (###, -, *, etc.)
+3. Preserve quebras de linha e espaçamento
+4. Mantenha números, datas e valores inalterados
+5. Use terminologia técnica apropriada para contratos e documentos oficiais
+6. Seja fiel ao original, não adicione nem remova conteúdo"""
+
+# .env do diretório em que o pipeline roda (o mesmo das demais saídas)
+ENV_FILE = ".env"
+
+_openai_client = None
+
+
+def load_env(path: Path = Path(ENV_FILE)):
+    """Carrega as variáveis do .env no ambiente, sem sobrescrever as já definidas"""
+    if not Path(path).exists():
+        return
+    from dotenv import load_dotenv
+    load_dotenv(path, override=False)
+
+
+class GoogleBackend:
+    """Google Translate via deep_translator"""
+
+    name = 'google'
+    model = 'google-translate'
+    max_chunk_size = 4900
+    typical_latency = 1.0
+
+    def __init__(self, ledger: Optional[CostLedger] = None, document: Optional[str] = None):
+        from deep_translator import GoogleTranslator
+        self._translator = GoogleTranslator(source='en', target='pt')
+        self.ledger = ledger
+        self.document = document
+
+    def translate(self, text: str) -> str:
+        start = time.perf_counter()
+        translated = self._translator.translate(text)
+        if self.ledger:
+            self.ledger.record(self.document, self.name, self.model,
+                               characters=len(text), latency=time.perf_counter() - start)
+        return translated
+
+
+class OpenAIBackend:
+    """Chat Completions da OpenAI, com contabilização de `response.usage`"""
+
+    name = 'openai'
+    model = 'gpt-3.5-turbo'
+    max_chunk_size = 3500
+    typical_latency = 6.0
+
+    def __init__(self, ledger: Optional[CostLedger] = None, document: Optional[str] = None):
+        global _openai_client
+        if _openai_client is None:
+            load_env()
+            from openai import OpenAI
+            _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self._client = _openai_client
+        self.ledger = ledger
+        self.document = document
+
+    def translate(self, text: str) -> str:
+        start = time.perf_counter()
+        response = self._client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": text}
+            ],
+            temperature=0.3,
+            max_tokens=4000
+        )
+        if self.ledger and response.usage:
+            self.ledger.record(self.document, self.name, self.model,
+                               prompt_tokens=response.usage.prompt_tokens,
+                               completion_tokens=response.usage.completion_tokens,
+                               characters=len(text),
+                               latency=time.perf_counter() - start)
+        choice = response.choices[0]
+        # Resposta cortada pelo max_tokens: melhor falhar que gravar meia tradução
+        if choice.finish_reason == 'length':
+            raise ValueError(f"Tradução truncada pelo limite de tokens ({len(text)} caracteres)")
+        return choice.message.content
+
+
+class StubBackend:
+    """
+    Tradutor local determinístico, sem rede, para benchmarks e testes
+
+    Troca palavras de um pequeno glossário e pode simular a latência de rede.
+    """
+
+    name = 'stub'
+    model = 'stub'
+    max_chunk_size = 4900
+    typical_latency = 0.0
+    # Latência simulada por requisição, em segundos
+    latency = 0.0
+
+    GLOSSARY = {
+        'the': 'o', 'and': 'e', 'of': 'de', 'to': 'para', 'in': 'em', 'is': 'é',
+        'for': 'para', 'with': 'com', 'that': 'que', 'this': 'este', 'by': 'por',
+        'tunnel': 'túnel', 'contract': 'contrato', 'shall': 'deverá', 'works': 'obras',
+        'concessionaire': 'concessionária', 'port': 'porto', 'city': 'cidade',
+        'state': 'estado', 'agreement': 'acordo', 'party': 'parte', 'parties': 'partes',
+    }
+    _WORD = re.compile(r'[A-Za-z]+')
+
+    def __init__(self, ledger: Optional[CostLedger] = None, document: Optional[str] = None):
+        self.ledger = ledger
+        self.document = document
+
+    def translate(self, text: str) -> str:
+        start = time.perf_counter()
+        if self.latency:
+            time.sleep(self.latency)
+        translated = self._WORD.sub(lambda m: self.GLOSSARY.get(m.group(0).lower(), m.group(0)), text)
+        if self.ledger:
+            self.ledger.record(self.document, self.name, self.model,
+                               characters=len(text), latency=time.perf_counter() - start)
+        return translated
+
+
+BACKENDS = {
+    GoogleBackend.name: GoogleBackend,
+    OpenAIBackend.name: OpenAIBackend,
+    StubBackend.name: StubBackend,
+}
+
+
+def create_backend(name: str, ledger: Optional[CostLedger] = None, document: Optional[str] = None):
+    """Instancia o backend pelo nome"""
+    if name not in BACKENDS:
+        raise ValueError(f"Backend de tradução desconhecido: {name} (opções: {', '.join(BACKENDS)})")
+    return BACKENDS[name](ledger=ledger, document=document)
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Memória de tradução compartilhada entre todos os documentos do corpus
+Reaproveita traduções de parágrafos idênticos e de quase-duplicados (via MinHash/LSH)
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Primo de Mersenne usado nas permutações do MinHash
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Similaridade mínima para reaproveitar a tradução de um parágrafo quase idêntico
+REUSE_THRESHOLD = 0.9
+# Fim de frase: a próxima linha começa outro parágrafo
+_PARAGRAPH_END = ('.', ':', ';', '!', '?')
+_LIST_ITEM = re.compile(r'^(?:[-*]|\d+[.)]?)\s+')
+
+
+def normalize_segment(text: str) -> str:
+    """Normaliza um segmento para comparação (espaços e caixa)"""
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def segment_key(text: str) -> str:
+    """Chave estável de um segmento normalizado"""
+    return hashlib.sha1(normalize_segment(text).encode('utf-8')).hexdigest()
+
+
+class MinHashLSH:
+    """
+    Índice MinHash com bandas LSH para encontrar parágrafos quase idênticos
+
+    Com 64 permutações em 8 bandas de 8 linhas, pares com similaridade de
+    Jaccard acima de ~0.75 caem no mesmo balde com alta probabilidade.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 8, shingle_size: int = 3, seed: int = 42):
+        if num_perm % bands:
+            raise ValueError("num_perm deve ser múltiplo de bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [(rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+                       for _ in range(num_perm)]
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+
+    def _shingles(self, text: str) -> set:
+        words = normalize_segment(text).split()
+        if len(words) < self.shingle_size:
+            return {' '.join(words)} if words else set()
+        return {' '.join(words[i:i + self.shingle_size])
+                for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """Calcula a assinatura MinHash do texto"""
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in self._shingles(text)]
+        if not hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+                     for a, b in self._perms)
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: str, text: str):
+        """Indexa um segmento sob a chave informada"""
+        if key in self._signatures:
+            return
+        signature = self.signature(text)
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+
+    def query(self, text: str, threshold: float = 0.7) -> Optional[Tuple[str, float]]:
+        """Retorna (chave, similaridade estimada) do candidato mais parecido"""
+        signature = self.signature(text)
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best = None
+        for key in candidates:
+            other = self._signatures[key]
+            similarity = sum(1 for x, y in zip(signature, other) if x == y) / self.num_perm
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+
+class TranslationMemory:
+    """
+    Memória de tradução persistida em JSON
+
+    Segmentos (parágrafos) idênticos após normalização reutilizam a tradução
+    já feita. Quase idênticos com similaridade a partir de `reuse_threshold`
+    também a reutilizam, mas ficam marcados para revisão, pois uma pequena
+    edição pode mudar o sentido; abaixo disso (ou com `reuse_threshold` None)
+    são só contabilizados e vão para o tradutor.
+    """
+
+    def __init__(self, path: Optional[Path] = None, min_fuzzy_chars: int = 40,
+                 fuzzy_threshold: float = 0.7, reuse_threshold: Optional[float] = REUSE_THRESHOLD):
+        self.path = Path(path) if path else None
+        self.min_fuzzy_chars = min_fuzzy_chars
+        self.fuzzy_threshold = fuzzy_threshold
+        self.reuse_threshold = reuse_threshold
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.index = MinHashLSH()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> 'TranslationMemory':
+        """Carrega a memória do disco (ou cria uma vazia)"""
+        memory = cls(path, **kwargs)
+        if memory.path and memory.path.exists():
+            with open(memory.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key, entry in data.get('entries', {}).items():
+                memory._store(key, entry['source'], entry['translation'])
+        return memory
+
+    def save(self):
+        """Grava a memória no disco"""
+        if not self.path:
+            return
+        with self._lock:
+            data = {'version': 1, 'entries': dict(self.entries)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_path.replace(self.path)
+
+    def reset_stats(self):
+        """Zera as estatísticas da execução atual"""
+        self.stats = {
+            'reused_segments': 0,
+            'reused_chars': 0,
+            'translated_segments': 0,
+            'translated_chars': 0,
+            'near_duplicates': 0,
+            'fuzzy_reused': 0,
+            'requests': 0,
+        }
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fração dos caracteres da execução atendida pela memória"""
+        total = self.stats['reused_chars'] + self.stats['translated_chars']
+        return self.stats['reused_chars'] / total if total else 0.0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _store(self, key: str, source: str, translation: str):
+        self.entries[key] = {'source': source, 'translation': translation}
+        if len(source) >= self.min_fuzzy_chars:
+            self.index.add(key, source)
+
+    def lookup(self, segment: str) -> Optional[str]:
+        """Retorna a tradução de um segmento idêntico, se existir"""
+        entry = self.entries.get(segment_key(segment))
+        return entry['translation'] if entry else None
+
+    def find_similar(self, segment: str) -> Optional[Tuple[str, float]]:
+        """Retorna (texto de origem, similaridade) de um segmento quase idêntico"""
+        if len(segment) < self.min_fuzzy_chars:
+            return None
+        with self._lock:
+            match = self.index.query(segment, self.fuzzy_threshold)
+        # Segmentos esquecidos continuam no índice LSH
+        if not match or match[0] not in self.entries:
+            return None
+        return self.entries[match[0]]['source'], match[1]
+
+    def add(self, segment: str, translation: str):
+        """Registra a tradução de um segmento (cópias do original não entram)"""
+        if not segment.strip() or not translation.strip():
+            return
+        # Tradutor que devolveu o próprio texto: não vale para o resto do corpus
+        if normalize_segment(translation) == normalize_segment(segment):
+            return
+        with self._lock:
+            self._store(segment_key(segment), segment, translation)
+
+    def forget(self, segment: str) -> bool:
+        """Descarta a tradução de um segmento (ex.: reprovada na verificação de qualidade)"""
+        with self._lock:
+            return self.entries.pop(segment_key(segment), None) is not None
+
+    def translate(self, text: str, translate_fn: Callable[[str], str],
+                  review: Optional[List[Dict]] = None) -> str:
+        """
+        Traduz um texto parágrafo a parágrafo usando a memória
+
+        Com `reuse_threshold`, parágrafos quase idênticos a um já traduzido
+        recebem a tradução dele e vão para `review` (linha inicial, texto
+        parecido e similaridade), para serem conferidos; não entram na memória.
+
+        Args:
+            text: Texto de origem (linhas separadas por '\\n')
+            translate_fn: Função que traduz um bloco de texto
+            review: Lista que recebe os parágrafos reaproveitados por semelhança
+
+        Returns:
+            Texto traduzido, com os parágrafos já conhecidos reaproveitados
+        """
+        lines = text.split('\n')
+        spans = paragraph_spans(lines)
+        paragraphs = ['\n'.join(lines[start:end]) for start, end in spans]
+        result: List[Optional[str]] = [None] * len(paragraphs)
+        pending = []
+
+        for idx, paragraph in enumerate(paragraphs):
+            cached = self.lookup(paragraph)
+            if cached is not None:
+                result[idx] = cached
+                with self._lock:
+                    self.stats['reused_segments'] += 1
+                    self.stats['reused_chars'] += len(paragraph)
+                continue
+            similar = self.find_similar(paragraph)
+            if similar:
+                with self._lock:
+                    self.stats['near_duplicates'] += 1
+                reused = self.lookup(similar[0])
+                if (self.reuse_threshold is not None and similar[1] >= self.reuse_threshold
+                        and reused is not None):
+                    result[idx] = reused
+                    if review is not None:
+                        review.append({'line': spans[idx][0], 'match': similar[0],
+                                       'similarity': round(similar[1], 2)})
+                    with self._lock:
+                        self.stats['fuzzy_reused'] += 1
+                        self.stats['reused_chars'] += len(paragraph)
+                    continue
+            pending.append(idx)
+
+        if pending:
+            self._translate_pending(paragraphs, pending, result, translate_fn)
+
+        # Linhas em branco entre parágrafos ficam no lugar
+        output, position = [], 0
+        for (start, end), translated in zip(spans, result):
+            output.extend(lines[position:start])
+            if translated is not None:
+                output.append(translated)
+            position = end
+        output.extend(lines[position:])
+        return '\n'.join(output)
+
+    def _translate_pending(self, paragraphs: List[str], pending: List[int],
+                           result: List[Optional[str]], translate_fn: Callable[[str], str]):
+        """Traduz os parágrafos novos, guardando na memória os que dá para separar"""
+        counts = [paragraphs[i].count('\n') + 1 for i in pending]
+        # Tenta traduzir todos os parágrafos novos de uma vez; se o tradutor
+        # alterar a quantidade de linhas, recai para blocos consecutivos
+        translated = translate_fn('\n'.join(paragraphs[i] for i in pending)).split('\n')
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['translated_segments'] += len(pending)
+            self.stats['translated_chars'] += sum(len(paragraphs[i]) for i in pending)
+        if len(translated) == sum(counts):
+            self._split_translation(paragraphs, pending, counts, translated, result)
+            return
+
+        for run in _consecutive_runs(pending):
+            translated = translate_fn('\n'.join(paragraphs[i] for i in run))
+            # Segunda requisição para os mesmos parágrafos: o custo também conta
+            with self._lock:
+                self.stats['requests'] += 1
+                self.stats['translated_chars'] += sum(len(paragraphs[i]) for i in run)
+            run_counts = [paragraphs[i].count('\n') + 1 for i in run]
+            if len(run) == 1 or len(translated.split('\n')) == sum(run_counts):
+                self._split_translation(paragraphs, run, run_counts, translated.split('\n'), result)
+            else:
+                # Sem como separar os parágrafos, o bloco fica no primeiro e a memória sem eles
+                result[run[0]] = translated
+
+    def _split_translation(self, paragraphs: List[str], indices: List[int], counts: List[int],
+                           translated: List[str], result: List[Optional[str]]):
+        """Distribui as linhas traduzidas pelos parágrafos (um só parágrafo leva tudo)"""
+        if len(indices) == 1:
+            counts = [len(translated)]
+        position = 0
+        for idx, count in zip(indices, counts):
+            result[idx] = '\n'.join(translated[position:position + count])
+            position += count
+            self.add(paragraphs[idx], result[idx])
+
+
+def paragraph_spans(lines: List[str]) -> List[Tuple[int, int]]:
+    """
+    Intervalos (início, fim) das linhas de cada parágrafo do texto formatado
+
+    Linhas seguidas formam um parágrafo até uma que feche a frase; títulos
+    ficam sozinhos, itens de lista abrem um parágrafo novo e linhas em branco
+    separam parágrafos sem pertencer a nenhum.
+    """
+    spans: List[Tuple[int, int]] = []
+    start = None
+    for idx, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#') or _LIST_ITEM.match(stripped):
+            if start is not None:
+                spans.append((start, idx))
+                start = None
+        if not stripped:
+            continue
+        if start is None:
+            start = idx
+        if stripped.startswith('#') or stripped.endswith(_PARAGRAPH_END):
+            spans.append((start, idx + 1))
+            start = None
+    if start is not None:
+        spans.append((start, len(lines)))
+    return spans
+
+
+def _consecutive_runs(indices: List[int]) -> List[List[int]]:
+    """Agrupa índices ordenados em sequências consecutivas"""
+    runs: List[List[int]] = []
+    for idx in indices:
+        if runs and runs[-1][-1] == idx - 1:
+            runs[-1].append(idx)
+        else:
+            runs.append([idx])
+    return runs
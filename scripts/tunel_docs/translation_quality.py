@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Verificação de qualidade das traduções gravadas nos modelos dos documentos
+Aponta páginas e linhas que ficaram em inglês ou foram cortadas, para serem traduzidas de novo
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tunel_docs.document_model import MODEL_DIR, iter_models, load_document, page_markdown
+from tunel_docs.pdf_text import MAX_TRANSLATED_PAGE_CHARS, english_mask
+
+# Português costuma ficar do tamanho do inglês ou maior; bem menos que isso indica corte
+MIN_LENGTH_RATIO = 0.5
+# Abaixo disso o detector de idioma não decide (ver detect_language)
+MIN_SEGMENT_CHARS = 30
+QUALITY_REPORT_FILE = "quality_report.json"
+# Trechos que ficam iguais nos dois idiomas e não devem ser apontados (um por linha)
+QUALITY_ALLOWLIST_FILE = "quality_allowlist.txt"
+# Fração mínima de palavras com maiúscula ou número para um trecho ser nome próprio
+NAME_WORD_RATIO = 0.6
+_WORD = re.compile(r'\w+')
+
+
+def page_segments(page: Dict) -> List[Tuple[str, str]]:
+    """
+    Pares (original, tradução) da página: a página inteira e, quando o número
+    de linhas bate, cada linha
+    """
+    source = page_markdown(page)
+    translation = page['translation']
+    pairs = [(source, translation)]
+    source_lines, translated_lines = source.split('\n'), translation.split('\n')
+    if len(source_lines) == len(translated_lines) > 1:
+        pairs.extend(zip(source_lines, translated_lines))
+    return pairs
+
+
+def looks_like_name(text: str) -> bool:
+    """Nomes, endereços, siglas e números, que ficam iguais na tradução"""
+    words = _WORD.findall(text)
+    if not words:
+        return True
+    capitalized = sum(1 for word in words if word[0].isupper() or word[0].isdigit())
+    return capitalized >= NAME_WORD_RATIO * len(words)
+
+
+def load_allowlist(path: Path) -> Set[str]:
+    """Trechos liberados da verificação (linhas do arquivo, sem espaços nas pontas)"""
+    if not Path(path).exists():
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+def check_documents(documents: Iterable[Tuple[str, Dict]], min_ratio: float = MIN_LENGTH_RATIO,
+                    allowlist: Optional[Set[str]] = None) -> List[Dict]:
+    """
+    Páginas com tradução suspeita: 'untranslated' (trecho igual ao original ou
+    ainda em inglês), 'truncated' (bem mais curto que o original),
+    'missing' (página em inglês que deveria ter sido traduzida e não foi) ou
+    'fuzzy' (parágrafos que herdaram a tradução de um quase idêntico)
+
+    Trechos iguais ao original que parecem nomes próprios ou endereços, e os
+    da `allowlist`, não são apontados. Idioma, tamanhos e razões são
+    calculados de uma vez para o corpus todo.
+    """
+    import numpy as np
+
+    allowlist = allowlist or set()
+    flags: Dict[Tuple[int, int], Dict] = {}
+    keys, segment_ids, source_chars, translated_chars, identical, translations = [], [], [], [], [], []
+
+    for doc_idx, (name, document) in enumerate(documents):
+        for page in document['pages']:
+            key = (doc_idx, page['number'])
+            if page.get('translation') is None:
+                if (document.get('translate', True) and page['language'] == 'en'
+                        and len(page_markdown(page)) < MAX_TRANSLATED_PAGE_CHARS):
+                    flags[key] = {'document': name, 'page': page['number'], 'reasons': {'missing'},
+                                  'segments': [], 'ratio': None}
+                continue
+            # Segmento -1 é a página inteira; os demais, as linhas
+            for segment, (source, translation) in enumerate(page_segments(page), -1):
+                lines = [line.strip() for line in translation.split('\n') if line.strip()]
+                if lines and allowlist.issuperset(lines):
+                    continue
+                keys.append(key)
+                segment_ids.append(segment)
+                source_chars.append(len(source.strip()))
+                translated_chars.append(len(translation.strip()))
+                identical.append(source.strip() == translation.strip() and not looks_like_name(source))
+                translations.append(translation)
+            entry = flags.setdefault(key, {'document': name, 'page': page['number'], 'reasons': set(),
+                                           'segments': [], 'ratio': None})
+            if page.get('review'):
+                entry['reasons'].add('fuzzy')
+                entry['segments'].extend(item['line'] for item in page['review'])
+
+    if keys:
+        source_chars = np.array(source_chars)
+        translated_chars = np.array(translated_chars)
+        ratio = translated_chars / np.maximum(source_chars, 1)
+        measurable = source_chars >= MIN_SEGMENT_CHARS
+        untranslated = measurable & (np.array(identical) | english_mask(translations))
+        truncated = measurable & (ratio < min_ratio)
+
+        for idx in np.flatnonzero(untranslated | truncated):
+            entry = flags[keys[idx]]
+            entry['reasons'].add('untranslated' if untranslated[idx] else 'truncated')
+            if segment_ids[idx] >= 0:
+                entry['segments'].append(segment_ids[idx])
+        for idx in np.flatnonzero(np.array(segment_ids) == -1):
+            flags[keys[idx]]['ratio'] = round(float(ratio[idx]), 2)
+
+    return [dict(entry, reasons=sorted(entry['reasons']), segments=sorted(set(entry['segments'])))
+            for entry in flags.values() if entry['reasons']]
+
+
+def check_corpus(target_path: Path, min_ratio: float = MIN_LENGTH_RATIO,
+                 documents: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Verifica os modelos da pasta de destino (ou só os `documents` informados),
+    ignorando os trechos do QUALITY_ALLOWLIST_FILE da pasta
+    """
+    loaded = []
+    for output, path in iter_models(target_path):
+        if documents is None or output.as_posix() in documents:
+            loaded.append((output.as_posix(), load_document(path)))
+    return check_documents(loaded, min_ratio, load_allowlist(Path(target_path) / QUALITY_ALLOWLIST_FILE))
+
+
+def write_report(flags: List[Dict], path: Path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'flagged_pages': len(flags), 'pages': flags}, f, indent=2, ensure_ascii=False)
+
+
+def print_report(flags: List[Dict], limit: int = 20):
+    if not flags:
+        print("✅ Nenhuma tradução suspeita")
+        return
+    counts = {}
+    for entry in flags:
+        for reason in entry['reasons']:
+            counts[reason] = counts.get(reason, 0) + 1
+    documents = len({entry['document'] for entry in flags})
+    print(f"⚠️  {len(flags)} páginas suspeitas em {documents} documentos: "
+          + ", ".join(f"{reason} {count}" for reason, count in sorted(counts.items())))
+    for entry in flags[:limit]:
+        ratio = f" (razão {entry['ratio']})" if entry['ratio'] is not None else ""
+        lines = f", linhas {entry['segments'][:5]}" if entry['segments'] else ""
+        print(f"  {entry['document']} p.{entry['page']}: {', '.join(entry['reasons'])}{ratio}{lines}")
+    if len(flags) > limit:
+        print(f"  ... e mais {len(flags) - limit}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aponta traduções que ficaram em inglês ou foram cortadas")
+    parser.add_argument('--output-dir', default="PDF_Markdown_PT", help="Pasta de saída da conversão")
+    parser.add_argument('--min-ratio', type=float, default=MIN_LENGTH_RATIO,
+                        help="Razão mínima entre o tamanho da tradução e o do original")
+    parser.add_argument('--report', default=None,
+                        help=f"Arquivo JSON do relatório (padrão: {QUALITY_REPORT_FILE} na pasta de saída)")
+    args = parser.parse_args()
+
+    target_path = Path(args.output_dir)
+    if not (target_path / MODEL_DIR).exists():
+        print(f"❌ Nenhum modelo em {target_path / MODEL_DIR}")
+        sys.exit(1)
+
+    flags = check_corpus(target_path, args.min_ratio)
+    report = Path(args.report) if args.report else target_path / QUALITY_REPORT_FILE
+    write_report(flags, report)
+    print_report(flags)
+    print(f"📋 Relatório: {report}")
+    if flags:
+        print("💡 Use 'tunel-docs translate --retranslate-flagged' para traduzir essas páginas de novo")
+        print(f"💡 Trechos que devem ficar iguais ao original podem ir em {target_path / QUALITY_ALLOWLIST_FILE}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
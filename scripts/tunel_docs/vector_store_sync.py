@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Sincronização incremental do Vector Store da OpenAI com a árvore de Markdown
+Envia apenas arquivos novos ou alterados e remove do store os que sumiram
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from tunel_docs.openai_upload import file_hash, upload_files
+
+
+def vector_stores(client):
+    """API de Vector Stores do cliente: `client.vector_stores` (openai>=1.66) ou `client.beta.vector_stores`"""
+    stores = getattr(client, 'vector_stores', None)
+    return stores if stores is not None else client.beta.vector_stores
+
+
+def diff_files(markdown_dir: Path, saved_files: List[Dict]) -> Dict[str, List]:
+    """
+    Compara a árvore local com os arquivos registrados na configuração
+
+    Returns:
+        Dicionário com 'new' e 'changed' (caminhos locais), 'unchanged',
+        'pending' (enviados mas ainda não indexados), 'stale' (entradas
+        antigas dos alterados) e 'removed' (entradas salvas)
+    """
+    markdown_dir = Path(markdown_dir)
+    saved = {entry['filename']: entry for entry in saved_files}
+    result = {'new': [], 'changed': [], 'unchanged': [], 'pending': [], 'stale': [], 'removed': []}
+
+    local = {}
+    for path in sorted(markdown_dir.rglob('*.md')):
+        local[str(path.relative_to(markdown_dir))] = path
+
+    for relative_path, path in local.items():
+        entry = saved.get(relative_path)
+        if entry is None:
+            result['new'].append(path)
+        elif entry.get('hash') != file_hash(path):
+            result['changed'].append(path)
+            result['stale'].append(entry)
+        elif entry.get('pending_ingest'):
+            result['pending'].append(entry)
+        else:
+            result['unchanged'].append(entry)
+
+    result['removed'] = [entry for name, entry in saved.items() if name not in local]
+    return result
+
+
+def _wait_for_batch(client, vector_store_id: str, batch, poll_interval: float, timeout: float):
+    """Consulta o lote até que saia de 'in_progress' ou o tempo acabe"""
+    deadline = time.monotonic() + timeout
+    while batch.status == 'in_progress' and time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        batch = vector_stores(client).file_batches.retrieve(
+            batch_id=batch.id, vector_store_id=vector_store_id
+        )
+    return batch
+
+
+def _file_ids(client, vector_store_id: str, batch, status: str) -> List[str]:
+    """IDs dos arquivos do lote com o status informado ('failed', 'in_progress' ou 'cancelled')"""
+    if not getattr(batch.file_counts, status):
+        return []
+    files = vector_stores(client).file_batches.list_files(
+        batch_id=batch.id, vector_store_id=vector_store_id, filter=status
+    )
+    return [f.id for f in files]
+
+
+def ingest_files(client, vector_store_id: str, file_ids: List[str], batch_size: int = 100,
+                 workers: int = 4, poll_interval: float = 2.0, timeout: float = 1800,
+                 max_resubmits: int = 2) -> Dict:
+    """
+    Anexa arquivos ao Vector Store em lotes, acompanhando a indexação
+
+    Os lotes são criados e consultados em paralelo; arquivos que falharem
+    são reenviados até `max_resubmits` vezes. Arquivos de um lote que ainda
+    estava em andamento ao fim do `timeout` (ou foi cancelado) não contam como
+    concluídos: vão para 'pending_ids'.
+
+    Returns:
+        Resumo com contagens 'completed', 'failed', 'in_progress', 'cancelled',
+        'failed_ids' e 'pending_ids'
+    """
+    summary = {'completed': 0, 'failed': 0, 'in_progress': 0, 'cancelled': 0,
+               'failed_ids': [], 'pending_ids': []}
+    pending = list(file_ids)
+    attempt = 0
+
+    while pending:
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        print(f"  📦 Enviando {len(pending)} arquivos em {len(batches)} lote(s) de até {batch_size}"
+              + (f" (reenvio {attempt})" if attempt else ""))
+
+        def run_batch(ids):
+            batch = vector_stores(client).file_batches.create(
+                vector_store_id=vector_store_id, file_ids=ids
+            )
+            batch = _wait_for_batch(client, vector_store_id, batch, poll_interval, timeout)
+            unfinished = (_file_ids(client, vector_store_id, batch, 'in_progress')
+                          + _file_ids(client, vector_store_id, batch, 'cancelled'))
+            return batch, _file_ids(client, vector_store_id, batch, 'failed'), unfinished
+
+        failed_ids = []
+        round_counts = {'completed': 0, 'in_progress': 0, 'cancelled': 0}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch, batch_failed, batch_unfinished in executor.map(run_batch, batches):
+                counts = batch.file_counts
+                round_counts['completed'] += counts.completed
+                round_counts['in_progress'] += counts.in_progress
+                round_counts['cancelled'] += counts.cancelled
+                failed_ids.extend(batch_failed)
+                summary['pending_ids'].extend(batch_unfinished)
+                print(f"    {batch.id}: {batch.status} - {counts.completed} ok, "
+                      f"{counts.failed} falhas, {counts.in_progress} em andamento")
+
+        for key, value in round_counts.items():
+            summary[key] += value
+
+        if not failed_ids or attempt >= max_resubmits:
+            summary['failed'] = len(failed_ids)
+            summary['failed_ids'] = failed_ids
+            break
+
+        # Remove a associação com falha antes de reenviar o mesmo arquivo
+        for file_id in failed_ids:
+            try:
+                vector_stores(client).files.delete(vector_store_id=vector_store_id, file_id=file_id)
+            except Exception:
+                pass
+        pending = failed_ids
+        attempt += 1
+
+    print(f"  📊 Indexação: {summary['completed']} concluídos, {summary['failed']} com falha, "
+          f"{summary['in_progress']} em andamento")
+    return summary
+
+
+def detach_files(client, vector_store_id: str, entries: List[Dict]):
+    """Remove arquivos do Vector Store e apaga o arquivo enviado"""
+    for entry in entries:
+        try:
+            vector_stores(client).files.delete(vector_store_id=vector_store_id, file_id=entry['id'])
+        except Exception as e:
+            print(f"  ⚠️  Não foi possível desanexar {entry['filename']}: {e}")
+        try:
+            client.files.delete(entry['id'])
+        except Exception as e:
+            print(f"  ⚠️  Não foi possível apagar {entry['filename']}: {e}")
+        print(f"  🗑️  Removido: {entry['filename']}")
+
+
+def _replaced_ids(entry: Optional[Dict]) -> List[str]:
+    """IDs a apagar quando a nova versão do arquivo estiver indexada"""
+    if entry is None:
+        return []
+    return [entry['id']] + entry.get('replaces', [])
+
+
+def sync_vector_store(client, markdown_dir: Path, vector_store_id: str,
+                      saved_files: List[Dict], workers: int = 8,
+                      on_progress: Optional[Callable[[List[Dict]], None]] = None,
+                      **ingest_options) -> List[Dict]:
+    """
+    Sincroniza o Vector Store existente com a árvore local
+
+    Os arquivos enviados são registrados (via `on_progress`) antes da
+    indexação, marcados como pendentes e com os IDs que substituem: se a
+    indexação falhar, a próxima sincronização só reindexa, sem reenviar.
+
+    Args:
+        client: Cliente OpenAI (ou um falso compatível, nos testes)
+        markdown_dir: Raiz da árvore de Markdown
+        vector_store_id: ID do Vector Store existente
+        saved_files: Entradas salvas em .openai_config.json
+        workers: Uploads em paralelo
+        on_progress: Chamado com as entradas a gravar antes de indexar
+        ingest_options: Repassados a `ingest_files` (batch_size, poll_interval...)
+
+    Returns:
+        Nova lista de entradas para gravar na configuração
+    """
+    changes = diff_files(markdown_dir, saved_files)
+    print(f"🔄 Sincronização: {len(changes['new'])} novos, {len(changes['changed'])} alterados, "
+          f"{len(changes['removed'])} removidos, {len(changes['unchanged'])} inalterados"
+          + (f", {len(changes['pending'])} pendentes de indexação" if changes['pending'] else ""))
+
+    to_upload = changes['new'] + changes['changed']
+    uploaded = []
+    if to_upload:
+        uploaded = upload_files(client, markdown_dir, workers=workers, files=to_upload)
+
+    # Só descarta a versão antiga dos alterados que foram reenviados com sucesso
+    stale = {entry['filename']: entry for entry in changes['stale']}
+    uploaded_names = {entry['filename'] for entry in uploaded}
+    kept_stale = [entry for name, entry in stale.items() if name not in uploaded_names]
+    pending = changes['pending'] + [
+        dict(entry, pending_ingest=True, replaces=_replaced_ids(stale.get(entry['filename'])))
+        for entry in uploaded
+    ]
+
+    def entries(pending_entries):
+        return sorted(changes['unchanged'] + kept_stale + pending_entries,
+                      key=lambda entry: entry['filename'])
+
+    if on_progress and pending:
+        # Removidos continuam registrados até serem de fato apagados
+        on_progress(entries(pending) + changes['removed'])
+
+    unfinished = set()
+    if pending:
+        summary = ingest_files(client, vector_store_id, [entry['id'] for entry in pending], **ingest_options)
+        # Os que falharam ou não terminaram a tempo continuam pendentes para a
+        # próxima sincronização, e a versão antiga segue no store até lá
+        unfinished = set(summary['failed_ids']) | set(summary['pending_ids'])
+
+    done = []
+    to_detach = list(changes['removed'])
+    for entry in pending:
+        if entry['id'] in unfinished:
+            done.append(entry)
+            continue
+        to_detach.extend({'id': file_id, 'filename': entry['filename']} for file_id in entry.get('replaces', []))
+        done.append({key: value for key, value in entry.items() if key not in ('pending_ingest', 'replaces')})
+    detach_files(client, vector_store_id, to_detach)
+
+    return entries(done)
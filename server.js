@@ -3,6 +3,7 @@ import cors from 'cors';
 import dotenv from 'dotenv';
 import { OpenAI } from 'openai';
 import fs from 'fs/promises';
+import crypto from 'crypto';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import openaiChatRouter from './server/openai-chat.js';
@@ -83,10 +84,18 @@ let documentEmbeddings = new Map();
 async function loadDocuments() {
   try {
     const docsPath = path.join(__dirname, 'PDF_Markdown_Traduzido');
-    const files = await fs.readdir(docsPath);
     
     documentsCache = [];
     
+    // Chunks pré-computados por scripts/tunel_docs/chunk_store.py (com página e títulos)
+    if (await loadChunkStore(path.join(docsPath, 'chunks.jsonl'))) {
+      console.log(`Carregados ${documentsCache.length} chunks do chunk store`);
+      await loadEmbeddingIndex();
+      return;
+    }
+    
+    const files = await fs.readdir(docsPath);
+    
     for (const file of files) {
       if (file.endsWith('.md')) {
         const filePath = path.join(docsPath, file);
@@ -107,11 +116,83 @@ async function loadDocuments() {
     }
     
     console.log(`Carregados ${documentsCache.length} chunks de documentos`);
+    await loadEmbeddingIndex();
   } catch (error) {
     console.error('Erro ao carregar documentos:', error);
   }
 }
 
+// Carrega o chunk store; retorna false se ele não existir
+async function loadChunkStore(storePath) {
+  let data;
+  try {
+    data = await fs.readFile(storePath, 'utf-8');
+  } catch (error) {
+    if (error.code === 'ENOENT') return false;
+    throw error;
+  }
+  for (const line of data.split('\n')) {
+    if (!line.trim()) continue;
+    const chunk = JSON.parse(line);
+    documentsCache.push({
+      id: chunk.id,
+      title: chunk.title,
+      content: chunk.content,
+      file: chunk.file,
+      page: chunk.page,
+      headingPath: chunk.heading_path,
+      sourcePdf: chunk.source_pdf
+    });
+  }
+  return true;
+}
+
+// Lê uma matriz float32 no formato .npy (gerada por scripts/tunel_docs/build_embedding_index.py)
+function parseNpy(buffer) {
+  const headerLength = buffer.readUInt16LE(8);
+  const header = buffer.toString('latin1', 10, 10 + headerLength);
+  if (!header.includes("'descr': '<f4'") || header.includes("'fortran_order': True")) {
+    throw new Error('Formato .npy não suportado: ' + header);
+  }
+  const [rows, cols] = header.match(/'shape': \((\d+), (\d+)\)/).slice(1).map(Number);
+  const offset = 10 + headerLength;
+  // Copia para um ArrayBuffer alinhado antes de criar a visão float32
+  const data = buffer.buffer.slice(buffer.byteOffset + offset, buffer.byteOffset + offset + rows * cols * 4);
+  return { rows, cols, data: new Float32Array(data) };
+}
+
+// Carrega embeddings pré-computados para não chamar a API a cada chunk
+async function loadEmbeddingIndex() {
+  const indexPath = path.join(__dirname, 'embedding_index');
+  try {
+    const meta = JSON.parse(await fs.readFile(path.join(indexPath, 'embeddings_meta.json'), 'utf-8'));
+    // As consultas usam a API da OpenAI; vetores de backends locais não são comparáveis
+    const backend = meta.backend || 'openai';
+    if (backend !== 'openai' || meta.model !== 'text-embedding-3-small') {
+      console.log(`Índice de embeddings ignorado (${backend}/${meta.model} difere do usado nas consultas)`);
+      return;
+    }
+    const matrix = parseNpy(await fs.readFile(path.join(indexPath, 'embeddings.npy')));
+    const byId = new Map(meta.chunks.map(chunk => [chunk.id, chunk]));
+
+    let loaded = 0;
+    for (const doc of documentsCache) {
+      const entry = byId.get(doc.id);
+      if (!entry) continue;
+      // Só usa o vetor se o conteúdo do chunk não mudou desde a indexação
+      const hash = crypto.createHash('sha1').update(doc.content).digest('hex');
+      if (hash !== entry.hash) continue;
+      documentEmbeddings.set(doc.id, matrix.data.subarray(entry.row * matrix.cols, (entry.row + 1) * matrix.cols));
+      loaded++;
+    }
+    console.log(`Índice de embeddings: ${loaded}/${documentsCache.length} chunks carregados`);
+  } catch (error) {
+    if (error.code !== 'ENOENT') {
+      console.error('Erro ao carregar índice de embeddings:', error);
+    }
+  }
+}
+
 // Função para dividir texto em chunks
 function splitIntoChunks(text, maxLength) {
   const chunks = [];
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Fixtures compartilhadas: PDFs gerados na hora e a conversão com o backend local
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+
+@pytest.fixture
+def make_png():
+    """make_png(tamanho, cor) -> PNG quadrado de uma cor só"""
+    fitz = pytest.importorskip('fitz')
+
+    def make(size: int, color) -> bytes:
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, size, size), False)
+        pixmap.set_rect(pixmap.irect, color)
+        return pixmap.tobytes('png')
+    return make
+
+
+@pytest.fixture
+def make_pdf():
+    """
+    make_pdf(caminho, páginas, imagens) -> PDF com um texto por página
+    (texto vazio: página em branco) e as mesmas imagens (retângulo, PNG) em todas
+    """
+    fitz = pytest.importorskip('fitz')
+
+    def make(path: Path, pages, images=()) -> Path:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        doc = fitz.open()
+        for text in pages:
+            page = doc.new_page()
+            if text:
+                page.insert_text((56, 72), text, fontsize=11)
+            for rect, png in images:
+                page.insert_image(fitz.Rect(*rect), stream=png)
+        doc.save(str(path))
+        doc.close()
+        return Path(path)
+    return make
+
+
+@pytest.fixture
+def convert():
+    """convert(pdf, pasta de saída, saída .md, **opções) -> modelo gravado (backend stub)"""
+    from tunel_docs.convert_all_pdfs import pdf_to_markdown
+    from tunel_docs.document_model import model_path
+
+    def run(pdf: Path, out: Path, output=Path('contrato.md'), **options) -> Path:
+        output = Path(output)
+        (out / output).parent.mkdir(parents=True, exist_ok=True)
+        model = model_path(out, output)
+        assert pdf_to_markdown(str(pdf), str(out / output), backend='stub', model_file=str(model), **options)
+        return model
+    return run
+
+
+@pytest.fixture
+def markdown_docs(tmp_path) -> Path:
+    """Pasta tmp_path/docs com dois documentos traduzidos pequenos"""
+    docs_dir = tmp_path / 'docs'
+    docs_dir.mkdir()
+    (docs_dir / 'edital.md').write_text(
+        "# Edital\n\nA concessionária executará as obras do túnel imerso.\n\n"
+        "O prazo de concessão é de trinta anos.", encoding='utf-8')
+    (docs_dir / 'licenca.md').write_text(
+        "# Licença\n\nA licença ambiental prévia foi emitida pela CETESB.", encoding='utf-8')
+    return docs_dir
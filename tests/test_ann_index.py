@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Testes do índice aproximado (IVF) e do seu uso na busca
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.ann_index import IVFIndex, synthetic_matrix
+from tunel_docs.build_embedding_index import build_index
+from tunel_docs.search_index import SearchIndex, top_k
+
+
+def test_ivf_with_all_lists_matches_exact_search():
+    matrix = synthetic_matrix(2000, 32, clusters=16)
+    ivf = IVFIndex.train(matrix, 'fp', nlist=16)
+    ivf.nprobe = 16
+    vector = matrix[3]
+    exact = top_k(matrix @ vector, 10)
+    assert np.array_equal(ivf.search(matrix, vector, 10), exact)
+
+
+def test_search_index_uses_ann_only_for_current_matrix(tmp_path, markdown_docs):
+    docs_dir = markdown_docs
+    index_dir = tmp_path / 'index'
+    build_index(docs_dir, index_dir, backend='hashing', ann='ivf')
+    assert SearchIndex(index_dir).ann is not None
+    assert SearchIndex(index_dir, exact=True).ann is None
+
+    # Depois de mudar o corpus sem --ann, o IVF antigo não vale mais
+    (docs_dir / 'contrato.md').write_text("# Contrato\n\nCláusulas do contrato.", encoding='utf-8')
+    build_index(docs_dir, index_dir, backend='hashing')
+    assert SearchIndex(index_dir).ann is None
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Teste de fumaça do benchmark do pipeline sobre um corpus sintético pequeno
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pytest.importorskip('fitz')
+
+from tunel_docs.benchmark_pipeline import compare, latest_results, run_benchmark, save_results
+from tunel_docs.pipeline_profiler import STAGES
+from tunel_docs.synthetic_corpus import PROFILES, generate_corpus
+
+
+def test_synthetic_corpus_is_reused(tmp_path):
+    paths = generate_corpus(tmp_path, documents=2)
+    assert [path.name for path in paths] == ['sintetico_000_pt_1p.pdf', 'sintetico_001_en_5p.pdf']
+    mtimes = [path.stat().st_mtime_ns for path in paths]
+    assert [path.stat().st_mtime_ns for path in generate_corpus(tmp_path, documents=2)] == mtimes
+
+
+def test_benchmark_runs_every_stage(tmp_path, capsys):
+    results = run_benchmark(tmp_path / 'corpus', documents=2)
+    corpus = results['corpus']
+    assert corpus['documents'] == 2
+    assert corpus['pages'] == PROFILES[0][0] + PROFILES[1][0]
+    assert corpus['english_pages'] == PROFILES[1][0]
+    assert set(results['stages']) == set(STAGES) - {'open', 'write'}
+    assert all(stage['pages'] for stage in results['stages'].values())
+    # Só as páginas em inglês são formatadas para tradução
+    stages = results['stages']
+    assert stages['format']['pages'] == stages['translate']['pages'] == PROFILES[1][0]
+    assert stages['detect']['pages'] == stages['render']['pages'] == corpus['pages']
+    assert stages['format']['mb'] < stages['detect']['mb']
+
+    path = save_results(results, tmp_path / 'results')
+    assert latest_results(tmp_path / 'results') == path
+    baseline = json.loads(path.read_text(encoding='utf-8'))
+    assert compare(results, baseline, threshold=0.15) == []
+    slower = dict(results, stages={name: dict(stage, pages_per_sec=stage['pages_per_sec'] / 2)
+                                   for name, stage in results['stages'].items()})
+    assert len(compare(slower, baseline, threshold=0.15)) == len(results['stages'])
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Testes do índice invertido BM25
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.bm25_index import BM25Index, tokenize
+
+
+def chunk(chunk_id, content):
+    return {'id': chunk_id, 'file': chunk_id.split('-')[0], 'title': chunk_id, 'hash': chunk_id,
+            'content': content}
+
+
+CHUNKS = [
+    chunk('edital.md-0', "As concessões do túnel imerso entre Santos e Guarujá."),
+    chunk('licenca.md-0', "A licença ambiental prévia do túnel foi emitida pela CETESB."),
+    chunk('licenca.md-1', "Licenças ambientais e condicionantes da licença de instalação."),
+    chunk('contrato.md-0', "O contrato de concessão tem prazo de trinta anos."),
+]
+
+
+def test_tokenize_folds_accents_stopwords_and_plurals():
+    assert tokenize("Os túneis") == tokenize("túnel")
+    assert tokenize("concessões") == tokenize("concessão")
+    assert tokenize("licenças ambientais") == tokenize("licença ambiental")
+    assert tokenize("de da do e a o") == []
+
+
+def test_search_ranks_by_bm25_and_intersects_terms():
+    index = BM25Index.build(CHUNKS)
+    results = index.search("licenças", k=3)
+    assert [r['id'] for r in results][:2] == ['licenca.md-1', 'licenca.md-0']
+    assert results[0]['score'] > results[1]['score']
+
+    both = index.search("licença túnel", k=5, require_all=True)
+    assert [r['id'] for r in both] == ['licenca.md-0']
+    assert index.search("inexistente") == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = BM25Index.build(CHUNKS)
+    index.save(tmp_path)
+    loaded = BM25Index.load(tmp_path)
+    assert loaded.vocabulary == index.vocabulary
+    assert loaded.search("concessão túnel") == index.search("concessão túnel")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Testes do chunker por títulos e páginas
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.build_embedding_index import load_chunks
+from tunel_docs.chunk_store import build_chunk_store, chunk_markdown
+
+DOCUMENT = """# 00_CONTRATO
+
+<!--
+  Documento convertido de PDF para Markdown
+-->
+
+
+## Página 1
+
+### CLÁUSULA PRIMEIRA
+O objeto é a concessão patrocinada para construção, operação e manutenção do túnel imerso
+entre Santos e Guarujá.
+
+### CLÁUSULA SEGUNDA
+""" + "\n\n".join(f"Parágrafo {i} sobre obrigações da concessionária." for i in range(30)) + """
+
+## Página 2
+
+*[Página sem texto ou contém apenas imagens]*
+
+## Página 3
+
+Prazo de trinta anos, contado da assinatura."""
+
+
+def test_chunks_follow_pages_and_headings():
+    chunks = chunk_markdown(DOCUMENT, '00_CONTRATO.md', max_chars=300, overlap=100)
+    raw = DOCUMENT.encode('utf-8')
+
+    assert all(c['source_pdf'] == '00_CONTRATO.pdf' for c in chunks)
+    # A página 2 só tem o marcador de página vazia
+    assert sorted({c['page'] for c in chunks}) == [1, 3]
+    assert chunks[0]['heading_path'] == ['CLÁUSULA PRIMEIRA']
+    assert chunks[1]['heading_path'] == ['CLÁUSULA SEGUNDA']
+    assert chunks[1]['content'].startswith('### CLÁUSULA SEGUNDA')
+    assert chunks[-1]['content'] == "Prazo de trinta anos, contado da assinatura."
+
+    for chunk in chunks:
+        assert raw[chunk['start_byte']:chunk['end_byte']].decode('utf-8') == chunk['content']
+        assert len(chunk['content']) <= 300
+
+    # Chunks consecutivos do mesmo trecho se sobrepõem
+    second, third = chunks[1]['content'], chunks[2]['content']
+    assert third.split('\n\n')[0] in second
+
+
+def test_consumers_load_the_chunk_store(tmp_path):
+    (tmp_path / '00_CONTRATO.md').write_text(DOCUMENT, encoding='utf-8')
+    split = load_chunks(tmp_path)
+    build_chunk_store(tmp_path, max_chars=300)
+    stored = load_chunks(tmp_path)
+    assert stored != split
+    assert stored[0]['page'] == 1
+    assert [c['id'] for c in stored] == [f"00_CONTRATO.md-{i}" for i in range(len(stored))]
+
+
+def test_subfolders_are_chunked_with_relative_ids(tmp_path):
+    (tmp_path / 'anexos').mkdir()
+    (tmp_path / '00_CONTRATO.md').write_text(DOCUMENT, encoding='utf-8')
+    (tmp_path / 'anexos' / 'anexo_1.md').write_text(DOCUMENT, encoding='utf-8')
+
+    split = load_chunks(tmp_path)
+    assert {c['file'] for c in split} == {'00_CONTRATO.md', 'anexos/anexo_1.md'}
+    assert 'anexos/anexo_1.md-0' in {c['id'] for c in split}
+
+    build_chunk_store(tmp_path, max_chars=300)
+    stored = load_chunks(tmp_path)
+    assert {c['file'] for c in stored} == {'00_CONTRATO.md', 'anexos/anexo_1.md'}
+    assert 'anexos/anexo_1.md-0' in {c['id'] for c in stored}
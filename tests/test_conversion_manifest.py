@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Testes do manifesto de conversão com nomes normalizados
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.conversion_manifest import ConversionManifest
+
+
+def test_outputs_are_normalized_unique_and_stable(tmp_path):
+    source = Path('PDF')
+    manifest = ConversionManifest.load(tmp_path / 'manifest.json')
+
+    edital = manifest.assign(source / 'Licitação' / 'Edital Final.pdf', source)
+    duplicate = manifest.assign(source / 'Licitação' / 'EDITAL-FINAL.pdf', source)
+    assert edital == Path('licitacao/edital_final.md')
+    # normalize_name mantém hífens; a colisão só acontece com o mesmo nome normalizado
+    assert duplicate == Path('licitacao/edital-final.md')
+    clash = manifest.assign(source / 'Licitação' / 'edital final.pdf', source)
+    assert clash == Path('licitacao/edital_final_1.md')
+
+    manifest.record(source / 'Licitação' / 'Edital Final.pdf', source='Licitação/Edital Final.pdf')
+    manifest.save()
+
+    reloaded = ConversionManifest.load(tmp_path / 'manifest.json')
+    assert reloaded.assign(source / 'Licitação' / 'edital final.pdf', source) == clash
+    assert reloaded.original_names()['licitacao/edital_final.md'] == 'Edital Final.pdf'
+    assert reloaded.get(source / 'Licitação' / 'Edital Final.pdf')['source'] == 'Licitação/Edital Final.pdf'
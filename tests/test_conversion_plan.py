@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Testes do planejamento da conversão e do orçamento com vários workers
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.convert_all_pdfs import (convert_all_pdfs, count_chunks, get_ledger_file, get_memory_file,
+                                         plan_conversion, translate_chunks)
+from tunel_docs.cost_ledger import PRICES
+from tunel_docs.translation_backends import StubBackend
+from tunel_docs.translation_memory import TranslationMemory
+
+
+class CountingBackend(StubBackend):
+    def __init__(self):
+        super().__init__()
+        self.requests = 0
+
+    def translate(self, text):
+        self.requests += 1
+        return super().translate(text)
+
+
+@pytest.fixture
+def make_pdfs(make_pdf):
+    """make_pdfs(pasta, quantidade): PDFs de uma página em inglês, com o mesmo tamanho de texto"""
+    def make(folder: Path, count: int):
+        for n in range(count):
+            make_pdf(folder / f"doc_{n}.pdf",
+                     [f"The concessionaire shall build the tunnel number {n} and the parties\n"
+                      f"agree to the terms of this contract for the concession period."])
+    return make
+
+
+@pytest.mark.parametrize('text', [
+    "a" * 10,
+    "\n".join(["x" * 30] * 10),
+    "\n" + "y" * 50 + "\n\n" + "z" * 50,
+    "\n".join(["w" * 80, "", "v" * 80, "u" * 10]),
+])
+def test_count_chunks_matches_translate_chunks(text, monkeypatch):
+    monkeypatch.setattr('tunel_docs.convert_all_pdfs.time.sleep', lambda seconds: None)
+    backend = CountingBackend()
+    translate_chunks(backend, text, max_chunk_size=60)
+    assert count_chunks(text, 60) == backend.requests
+    assert count_chunks("", 60) == 0
+
+
+def test_plan_skips_paragraphs_in_memory(tmp_path, monkeypatch, make_pdfs):
+    monkeypatch.chdir(tmp_path)
+    make_pdfs(tmp_path / 'PDF', 2)
+    pdfs = sorted((tmp_path / 'PDF').glob('*.pdf'))
+    totals = plan_conversion(pdfs, backend='stub', workers=2)
+    assert (totals['pages'], totals['en_pages'], totals['chunks']) == (2, 2, 2)
+    full = totals['new_chars']
+
+    # Uma linha igual nos dois documentos não basta: a memória guarda parágrafos
+    paragraph = ("The concessionaire shall build the tunnel number 0 and the parties "
+                 "agree to the terms of this contract for the concession period.")
+    memory = TranslationMemory(get_memory_file())
+    memory.add("agree to the terms of this contract for the concession period.",
+               "concordam com os termos deste contrato pelo período da concessão.")
+    # Quebrado em outra linha no PDF, o parágrafo continua o mesmo
+    memory.add(paragraph, "A concessionária deverá construir o túnel número 0 e as partes "
+                          "concordam com os termos deste contrato pelo período da concessão.")
+    memory.save()
+    totals = plan_conversion(pdfs, backend='stub', workers=2)
+    assert totals['new_chars'] == full - len(paragraph)
+    assert totals['chunks'] == 1
+    assert totals['cost'] == 0.0
+
+
+def test_budget_counts_documents_in_flight(tmp_path, monkeypatch, make_pdfs):
+    monkeypatch.chdir(tmp_path)
+    make_pdfs(tmp_path / 'PDF', 6)
+    # Stub cobrado por caractere para o orçamento ter efeito
+    monkeypatch.setitem(PRICES, 'stub', {'characters': 1000.0})
+    monkeypatch.setattr(StubBackend, 'latency', 0.05)
+    document_cost = len(
+        "The concessionaire shall build the tunnel number 0 and the parties\n"
+        "agree to the terms of this contract for the concession period.") / 1000
+
+    # Os dois primeiros documentos saem antes de haver média; depois disso,
+    # um terceiro (com o outro ainda em andamento) passaria do orçamento
+    budget = 2.5 * document_cost
+    convert_all_pdfs(backend='stub', budget=budget, workers=2,
+                     source_dir=str(tmp_path / 'PDF'), target_dir=str(tmp_path / 'out'))
+    run = json.loads(get_ledger_file(tmp_path / 'out').read_text(encoding='utf-8'))['runs'][-1]
+    assert len(run['documents']) == 2
+    assert run['run']['cost_usd'] <= budget
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Testes da exportação colunar do corpus e das estatísticas
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+pytest.importorskip('pyarrow')
+
+from tunel_docs.corpus_export import corpus_stats, export_corpus, load_corpus, split_pages
+from tunel_docs.document_model import model_path, save_document
+
+EDITAL = """# 00_EDITAL
+
+<!--
+  Documento convertido de PDF para Markdown
+-->
+
+
+## Página 1
+
+### OBJETO
+Concessão patrocinada do túnel imerso entre Santos e Guarujá.
+
+## Página 2
+
+*[Página sem texto ou contém apenas imagens]*"""
+
+NOTICE = """# Tender Notice
+
+## Página 1
+
+O concessionário deverá construir o túnel conforme o contrato de concessão."""
+
+
+def make_docs(root: Path) -> Path:
+    (root / 'anexos').mkdir(parents=True)
+    (root / '00_EDITAL.md').write_text(EDITAL, encoding='utf-8')
+    (root / 'anexos' / 'tender_notice.md').write_text(NOTICE, encoding='utf-8')
+    # Só o aviso em inglês tem modelo (página traduzida)
+    save_document({'version': 1, 'pages': [{'number': 1, 'language': 'en', 'translation': 'x', 'blocks': []}]},
+                  model_path(root, Path('anexos/tender_notice.md')))
+    return root
+
+
+def test_split_pages():
+    assert [number for number, _ in split_pages(EDITAL)] == [1, 2]
+    assert list(split_pages(NOTICE))[0][1].startswith('O concessionário')
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_export_load_and_stats(tmp_path, fmt):
+    docs = make_docs(tmp_path / 'docs')
+    corpus = export_corpus(docs, tmp_path / 'corpus', fmt=fmt)
+
+    pages = load_corpus(corpus, 'pages').to_pylist()
+    assert [(p['document'], p['page'], p['language'], p['translated'], p['chars'] > 0) for p in pages] == [
+        ('00_EDITAL.md', 1, 'pt', None, True),
+        ('00_EDITAL.md', 2, None, None, False),
+        ('anexos/tender_notice.md', 1, 'en', True, True),
+    ]
+    chunks = load_corpus(corpus, 'chunks', ['document', 'page', 'heading_path', 'translated'])
+    assert chunks.column_names == ['document', 'page', 'heading_path', 'translated']
+    assert chunks.to_pylist()[0]['heading_path'] == ['OBJETO']
+
+    stats = corpus_stats(corpus)
+    assert (stats['documents'], stats['pages'], stats['empty_pages']) == (2, 3, 1)
+    assert stats['pages_per_document'] == {'min': 1, 'mean': 1.5, 'max': 2}
+    assert stats['english_pages'] == 1 and stats['translation_coverage'] == 1.0
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Testes do livro-razão de custo e dos backends de tradução
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.conversion_manifest import MANIFEST_FILE
+from tunel_docs.convert_all_pdfs import LEDGER_FILE, convert_all_pdfs, get_ledger_file
+from tunel_docs.cost_ledger import CostLedger, estimate_cost, percentile
+from tunel_docs import translation_backends
+from tunel_docs.translation_backends import OpenAIBackend, StubBackend, create_backend
+
+
+def test_percentiles_use_nearest_rank():
+    latencies = [0.1 * n for n in range(1, 11)]
+    assert percentile([], 50) == 0.0
+    assert percentile(latencies, 50) == latencies[4]
+    assert percentile(latencies, 90) == latencies[8]
+    assert percentile(latencies, 99) == latencies[9]
+
+
+def test_report_groups_usage_by_document_and_backend(tmp_path):
+    ledger = CostLedger(tmp_path / 'ledger.json')
+    for latency in (1.0, 2.0, 3.0):
+        ledger.record('a.pdf', 'openai', 'gpt-3.5-turbo', prompt_tokens=1000,
+                      completion_tokens=2000, characters=10, latency=latency)
+    ledger.record('b.pdf', 'stub', 'stub', characters=10, latency=0.5)
+    ledger.save()
+    ledger.save()
+
+    runs = json.loads((tmp_path / 'ledger.json').read_text(encoding='utf-8'))['runs']
+    assert len(runs) == 1
+    run = runs[0]
+    assert run['run']['requests'] == 4
+    assert (run['run']['latency_p50'], run['run']['latency_p99']) == (1.0, 3.0)
+    assert run['documents']['a.pdf']['cost_usd'] == round(3 * estimate_cost('gpt-3.5-turbo', 1000, 2000), 6)
+    assert run['documents']['b.pdf']['cost_usd'] == 0.0
+    assert set(run['backends']) == {'openai:gpt-3.5-turbo', 'stub:stub'}
+
+
+def test_budget_is_reached_before_the_next_average_document():
+    ledger = CostLedger(budget=0.01)
+    assert not ledger.budget_reached()
+    cost = estimate_cost('gpt-3.5-turbo', 2000, 2000)
+    ledger.record('a.pdf', 'openai', 'gpt-3.5-turbo', prompt_tokens=2000, completion_tokens=2000)
+    # Gasto 0.004; mais um documento médio fica abaixo do orçamento
+    assert ledger.projected_cost() == 2 * cost and not ledger.budget_reached()
+    ledger.record('b.pdf', 'openai', 'gpt-3.5-turbo', prompt_tokens=2000, completion_tokens=2000)
+    assert ledger.budget_reached()
+    assert not CostLedger().budget_reached()
+
+
+def test_stub_backend_records_usage():
+    ledger = CostLedger()
+    backend = create_backend('stub', ledger=ledger, document='a.pdf')
+    assert isinstance(backend, StubBackend)
+    assert backend.translate("The tunnel and the port") == "o túnel e o porto"
+    assert ledger.summary()['backends']['stub:stub']['characters'] == len("The tunnel and the port")
+
+
+def test_openai_usage_is_recorded_with_the_backend_model(monkeypatch):
+    response = SimpleNamespace(
+        usage=SimpleNamespace(prompt_tokens=100, completion_tokens=50),
+        choices=[SimpleNamespace(finish_reason='stop', message=SimpleNamespace(content="o túnel"))])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response)))
+    monkeypatch.setattr(translation_backends, '_openai_client', client)
+
+    ledger = CostLedger()
+    assert OpenAIBackend(ledger=ledger, document='a.pdf').translate("the tunnel") == "o túnel"
+    usage = ledger.summary()['backends'][f"openai:{OpenAIBackend.model}"]
+    assert usage['requests'] == 1
+    assert usage['cost_usd'] == round(estimate_cost(OpenAIBackend.model, 100, 50), 6)
+
+
+def test_openai_truncated_response_fails_after_recording_usage(monkeypatch):
+    response = SimpleNamespace(
+        usage=SimpleNamespace(prompt_tokens=100, completion_tokens=4000),
+        choices=[SimpleNamespace(finish_reason='length', message=SimpleNamespace(content="meia tradução"))])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response)))
+    monkeypatch.setattr(translation_backends, '_openai_client', client)
+
+    ledger = CostLedger()
+    with pytest.raises(ValueError):
+        OpenAIBackend(ledger=ledger, document='a.pdf').translate("long text")
+    assert ledger.run.completion_tokens == 4000
+
+
+def test_openai_backend_reads_the_key_from_env_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / '.env').write_text("OPENAI_API_KEY=sk-do-env\n", encoding='utf-8')
+    monkeypatch.setattr(os, 'environ', {k: v for k, v in os.environ.items() if k != 'OPENAI_API_KEY'})
+    monkeypatch.setitem(sys.modules, 'openai', SimpleNamespace(OpenAI=lambda api_key: SimpleNamespace(key=api_key)))
+    monkeypatch.setattr(translation_backends, '_openai_client', None)
+    assert OpenAIBackend()._client.key == 'sk-do-env'
+
+
+def test_ledger_is_kept_next_to_the_manifest(tmp_path, monkeypatch, make_pdf):
+    monkeypatch.chdir(tmp_path)
+    make_pdf(tmp_path / 'PDF' / 'a.pdf', ["The tunnel of the port and the city is here for all of the works"])
+    convert_all_pdfs(backend='stub', source_dir='PDF', target_dir='out')
+    assert get_ledger_file(Path('out')) == Path('out') / LEDGER_FILE
+    assert (tmp_path / 'out' / LEDGER_FILE).exists() and (tmp_path / 'out' / MANIFEST_FILE).exists()
+    assert not (tmp_path / LEDGER_FILE).exists()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Testes do modelo intermediário do documento (extração, serialização e renderização)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+fitz = pytest.importorskip('fitz')
+
+from tunel_docs.chunk_store import build_chunk_store, load_chunk_store
+from tunel_docs.conversion_manifest import ConversionManifest
+from tunel_docs.document_model import (extract_document, find_model, load_document, model_path, page_text,
+                                       provenance, render_all, render_markdown, save_document)
+
+EN_PAGE = ("CONCESSION AGREEMENT\nThe concessionaire shall build the tunnel and the parties agree\n"
+           "to the terms of this contract for the concession period.")
+PT_PAGE = "CLÁUSULA PRIMEIRA\nO objeto é a concessão patrocinada do túnel entre Santos e Guarujá."
+PAGES = (EN_PAGE, PT_PAGE, '')
+
+
+def test_extraction_matches_page_text_and_round_trips(tmp_path, make_pdf):
+    pdf = make_pdf(tmp_path / 'contrato.pdf', PAGES)
+    document = extract_document(str(pdf))
+
+    doc = fitz.open(str(pdf))
+    assert [page_text(page) for page in document['pages']] == [page.get_text() for page in doc]
+    doc.close()
+    assert [page['language'] for page in document['pages']] == ['en', 'pt', None]
+    line = document['pages'][0]['blocks'][0]['lines'][0]
+    assert line['text'] == 'CONCESSION AGREEMENT'
+    assert line['font'] and line['size'] == 11.0 and len(line['bbox']) == 4
+
+    path = model_path(tmp_path, Path('contrato.md'))
+    save_document(document, path)
+    assert find_model(tmp_path, Path('contrato.md')) == path
+    assert load_document(path) == document
+
+
+def test_conversion_reuses_model_and_rerenders_without_pdf(tmp_path, make_pdf, convert):
+    pdf = make_pdf(tmp_path / 'contrato.pdf', PAGES)
+    out = tmp_path / 'out'
+    model = convert(pdf, out)
+    first = (out / 'contrato.md').read_text(encoding='utf-8')
+    document = load_document(model)
+    assert document['pages'][0]['translation'] is not None
+    assert document['pages'][1]['translation'] is None
+    assert render_markdown(document) == first
+    assert '*[Página sem texto ou contém apenas imagens]*' in first
+
+    # Traduções gravadas no modelo são reaproveitadas
+    document['pages'][0]['translation'] = 'ACORDO DE CONCESSÃO'
+    save_document(document, model)
+    convert(pdf, out)
+    assert 'ACORDO DE CONCESSÃO' in (out / 'contrato.md').read_text(encoding='utf-8')
+
+    # Renderização e indexação sem o PDF
+    pdf.unlink()
+    (out / 'contrato.md').unlink()
+    assert render_all(out) == 1
+    chunks = load_chunk_store(build_chunk_store(out))
+    assert {(c['page'], c['language'], c['translated']) for c in chunks} == {(1, 'en', True), (2, 'pt', False)}
+
+
+def test_translation_provenance_and_bilingual_output(tmp_path, make_pdf, convert):
+    bilingual = tmp_path / 'bilingue' / 'contrato.md'
+    model = convert(make_pdf(tmp_path / 'contrato.pdf', PAGES), tmp_path, bilingual_path=str(bilingual))
+
+    pages = provenance(load_document(model))
+    assert [(p['page'], p['language'], p['translated'], p['backend']) for p in pages] == [
+        (1, 'en', True, 'stub:stub'), (2, 'pt', False, None), (3, None, False, None)]
+    assert pages[0]['translated_at']
+
+    text = bilingual.read_text(encoding='utf-8')
+    assert '| Original (en) | Tradução (pt) |' in text
+    # Título em negrito nas duas colunas; página em português fica como está
+    assert '| **CONCESSION AGREEMENT** |' in text
+    assert 'CLÁUSULA PRIMEIRA' in text and text.count('| --- | --- |') == 1
+    assert render_all(tmp_path, bilingual_dir=tmp_path / 'bilingue') == 1
+    assert bilingual.read_text(encoding='utf-8') == text
+
+
+def test_revised_pdf_retranslates_only_changed_pages(tmp_path, make_pdf, convert):
+    annex = "ANNEX\nThe tunnel works shall be delivered in the third year of the contract."
+    revised = "ANNEX\nThe tunnel works shall be delivered in the fourth year of the contract."
+    new_page = "ADDENDUM\nThe parties agree to extend the deadline for the works in the port."
+    pdf = make_pdf(tmp_path / 'edital.pdf', (EN_PAGE, annex, PT_PAGE))
+    manifest = ConversionManifest(tmp_path / 'manifest.json')
+    model = convert(pdf, tmp_path, 'edital.md', manifest=manifest)
+    document = load_document(model)
+    for page in document['pages'][:2]:
+        page['translation'] = f"REVISADA {page['number']}"
+    save_document(document, model)
+    hashes = manifest.get(pdf)['pages']
+    assert len(hashes) == 3 and 'changed_pages' not in manifest.get(pdf)
+
+    # Nova revisão: página inserida no início e o anexo alterado
+    make_pdf(pdf, (new_page, EN_PAGE, revised, PT_PAGE))
+    convert(pdf, tmp_path, 'edital.md', manifest=manifest)
+    pages = load_document(model)['pages']
+    assert pages[1]['translation'] == 'REVISADA 1'
+    assert pages[0]['translation'] and pages[2]['translation'] != 'REVISADA 2'
+    assert 'fourth' in pages[2]['translation'] and pages[2]['translation_backend'] == 'stub:stub'
+    entry = manifest.get(pdf)
+    assert entry['changed_pages'] == [1, 3]
+    assert entry['pages'][1] == hashes[0] and entry['pages'][3] == hashes[2]
+
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Testes dos backends locais de embedding e da troca de backend no índice
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.build_embedding_index import build_index, load_index
+from tunel_docs.embedding_backends import HashingEmbedder, embed_in_batches
+
+
+def test_hashing_embedder_is_deterministic_and_normalized():
+    embedder = HashingEmbedder('hashing-64')
+    vectors = embedder.embed(["túnel imerso", "tunel imerso", ""])
+    assert vectors.shape == (3, 64)
+    # Acentos são ignorados e o texto vazio vira o vetor nulo
+    assert np.allclose(vectors[0], vectors[1])
+    assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+    assert not vectors[2].any()
+
+
+def test_hashing_batches_match_single_texts_and_process_pool():
+    embedder = HashingEmbedder('hashing-64')
+    texts = ["túnel imerso túnel imerso", "", "prazo de concessão do túnel", "licença da CETESB"] * 3
+    vectors = embedder.embed(texts)
+    for text, vector in zip(texts, vectors):
+        assert np.allclose(embedder.embed([text])[0], vector)
+    assert np.allclose(embed_in_batches(embedder, texts, batch_size=5, workers=2), vectors)
+
+
+def test_build_index_reuses_vectors_and_rejects_other_backend(tmp_path, markdown_docs):
+    docs_dir = markdown_docs
+    index_dir = tmp_path / 'index'
+
+    meta = build_index(docs_dir, index_dir, batch_size=1, backend='hashing', workers=2)
+    assert meta['backend'] == 'hashing'
+    assert meta['dim'] == 512
+    _, matrix = load_index(index_dir)
+    first = np.array(matrix)
+
+    meta = build_index(docs_dir, index_dir, backend='hashing')
+    _, matrix = load_index(index_dir)
+    assert np.array_equal(first, matrix)
+
+    with pytest.raises(ValueError):
+        build_index(docs_dir, index_dir, backend='hashing', model='hashing-128')
+
+    meta = build_index(docs_dir, index_dir, backend='hashing', model='hashing-128', rebuild=True)
+    assert meta['model'] == 'hashing-128'
+    assert load_index(index_dir)[1].shape == (len(meta['chunks']), 128)
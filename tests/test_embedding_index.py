@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Testes do índice de embeddings com o backend local (sem rede)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs import build_embedding_index
+from tunel_docs.build_embedding_index import build_index, load_index, split_into_chunks
+
+
+def test_chunks_split_paragraphs_like_the_server():
+    text = "a" * 995 + "\n\n" + "bb" + "\n\n" + "😀"
+    # Como o String.length do JavaScript, o emoji conta duas unidades e não cabe
+    assert split_into_chunks(text, 1000) == ["a" * 995 + "\n\nbb", "😀"]
+    assert split_into_chunks("um\n\ndois", 1000) == ["um\n\ndois"]
+
+
+def test_rebuild_embeds_only_new_chunks(tmp_path, markdown_docs, monkeypatch):
+    index_dir = tmp_path / 'index'
+    embedded = []
+    original = build_embedding_index.embed_in_batches
+
+    def recording(embedder, texts, *args):
+        embedded.append(list(texts))
+        return original(embedder, texts, *args)
+    monkeypatch.setattr(build_embedding_index, 'embed_in_batches', recording)
+
+    meta = build_index(markdown_docs, index_dir, backend='hashing')
+    assert [chunk['id'] for chunk in meta['chunks']] == ['edital.md-0', 'licenca.md-0']
+    _, matrix = load_index(index_dir)
+    licenca = np.array(matrix[1])
+    del matrix
+
+    (markdown_docs / 'edital.md').write_text("# Edital\n\nTexto revisado do edital.", encoding='utf-8')
+    (markdown_docs / 'anexo.md').write_text("# Anexo\n\nCronograma das obras.", encoding='utf-8')
+    meta = build_index(markdown_docs, index_dir, backend='hashing')
+    assert sorted(embedded[-1]) == ["# Anexo\n\nCronograma das obras.", "# Edital\n\nTexto revisado do edital."]
+    rows = {chunk['id']: chunk['row'] for chunk in meta['chunks']}
+    assert sorted(rows) == ['anexo.md-0', 'edital.md-0', 'licenca.md-0']
+    _, matrix = load_index(index_dir)
+    assert np.allclose(matrix[rows['licenca.md-0']], licenca)
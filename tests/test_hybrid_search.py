@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Testes da busca híbrida (RRF) e da avaliação de recall
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.bm25_index import BM25Index
+from tunel_docs.build_embedding_index import build_index, load_chunks
+from tunel_docs.hybrid_search import HybridSearcher, evaluate, is_relevant, reciprocal_rank_fusion
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([['a', 'b', 'c'], ['b', 'd', 'a']], k=60)
+    assert [item for item, _ in fused] == ['b', 'a', 'd', 'c']
+    assert fused[0][1] == 1 / 62 + 1 / 61
+
+
+def test_is_relevant_matches_normalized_file_names():
+    result = {'id': 'AVISO-DE-LICITACAO-n_01.md-3', 'file': 'AVISO-DE-LICITACAO-n_01.md'}
+    assert is_relevant(result, 'aviso_de_licitacao')
+    assert is_relevant(result, 'AVISO-DE-LICITACAO-n_01.md-3')
+    assert not is_relevant(result, 'contrato')
+
+
+def test_hybrid_search_and_evaluation(tmp_path):
+    docs_dir = tmp_path / 'docs'
+    docs_dir.mkdir()
+    (docs_dir / '00_CONTRATO.md').write_text(
+        "# Contrato\n\nO prazo da concessão é de trinta anos.", encoding='utf-8')
+    (docs_dir / 'RIMA-TUNEL.md').write_text(
+        "# RIMA\n\nImpactos ambientais no estuário e medidas de mitigação.", encoding='utf-8')
+    build_index(docs_dir, tmp_path / 'vectors', backend='hashing')
+    BM25Index.build(load_chunks(docs_dir)).save(tmp_path / 'bm25')
+
+    searcher = HybridSearcher(tmp_path / 'bm25', tmp_path / 'vectors')
+    try:
+        results = searcher.search("prazo da concessão", k=2)
+        assert results[0]['file'] == '00_CONTRATO.md'
+        assert results[0]['bm25_rank'] == 1
+
+        questions = [{'question': "prazo da concessão", 'relevant': ['contrato']},
+                     {'question': "impactos ambientais", 'relevant': ['rima']}]
+        report = evaluate({'híbrida': searcher.search}, questions, ks=(1,))
+    finally:
+        searcher.close()
+    assert report['híbrida']['recall@1'] == 1.0
+    assert report['híbrida']['mrr'] == 1.0
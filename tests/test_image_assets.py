@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Testes da extração de imagens para a pasta de assets (deduplicação e links no Markdown)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.chunk_store import chunk_markdown
+from tunel_docs.convert_all_pdfs import convert_all_pdfs
+from tunel_docs.document_model import ASSETS_DIR, find_model, load_document
+from tunel_docs.image_assets import extract_assets
+
+PAGES = ("CLÁUSULA\nO túnel tem duas galerias.",) * 2
+
+
+@pytest.fixture
+def figures(make_png):
+    """A mesma figura em todas as páginas (mesmo xref) e um ícone pequeno"""
+    def make(color):
+        return [((56, 100, 256, 300), make_png(64, color)), ((300, 100, 310, 110), make_png(8, (0, 0, 0)))]
+    return make
+
+
+def test_images_are_written_once_and_linked(tmp_path, make_pdf, convert, figures):
+    images = figures((200, 30, 30))
+    out = tmp_path / 'out'
+    convert(make_pdf(tmp_path / 'a.pdf', PAGES, images), out, 'a.md', translate=False)
+    convert(make_pdf(tmp_path / 'b.pdf', PAGES, images), out, 'sub/b.md', translate=False)
+
+    stats = extract_assets(out, workers=1)
+    assert stats['documents'] == 2 and stats['images'] == 2
+    # Mesma figura nos dois documentos: um único arquivo, sem o ícone
+    assets = list((out / ASSETS_DIR).iterdir())
+    assert [path.suffix for path in assets] == ['.png'] and stats['written'] == 1
+    name = assets[0].name
+
+    a = (out / 'a.md').read_text(encoding='utf-8')
+    b = (out / 'sub' / 'b.md').read_text(encoding='utf-8')
+    assert f"![Página 1, figura 1](assets/{name})" in a
+    assert f"![Página 2, figura 1](assets/{name})" in a
+    assert f"![Página 1, figura 1](../assets/{name})" in b
+    assert all(ASSETS_DIR not in chunk['content'] for chunk in chunk_markdown(a, 'a.md'))
+
+    document = load_document(find_model(out, Path('a.md')))
+    assert document['images_extracted']
+    images = [block for block in document['pages'][0]['blocks'] if block['type'] == 'image']
+    assert [block['asset'] for block in images] == [name]
+
+    # Segunda execução: nada a extrair; a reconversão mantém os links
+    assert extract_assets(out, workers=1)['skipped'] == 2
+    convert(tmp_path / 'a.pdf', out, 'a.md', translate=False)
+    assert (out / 'a.md').read_text(encoding='utf-8') == a
+
+
+def test_missing_asset_is_extracted_again(tmp_path, make_pdf, convert, figures):
+    out = tmp_path / 'out'
+    convert(make_pdf(tmp_path / 'a.pdf', PAGES, figures((0, 90, 200))), out, 'a.md', translate=False)
+    extract_assets(out, workers=1)
+    for path in (out / ASSETS_DIR).iterdir():
+        path.unlink()
+
+    stats = extract_assets(out, workers=1)
+    assert stats['documents'] == 1 and stats['written'] == 1
+
+
+def test_sources_resolve_against_the_manifest_source_root(tmp_path, monkeypatch, make_pdf, figures):
+    make_pdf(tmp_path / 'PDF' / 'a.pdf', PAGES, figures((0, 90, 200)))
+    # Conversão com caminhos relativos ao diretório do projeto
+    monkeypatch.chdir(tmp_path)
+    convert_all_pdfs(backend='stub', translate=False, source_dir='PDF', target_dir='out')
+
+    # Extração rodando de outro diretório
+    elsewhere = tmp_path / 'elsewhere'
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    stats = extract_assets(tmp_path / 'out', workers=1)
+    assert stats['stale'] == 0 and stats['documents'] == 1
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Testes de que importar os scripts não carrega dependências pesadas nem lê o .env
+"""
+
+import py_compile
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / 'scripts'
+PACKAGE_DIR = SCRIPTS_DIR / 'tunel_docs'
+
+CHECK = """
+import sys
+import tunel_docs.{module}
+heavy = [name for name in ('fitz', 'pymupdf', 'openai', 'deep_translator', 'dotenv') if name in sys.modules]
+print(','.join(heavy))
+"""
+
+
+@pytest.mark.parametrize('script', sorted(PACKAGE_DIR.glob('*.py')), ids=lambda path: path.stem)
+def test_scripts_compile_on_this_interpreter(script, tmp_path):
+    # Pega sintaxe que só versões mais novas do Python aceitam (ver requires-python)
+    py_compile.compile(str(script), cfile=str(tmp_path / 'out.pyc'), doraise=True)
+
+
+@pytest.mark.parametrize('module', ['cli', 'convert_all_pdfs', 'document_model', 'pdf_translator_v2',
+                                    'pdf_translator_google', 'pdf_to_markdown_translator',
+                                    'setup_openai_assistant', 'benchmark_pipeline', 'synthetic_corpus'])
+def test_import_has_no_heavy_dependencies(module):
+    proc = subprocess.run([sys.executable, '-c', CHECK.format(module=module)],
+                          cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    # Nada é impresso nem carregado na importação
+    assert proc.stdout.strip() == ''
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Testes do planejador de renomeações de normalize_filenames
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.normalize_filenames import apply_plan, plan_renames, undo_renames
+
+
+def make_tree(root):
+    files = ['Edital Final.md', 'edital_final.md', 'Ação.md', 'Acao.md',
+             'Anexos Técnicos/Relatório (1).md', 'Anexos Técnicos/relatorio_1.md']
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding='utf-8')
+    return sorted(str(p.relative_to(root)) for p in root.rglob('*'))
+
+
+def test_plan_resolves_collisions_without_touching_disk(tmp_path):
+    before = make_tree(tmp_path)
+    plan = plan_renames(tmp_path)
+    targets = {entry['source']: entry['target'] for entry in plan}
+
+    assert sorted(str(p.relative_to(tmp_path)) for p in tmp_path.rglob('*')) == before
+    # Colide com um nome existente e com outro nome planejado
+    assert targets['Edital Final.md'] == 'edital_final_1.md'
+    assert targets['Acao.md'] == 'acao.md'
+    assert targets['Ação.md'] == 'acao_1.md'
+    assert targets['Anexos Técnicos/Relatório (1).md'] == 'anexos_tecnicos/relatorio_1_1.md'
+    # Arquivos antes das pastas que os contêm
+    order = [entry['source'] for entry in plan]
+    assert order.index('Anexos Técnicos/Relatório (1).md') < order.index('Anexos Técnicos')
+
+
+def test_apply_and_undo_round_trip(tmp_path):
+    before = make_tree(tmp_path)
+    log_path = tmp_path.parent / 'rename_log.jsonl'
+    plan = plan_renames(tmp_path)
+
+    assert apply_plan(tmp_path, plan, log_path) == len(plan)
+    after = sorted(str(p.relative_to(tmp_path)) for p in tmp_path.rglob('*'))
+    assert after == sorted({entry['target'] for entry in plan} | {'edital_final.md', 'anexos_tecnicos/relatorio_1.md'})
+    assert (tmp_path / 'acao_1.md').read_text(encoding='utf-8') == 'Ação.md'
+
+    assert undo_renames(tmp_path, log_path) == len(plan)
+    assert sorted(str(p.relative_to(tmp_path)) for p in tmp_path.rglob('*')) == before
@@ -7,25 +7,35 @@ Cria um assistente de teste com apenas alguns arquivos
 import os
 import time
 from pathlib import Path
-from openai import OpenAI
-from dotenv import dotenv_values
 import json
 
-# Carrega variáveis de ambiente
-env_path = Path(__file__).parent.parent / '.env'
-config = dotenv_values(str(env_path))
+# .env do diretório pai
+ENV_PATH = Path(__file__).parent.parent / '.env'
 
-if 'OPENAI_API_KEY' in config:
+def load_client():
+    """Cliente OpenAI com a chave do .env; None se a chave não estiver configurada"""
+    from dotenv import dotenv_values
+    from openai import OpenAI
+    
+    config = dotenv_values(str(ENV_PATH))
+    if 'OPENAI_API_KEY' not in config:
+        print("❌ OPENAI_API_KEY não encontrada")
+        return None
     os.environ['OPENAI_API_KEY'] = config['OPENAI_API_KEY']
     print(f"✅ API Key carregada: {config['OPENAI_API_KEY'][:20]}...")
-else:
-    print("❌ OPENAI_API_KEY não encontrada")
-    exit(1)
-
-# Inicializa cliente OpenAI
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    return OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
 
 def test_simple_assistant():
+    """Só roda com a chave da API configurada no .env"""
+    import pytest
+    pytest.importorskip('dotenv')
+    pytest.importorskip('openai')
+    client = load_client()
+    if client is None:
+        pytest.skip("OPENAI_API_KEY não encontrada no .env")
+    assert run_simple_assistant(client)
+
+def run_simple_assistant(client):
     """Testa criação de assistente sem arquivos"""
     print("\n🧪 Testando criação de assistente simples...")
     
@@ -105,7 +115,10 @@ def test_simple_assistant():
 
 if __name__ == "__main__":
     print("🚀 Teste Rápido do Assistente OpenAI\n")
-    assistant_id = test_simple_assistant()
+    client = load_client()
+    if client is None:
+        exit(1)
+    assistant_id = run_simple_assistant(client)
     
     if assistant_id:
         print("\n✨ Teste concluído com sucesso!")
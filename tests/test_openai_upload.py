@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Testes do upload concorrente para a OpenAI (novas tentativas, arquivos inalterados e progresso)
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.openai_upload import merge_entries, superseded_ids, upload_file, upload_files
+
+
+class FlakyFiles:
+    """Imita `client.files`: as primeiras `failures` chamadas de cada arquivo falham"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.attempts = {}
+        self.created = []
+
+    def create(self, file, purpose):
+        name = Path(file.name).name
+        self.attempts[name] = self.attempts.get(name, 0) + 1
+        if self.attempts[name] <= self.failures:
+            raise ConnectionError("rede instável")
+        self.created.append(name)
+        return SimpleNamespace(id=f"file-{len(self.created)}")
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def test_upload_retries_then_gives_up(tmp_path):
+    write(tmp_path / 'edital.md', "# Edital")
+    client = SimpleNamespace(files=FlakyFiles(failures=2))
+    assert upload_file(client, tmp_path / 'edital.md', retries=2, backoff=0) == 'file-1'
+    assert client.files.attempts['edital.md'] == 3
+
+    client = SimpleNamespace(files=FlakyFiles(failures=5))
+    with pytest.raises(ConnectionError):
+        upload_file(client, tmp_path / 'edital.md', retries=2, backoff=0)
+
+
+def test_unchanged_files_reuse_the_saved_id(tmp_path):
+    write(tmp_path / 'edital.md', "# Edital")
+    write(tmp_path / 'anexos' / 'anexo_1.md', "# Anexo 1")
+    client = SimpleNamespace(files=FlakyFiles(failures=1))
+    progress = []
+    first = upload_files(client, tmp_path, workers=2, backoff=0, on_uploaded=progress.append)
+    assert sorted(e['filename'] for e in first) == ['anexos/anexo_1.md', 'edital.md']
+    assert len(progress) == 2 and len(progress[-1]) == 2
+
+    write(tmp_path / 'edital.md', "# Edital retificado")
+    client.files.created.clear()
+    second = upload_files(client, tmp_path, previous=first, workers=2, backoff=0)
+    assert client.files.created == ['edital.md']
+    ids = {e['filename']: e['id'] for e in second}
+    assert ids['anexos/anexo_1.md'] == {e['filename']: e['id'] for e in first}['anexos/anexo_1.md']
+
+
+def test_progress_merge_keeps_old_ids_until_replaced():
+    saved = [{'id': 'file-1', 'filename': 'a.md', 'hash': '1'},
+             {'id': 'file-2', 'filename': 'b.md', 'hash': '2'}]
+    # Execução interrompida: só a.md foi reenviado
+    merged = merge_entries(saved, [{'id': 'file-3', 'filename': 'a.md', 'hash': '3'}])
+    assert merged == [{'id': 'file-3', 'filename': 'a.md', 'hash': '3', 'replaces': ['file-1']},
+                      {'id': 'file-2', 'filename': 'b.md', 'hash': '2'}]
+    # O progresso cumulativo seguinte não perde o ID substituído
+    merged = merge_entries(merged, [{'id': 'file-3', 'filename': 'a.md', 'hash': '3'},
+                                    {'id': 'file-4', 'filename': 'b.md', 'hash': '4'}])
+    assert superseded_ids(merged, [{'id': 'file-3'}, {'id': 'file-4'}]) == ['file-1', 'file-2']
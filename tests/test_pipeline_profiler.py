@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Testes da instrumentação por etapa do pipeline (medições, totais e relatórios)
+"""
+
+import csv
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.document_model import load_document, page_text
+from tunel_docs.pipeline_profiler import STAGES, StageProfiler
+
+PAGES = ("CONCESSION AGREEMENT\nThe concessionaire shall build the tunnel and the parties agree\n"
+         "to the terms of this contract for the concession period.",
+         "CLÁUSULA PRIMEIRA\nO objeto é a concessão patrocinada do túnel entre Santos e Guarujá.", '')
+
+
+def test_stages_accumulate_time_bytes_and_calls():
+    profiler = StageProfiler()
+    for _ in range(2):
+        with profiler.stage('a.pdf', 'extract', 100):
+            sum(range(1000))
+    profiler.record('a.pdf', 'translate', wall=2.0, cpu=0.5, nbytes=10)
+    # Bytes somados depois da medição não contam como outra chamada
+    profiler.add_bytes('a.pdf', 'extract', 50)
+
+    extract = profiler.records['a.pdf']['extract']
+    assert (extract['bytes'], extract['calls']) == (250, 2)
+    assert extract['wall'] > 0 and extract['cpu'] >= 0
+    assert profiler.records['a.pdf']['translate'] == {'wall': 2.0, 'cpu': 0.5, 'bytes': 10, 'calls': 1}
+
+
+def test_disabled_profiler_records_nothing(tmp_path, capsys):
+    profiler = StageProfiler(enabled=False)
+    with profiler.stage('a.pdf', 'extract', 100):
+        pass
+    profiler.record('a.pdf', 'translate', wall=1.0)
+    profiler.add_bytes('a.pdf', 'format', 10)
+    assert profiler.records == {}
+    assert profiler.write_reports(tmp_path / 'reports') is None
+    profiler.print_summary()
+    assert capsys.readouterr().out == ''
+    assert not (tmp_path / 'reports').exists()
+
+
+def test_totals_follow_the_stage_order():
+    profiler = StageProfiler()
+    profiler.record('lento.pdf', 'write', wall=0.1)
+    profiler.record('lento.pdf', 'translate', wall=3.0, nbytes=30)
+    profiler.record('lento.pdf', 'custom', wall=0.2)
+    profiler.record('rapido.pdf', 'translate', wall=1.0, nbytes=20)
+    profiler.record('rapido.pdf', 'extract', wall=0.5)
+
+    assert list(profiler.stage_totals()) == ['extract', 'translate', 'write', 'custom']
+    assert profiler.stage_totals()['translate']['bytes'] == 50
+    assert [(row['document'], row['stage']) for row in profiler.rows()] == [
+        ('lento.pdf', 'translate'), ('lento.pdf', 'write'), ('lento.pdf', 'custom'),
+        ('rapido.pdf', 'extract'), ('rapido.pdf', 'translate')]
+    slowest = profiler.document_totals()
+    assert [(total['document'], total['slowest_stage']) for total in slowest] == [
+        ('lento.pdf', 'translate'), ('rapido.pdf', 'translate')]
+
+
+def test_reports_are_written_as_json_and_csv(tmp_path):
+    profiler = StageProfiler()
+    profiler.record('a.pdf', 'extract', wall=0.5, nbytes=100)
+    profiler.record('b.pdf', 'extract', wall=0.25, nbytes=50)
+
+    json_path = profiler.write_reports(tmp_path / 'reports')
+    report = json.loads(json_path.read_text(encoding='utf-8'))
+    assert report['stages']['extract']['bytes'] == 150
+    assert [total['document'] for total in report['slowest']] == ['a.pdf', 'b.pdf']
+    with open(json_path.with_suffix('.csv'), encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['document'], row['stage'], row['bytes']) for row in rows] == [
+        ('a.pdf', 'extract', '100'), ('b.pdf', 'extract', '50')]
+
+
+def test_profiled_stages_match_the_report_order(tmp_path, make_pdf, convert):
+    pdf = make_pdf(tmp_path / 'contrato.pdf', PAGES)
+    profiler = StageProfiler()
+    for _ in range(2):
+        model = convert(pdf, tmp_path, profiler=profiler)
+    stages = profiler.records[str(pdf)]
+    assert set(stages) == set(STAGES)
+    # Abertura, extração e detecção medidas uma vez cada, só na conversão a frio
+    assert [stages[name]['calls'] for name in ('open', 'extract', 'detect', 'load_model')] == [1, 1, 1, 1]
+    pages = load_document(model)['pages']
+    assert stages['extract']['bytes'] == sum(len(page_text(page).encode('utf-8')) for page in pages)
+    assert stages['render']['calls'] == 2 and stages['render']['bytes'] == stages['write']['bytes']
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Testes da busca top-k sobre o índice de embeddings
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.build_embedding_index import build_index, load_index
+from tunel_docs.search_index import SearchIndex, top_k
+
+
+def test_top_k_matches_full_sort():
+    scores = np.random.default_rng(0).random((3, 50)).astype(np.float32)
+    expected = np.argsort(-scores, axis=1)[:, :7]
+    assert np.array_equal(top_k(scores, 7), expected)
+    assert top_k(scores[0], 100).shape == (50,)
+
+
+def test_search_batch_agrees_with_single_queries(tmp_path, markdown_docs):
+    docs_dir = markdown_docs
+    index_dir = tmp_path / 'index'
+    build_index(docs_dir, index_dir, backend='hashing')
+
+    index = SearchIndex(index_dir)
+    queries = ["licença ambiental da CETESB", "prazo de concessão"]
+    batch = index.search_batch(queries, k=2)
+    assert batch[0][0]['file'] == 'licenca.md'
+    for query, results in zip(queries, batch):
+        single = index.search(query, k=2)
+        assert [r['id'] for r in single] == [r['id'] for r in results]
+        assert np.isclose(single[0]['score'], results[0]['score'])
+
+
+def test_rows_are_normalized_on_disk_and_searched_in_place(tmp_path, markdown_docs):
+    docs_dir = markdown_docs
+    index_dir = tmp_path / 'index'
+    meta = build_index(docs_dir, index_dir, backend='hashing')
+    assert meta['normalized']
+    _, matrix = load_index(index_dir)
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+
+    index = SearchIndex(index_dir, exact=True)
+    assert isinstance(index.matrix, np.memmap)
+    expected = [r['id'] for r in index.search("licença ambiental", k=2)]
+
+    # Índice antigo, sem linhas normalizadas: a busca normaliza uma cópia
+    scaled = np.array(matrix) * 3
+    del index, matrix
+    np.save(index_dir / 'embeddings.npy', scaled)
+    meta.pop('normalized')
+    (index_dir / 'embeddings_meta.json').write_text(json.dumps(meta), encoding='utf-8')
+    legacy = SearchIndex(index_dir, exact=True)
+    assert not isinstance(legacy.matrix, np.memmap)
+    assert [r['id'] for r in legacy.search("licença ambiental", k=2)] == expected
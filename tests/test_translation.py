@@ -4,7 +4,7 @@ Script de teste para converter e traduzir apenas alguns PDFs
 """
 
 import os
-from pdf_translator_v2 import pdf_to_markdown
+from tunel_docs.pdf_translator_v2 import pdf_to_markdown
 from pathlib import Path
 
 def test_translation():
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Testes da memória de tradução (parágrafos idênticos e quase-duplicados)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import pytest
+
+from tunel_docs.convert_all_pdfs import translate_chunks
+from tunel_docs.translation_memory import MinHashLSH, TranslationMemory, paragraph_spans
+
+
+class FakeTranslator:
+    """Tradutor falso que registra o que foi enviado"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return '\n'.join(f"PT: {line}" for line in text.split('\n'))
+
+
+def test_exact_segments_are_reused():
+    memory = TranslationMemory()
+    translator = FakeTranslator()
+
+    first = memory.translate("The tunnel is immersed.\nThe contract has 30 years.", translator)
+    assert first == "PT: The tunnel is immersed.\nPT: The contract has 30 years."
+
+    memory.reset_stats()
+    second = memory.translate("The tunnel is immersed.\nA new clause was added.", translator)
+    assert second == "PT: The tunnel is immersed.\nPT: A new clause was added."
+    assert translator.calls[-1] == "A new clause was added."
+    assert memory.stats['reused_segments'] == 1
+    assert 0 < memory.reuse_ratio < 1
+
+
+ORIGINAL = ("The concessionaire shall deliver the immersed tunnel between Santos\n"
+            "and Guaruja within the period established in the contract schedule.")
+REVISED = ORIGINAL.replace("schedule.", "schedule annex.")
+
+
+def test_segments_are_paragraphs():
+    lines = ["### CLAUSE ONE", "The concessionaire shall deliver", "the tunnel.", "",
+             "- first item of the list", "continued here", "1. Second item.", "Last line"]
+    assert paragraph_spans(lines) == [(0, 1), (1, 3), (4, 6), (6, 7), (7, 8)]
+
+    memory = TranslationMemory()
+    translator = FakeTranslator()
+    memory.translate(ORIGINAL, translator)
+    assert translator.calls == [ORIGINAL]
+    # O mesmo parágrafo quebrado em outro ponto da linha é reaproveitado inteiro
+    rewrapped = ORIGINAL.replace("Santos\nand", "Santos and\n").replace("\n ", "\n")
+    assert memory.translate(rewrapped, translator) == memory.lookup(ORIGINAL)
+    assert len(translator.calls) == 1 and len(memory) == 1
+
+
+def test_near_duplicates_are_detected_but_translated():
+    memory = TranslationMemory(min_fuzzy_chars=20, reuse_threshold=None)
+    translator = FakeTranslator()
+    memory.translate(ORIGINAL, translator)
+
+    memory.reset_stats()
+    review = []
+    memory.translate(REVISED, translator, review)
+    assert translator.calls[-1] == REVISED
+    assert memory.stats['near_duplicates'] == 1 and review == []
+
+
+def test_near_duplicates_above_the_threshold_are_reused_for_review():
+    memory = TranslationMemory(min_fuzzy_chars=20, reuse_threshold=0.7)
+    translator = FakeTranslator()
+    text = "### CLAUSE ONE\n" + ORIGINAL
+    memory.translate(text, translator)
+
+    memory.reset_stats()
+    review = []
+    assert memory.translate("### CLAUSE ONE\n" + REVISED, translator, review) == memory.translate(text, translator)
+    assert len(translator.calls) == 1
+    assert [(item['line'], item['match']) for item in review] == [(1, ORIGINAL)]
+    assert review[0]['similarity'] >= 0.7
+    assert memory.stats['fuzzy_reused'] == 1
+    # A tradução herdada não vale como tradução do parágrafo revisado
+    assert memory.lookup(REVISED) is None
+
+    strict = TranslationMemory(min_fuzzy_chars=20, reuse_threshold=0.99)
+    strict.translate(text, translator)
+    strict.translate(REVISED, translator, review)
+    assert translator.calls[-1] == REVISED and len(review) == 1
+
+
+def test_copies_of_the_source_are_not_cached():
+    memory = TranslationMemory()
+    # Tradutor que falhou e devolveu o inglês
+    memory.translate("The tunnel is immersed.", lambda text: text)
+    assert memory.lookup("The tunnel is immersed.") is None
+
+    translator = FakeTranslator()
+    assert memory.translate("The tunnel is immersed.", translator) == "PT: The tunnel is immersed."
+    assert translator.calls == ["The tunnel is immersed."]
+
+
+def test_line_count_mismatch_counts_both_requests():
+    memory = TranslationMemory()
+    calls = []
+
+    def merging(text):
+        calls.append(text)
+        return ' '.join(f"PT: {line}" for line in text.split('\n'))
+
+    result = memory.translate("First line.\nSecond line.", merging)
+    assert len(calls) == 2 and result == "PT: First line. PT: Second line."
+    assert memory.stats['requests'] == 2
+    assert memory.stats['translated_chars'] == 2 * len("First line.Second line.")
+
+
+def test_failed_chunk_is_not_returned_as_translation():
+    class Flaky:
+        name = 'flaky'
+
+        def __init__(self):
+            self.calls = 0
+
+        def translate(self, text):
+            self.calls += 1
+            return f"PT: {text}" if self.calls == 1 else ''
+
+    memory = TranslationMemory()
+    text = "First paragraph of the contract.\nSecond paragraph of the contract."
+    with pytest.raises(ValueError):
+        memory.translate(text, lambda pending: translate_chunks(Flaky(), pending, max_chunk_size=40))
+    assert len(memory) == 0
+
+
+def test_memory_roundtrip(tmp_path):
+    path = tmp_path / 'memory.json'
+    memory = TranslationMemory(path)
+    memory.add("Tender notice", "Edital")
+    memory.save()
+
+    loaded = TranslationMemory.load(path)
+    assert loaded.lookup("  tender   NOTICE ") == "Edital"
+
+
+def test_minhash_similarity_threshold():
+    index = MinHashLSH()
+    index.add('a', "one two three four five six seven eight nine ten")
+    assert index.query("one two three four five six seven eight nine ten")[0] == 'a'
+    assert index.query("completely different words in this other sentence here") is None
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Testes da verificação de qualidade das traduções e da retradução das páginas apontadas
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.conversion_manifest import MANIFEST_FILE, ConversionManifest
+from tunel_docs.convert_all_pdfs import get_memory_file, retranslate_flagged
+from tunel_docs.document_model import load_document, page_markdown, save_document
+from tunel_docs.pdf_text import detect_language, english_mask
+from tunel_docs.translation_memory import TranslationMemory
+from tunel_docs.translation_quality import QUALITY_ALLOWLIST_FILE, check_corpus, check_documents
+
+PAGES = [
+    "CONCESSION AGREEMENT\nThe concessionaire shall build the tunnel and the parties agree\n"
+    "to the terms of this contract for the concession period.",
+    "ANNEX\nThe works in the port of the city shall start with the state approval\n"
+    "and the tunnel is delivered to the state in the third year.",
+    "CLÁUSULA PRIMEIRA\nO objeto é a concessão patrocinada do túnel entre Santos e Guarujá.",
+]
+
+
+@pytest.fixture
+def model(tmp_path, make_pdf, convert) -> Path:
+    """Modelo do contrato convertido em tmp_path/out, com manifesto e versão bilíngue"""
+    manifest = ConversionManifest.load(tmp_path / 'out' / MANIFEST_FILE)
+    path = convert(make_pdf(tmp_path / 'contrato.pdf', PAGES), tmp_path / 'out', manifest=manifest,
+                   bilingual_path=str(tmp_path / 'bilingue' / 'contrato.md'))
+    manifest.save()
+    return path
+
+
+def test_stub_translation_passes(tmp_path, model):
+    assert check_corpus(tmp_path / 'out') == []
+
+
+def test_flags_untranslated_truncated_and_missing_pages():
+    source = ("The concessionaire shall build the tunnel and the parties agree\n"
+              "to the terms of this contract for the concession period.")
+    page = {'number': 1, 'language': 'en', 'blocks': [{'type': 'text', 'lines': [
+        {'text': line} for line in source.split('\n')]}]}
+    document = {'pages': [
+        dict(page, translation="A concessionária deverá construir o túnel e as partes concordam\n"
+                               "to the terms of this contract for the concession period."),
+        dict(page, number=2, translation="A concessionária deverá construir"),
+        dict(page, number=3, translation=None),
+        dict(page, number=4, translation="A concessionária deverá construir o túnel e as partes\n"
+                                         "com os termos deste contrato pelo período da concessão."),
+    ]}
+    assert page_markdown(page) == source
+
+    flags = check_documents([('contrato.md', document)])
+    assert [(f['page'], f['reasons'], f['segments']) for f in flags] == [
+        (1, ['untranslated'], [1]), (2, ['truncated'], []), (3, ['missing'], [])]
+    assert flags[1]['ratio'] < 0.5
+    # Documento convertido sem tradução: página sem tradução não é falha
+    assert len(check_documents([('contrato.md', dict(document, translate=False))])) == 2
+
+
+def test_names_and_allowlisted_lines_are_not_flagged():
+    lines = ["Avenida Conselheiro Nébias, 754 - Santos/SP - CEP 11045-002",
+             "Companhia Docas do Estado de São Paulo - CODESP",
+             "Resolution approved on the date of the meeting for the works"]
+    page = {'number': 1, 'language': 'en', 'blocks': [{'type': 'text', 'lines': [
+        {'text': line} for line in lines]}], 'translation': '\n'.join(lines[:2] + ["Resolução aprovada"])}
+    # Página inteira cortada, mas só a terceira linha é suspeita
+    assert [f['segments'] for f in check_documents([('a.md', {'pages': [page]})])] == [[2]]
+    assert check_documents([('a.md', {'pages': [dict(page, translation='\n'.join(lines))]})],
+                           allowlist={lines[2]})[0]['segments'] == []
+
+
+def test_english_mask_matches_detect_language():
+    texts = ["", "short", "The tunnel of the port and the city is here for all",
+             "O túnel é de concreto e o porto fica na cidade de Santos",
+             "Resolution approved on the date of the meeting for the works"]
+    assert list(english_mask(texts)) == [detect_language(text) == 'en' for text in texts]
+
+
+def test_retranslate_flagged_fixes_pages_and_memory(tmp_path, model, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    document = load_document(model)
+    bad = page_markdown(document['pages'][1])
+    document['pages'][0]['translation'] = document['pages'][0]['translation'][:20]
+    document['pages'][1]['translation'] = bad
+    save_document(document, model)
+    # A memória também guardou o texto sem traduzir (como faz quando o tradutor falha)
+    memory = TranslationMemory(get_memory_file())
+    for line in bad.split('\n'):
+        memory.add(line, line)
+    memory.save()
+
+    flags = check_corpus(tmp_path / 'out')
+    assert [(f['page'], f['reasons']) for f in flags] == [(1, ['truncated']), (2, ['untranslated'])]
+
+    assert retranslate_flagged(str(tmp_path / 'out'), backend='stub') == 0
+    pages = load_document(model)['pages']
+    assert pages[1]['translation'] != bad and pages[1]['translation_backend'] == 'stub:stub'
+    assert pages[1]['translation'] in (tmp_path / 'out' / 'contrato.md').read_text(encoding='utf-8')
+    bilingual = (tmp_path / 'bilingue' / 'contrato.md').read_text(encoding='utf-8')
+    assert pages[1]['translation'].split('\n')[-1] in bilingual
+    entry = ConversionManifest.load(tmp_path / 'out' / MANIFEST_FILE).get(tmp_path / 'contrato.pdf')
+    assert entry['retranslated_pages'] == [1, 2]
+    assert check_corpus(tmp_path / 'out') == []
+
+
+def test_fuzzy_reused_paragraphs_are_flagged_for_review(tmp_path, model, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    document = load_document(model)
+    document['pages'][0]['review'] = [{'line': 1, 'match': "The concessionaire shall build the tunnel",
+                                       'similarity': 0.92}]
+    save_document(document, model)
+    flags = check_corpus(tmp_path / 'out')
+    assert [(f['page'], f['reasons'], f['segments']) for f in flags] == [(1, ['fuzzy'], [1])]
+
+    assert retranslate_flagged(str(tmp_path / 'out'), backend='stub') == 0
+    assert 'review' not in load_document(model)['pages'][0]
+
+
+def test_allowlist_file_is_read_from_the_output_dir(tmp_path, model):
+    document = load_document(model)
+    document['pages'][1]['translation'] = page_markdown(document['pages'][1])
+    save_document(document, model)
+    assert [f['page'] for f in check_corpus(tmp_path / 'out')] == [2]
+    # Todas as linhas liberadas: a página inteira também fica liberada
+    (tmp_path / 'out' / QUALITY_ALLOWLIST_FILE).write_text(
+        document['pages'][1]['translation'] + '\n', encoding='utf-8')
+    assert check_corpus(tmp_path / 'out') == []
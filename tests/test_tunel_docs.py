@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Testes do despacho de subcomandos da CLI tunel-docs
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.cli import resolve
+
+
+def test_subcommands_map_to_script_modules():
+    assert resolve(['convert', '--workers', '4']) == (
+        'convert_all_pdfs', 'main', ['--no-translate', '--workers', '4'], 'tunel-docs convert')
+    assert resolve(['translate', '--backend', 'stub']) == (
+        'convert_all_pdfs', 'main', ['--backend', 'stub'], 'tunel-docs translate')
+    assert resolve(['index', 'bm25', 'search', 'prazo']) == (
+        'bm25_index', 'main', ['search', 'prazo'], 'tunel-docs index bm25')
+    assert resolve(['upload', 'sync'])[:3] == ('setup_openai_assistant', 'cli', ['sync'])
+
+
+def test_unknown_commands_are_rejected():
+    assert resolve([]) is None
+    assert resolve(['index']) is None
+    assert resolve(['index', 'nope']) is None
+    assert resolve(['--help']) is None
+
+
+
+@pytest.mark.parametrize('module', ['pdf_to_markdown', 'pdf_to_markdown_translator', 'pdf_translator_v2',
+                                    'pdf_translator_google'])
+def test_legacy_converters_use_the_pipeline(module, tmp_path, make_pdf, monkeypatch):
+    from tunel_docs import convert_all_pdfs as pipeline
+
+    legacy = importlib.import_module(f"tunel_docs.{module}")
+    # O backend pedido pelo script legado é trocado pelo local, sem rede
+    convert = pipeline.pdf_to_markdown
+    monkeypatch.setattr(pipeline, 'pdf_to_markdown',
+                        lambda *args, **kwargs: convert(*args, **dict(kwargs, backend='stub')))
+    pdf = make_pdf(tmp_path / 'contrato.pdf', ["CONCESSION AGREEMENT\nThe concessionaire shall build the tunnel "
+                                               "and the parties agree to the terms of the contract."])
+    assert legacy.pdf_to_markdown(str(pdf))
+    assert convert(str(pdf), str(tmp_path / 'esperado.md'), translate=module != 'pdf_to_markdown',
+                   backend='stub')
+    assert (tmp_path / 'contrato.md').read_text(encoding='utf-8') == \
+        (tmp_path / 'esperado.md').read_text(encoding='utf-8')
+
+
+def test_default_paths_are_relative_to_the_working_directory(tmp_path, monkeypatch):
+    from tunel_docs.chunk_store import CHUNK_STORE_FILE
+    from tunel_docs.setup_openai_assistant import ENV_PATH, get_config_file
+
+    monkeypatch.chdir(tmp_path)
+    docs = tmp_path / 'PDF_Markdown_Traduzido'
+    docs.mkdir()
+    (docs / 'edital.md').write_text("# Edital\n\n## Página 1\n\nO túnel tem duas galerias.", encoding='utf-8')
+    # A CLI troca sys.argv pelo argv do subcomando
+    monkeypatch.setattr(sys, 'argv', ['tunel-docs'])
+    from tunel_docs.cli import main
+    main(['index', 'chunks'])
+    assert (docs / CHUNK_STORE_FILE).exists()
+    assert get_config_file().resolve() == tmp_path / '.openai_config.json'
+    assert ENV_PATH.resolve() == tmp_path / '.env'
+
+
+def test_translation_memory_file_is_configurable(tmp_path, monkeypatch, make_pdf):
+    from tunel_docs.cli import main
+    from tunel_docs.convert_all_pdfs import MEMORY_FILE
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'argv', ['tunel-docs'])
+    make_pdf(tmp_path / 'PDF' / 'a.pdf', ["The concessionaire shall build the tunnel and the parties agree\n"
+                                          "to the terms of this contract for the concession period."])
+    main(['translate', '--backend', 'stub', '--output-dir', 'out', '--memory-file', 'cache/memoria.json'])
+    assert (tmp_path / 'cache' / 'memoria.json').exists() and not (tmp_path / MEMORY_FILE).exists()
+
+    main(['translate', '--backend', 'stub', '--output-dir', 'out2', '--no-memory'])
+    assert (tmp_path / 'out2' / 'a.md').exists() and not (tmp_path / MEMORY_FILE).exists()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Testes da sincronização incremental do Vector Store contra uma OpenAI falsa
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from tunel_docs.vector_store_sync import diff_files, ingest_files, sync_vector_store, vector_stores
+
+
+class FakeOpenAI:
+    """Imita os endpoints de arquivos e Vector Store usados na sincronização"""
+
+    def __init__(self):
+        self.uploaded = {}
+        self.deleted = []
+        self.attached = set()
+        self.batches = []
+        self.files = SimpleNamespace(create=self._create_file, delete=self._delete_file)
+        # Arquivos cuja indexação deve falhar na primeira tentativa
+        self.fail_once = set()
+        # Nomes de arquivo cuja indexação não termina (lote fica em andamento)
+        self.slow_files = set()
+        # Vector Stores fora do beta, como na API atual (openai>=1.66)
+        self.vector_stores = SimpleNamespace(
+            files=SimpleNamespace(delete=self._detach),
+            file_batches=SimpleNamespace(create=self._create_batch,
+                                         retrieve=self._retrieve_batch,
+                                         list_files=self._list_batch_files),
+        )
+
+    def _create_file(self, file, purpose):
+        file_id = f"file-{len(self.uploaded) + 1}"
+        self.uploaded[file_id] = Path(file.name).name
+        return SimpleNamespace(id=file_id)
+
+    def _delete_file(self, file_id):
+        self.deleted.append(file_id)
+
+    def _detach(self, vector_store_id, file_id):
+        self.attached.discard(file_id)
+
+    def _create_batch(self, vector_store_id, file_ids):
+        failed = [f for f in file_ids if f in self.fail_once]
+        self.fail_once.difference_update(failed)
+        slow = [f for f in file_ids if self.uploaded.get(f) in self.slow_files]
+        batch = SimpleNamespace(
+            id=f"vsfb_{len(self.batches) + 1}",
+            status='in_progress',
+            failed=failed,
+            slow=slow,
+            file_counts=SimpleNamespace(completed=len(file_ids) - len(failed) - len(slow), failed=len(failed),
+                                        in_progress=len(slow), cancelled=0),
+        )
+        self.batches.append(batch)
+        self.attached.update(f for f in file_ids if f not in failed and f not in slow)
+        return batch
+
+    def _retrieve_batch(self, batch_id, vector_store_id):
+        batch = next(b for b in self.batches if b.id == batch_id)
+        batch.status = 'in_progress' if batch.slow else 'completed'
+        return batch
+
+    def _list_batch_files(self, batch_id, vector_store_id, filter):
+        batch = next(b for b in self.batches if b.id == batch_id)
+        return [SimpleNamespace(id=f) for f in {'failed': batch.failed, 'in_progress': batch.slow}.get(filter, [])]
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def test_sync_uploads_only_changes(tmp_path):
+    write(tmp_path / 'edital.md', "# Edital")
+    write(tmp_path / 'anexos' / 'anexo_1.md', "# Anexo 1")
+    client = FakeOpenAI()
+
+    files = sync_vector_store(client, tmp_path, 'vs_1', [], workers=2, poll_interval=0)
+    assert len(files) == 2
+    assert len(client.batches) == 1
+
+    # Nada mudou: nenhuma chamada nova
+    files = sync_vector_store(client, tmp_path, 'vs_1', files, workers=2, poll_interval=0)
+    assert len(client.uploaded) == 2
+    assert len(client.batches) == 1
+
+    # Um alterado, um removido, um novo
+    old_ids = {entry['filename']: entry['id'] for entry in files}
+    write(tmp_path / 'edital.md', "# Edital retificado")
+    (tmp_path / 'anexos' / 'anexo_1.md').unlink()
+    write(tmp_path / 'contrato.md', "# Contrato")
+
+    files = sync_vector_store(client, tmp_path, 'vs_1', files, workers=2, poll_interval=0)
+    assert sorted(entry['filename'] for entry in files) == ['contrato.md', 'edital.md']
+    assert len(client.uploaded) == 4
+    assert sorted(client.deleted) == sorted([old_ids['edital.md'], old_ids['anexos/anexo_1.md']])
+    assert client.attached == {entry['id'] for entry in files}
+
+
+def test_diff_files_classifies_entries(tmp_path):
+    write(tmp_path / 'a.md', "a")
+    diff = diff_files(tmp_path, [{'id': 'file-x', 'filename': 'b.md', 'hash': '0'}])
+    assert [p.name for p in diff['new']] == ['a.md']
+    assert [entry['id'] for entry in diff['removed']] == ['file-x']
+
+
+def test_ingest_files_batches_and_resubmits_failures():
+    client = FakeOpenAI()
+    file_ids = [f"file-{i}" for i in range(7)]
+    client.fail_once = {'file-2', 'file-5'}
+
+    summary = ingest_files(client, 'vs_1', file_ids, batch_size=3, poll_interval=0)
+    # 3 lotes na primeira rodada + 1 lote de reenvio com os dois que falharam
+    assert len(client.batches) == 4
+    assert client.batches[-1].file_counts.completed == 2
+    assert summary['completed'] == 7
+    assert summary['failed'] == 0
+    assert client.attached == set(file_ids)
+
+
+def test_ingestion_failure_keeps_uploads_for_next_sync(tmp_path):
+    write(tmp_path / 'edital.md', "# Edital")
+    client = FakeOpenAI()
+    files = sync_vector_store(client, tmp_path, 'vs_1', [], workers=1, poll_interval=0)
+    old_id = files[0]['id']
+
+    write(tmp_path / 'edital.md', "# Edital retificado")
+    write(tmp_path / 'contrato.md', "# Contrato")
+    saved = []
+
+    def broken_batch(vector_store_id, file_ids):
+        raise RuntimeError("timeout")
+
+    create_batch = client.vector_stores.file_batches.create
+    client.vector_stores.file_batches.create = broken_batch
+    with pytest.raises(RuntimeError):
+        sync_vector_store(client, tmp_path, 'vs_1', files, workers=1, poll_interval=0,
+                          on_progress=saved.append)
+    # Os IDs enviados foram gravados antes da indexação
+    interim = saved[-1]
+    assert all(entry['pending_ingest'] for entry in interim)
+    assert next(e for e in interim if e['filename'] == 'edital.md')['replaces'] == [old_id]
+
+    client.vector_stores.file_batches.create = create_batch
+    files = sync_vector_store(client, tmp_path, 'vs_1', interim, workers=1, poll_interval=0)
+    assert len(client.uploaded) == 3
+    assert client.deleted == [old_id]
+    assert client.attached == {entry['id'] for entry in files}
+    assert not any('pending_ingest' in entry or 'replaces' in entry for entry in files)
+
+
+def test_batch_still_indexing_at_timeout_keeps_the_old_version(tmp_path):
+    write(tmp_path / 'edital.md', "# Edital")
+    client = FakeOpenAI()
+    files = sync_vector_store(client, tmp_path, 'vs_1', [], workers=1, poll_interval=0)
+    old_id = files[0]['id']
+
+    write(tmp_path / 'edital.md', "# Edital retificado")
+    client.slow_files = {'edital.md'}
+    files = sync_vector_store(client, tmp_path, 'vs_1', files, workers=1, poll_interval=0, timeout=0)
+    assert files[0]['pending_ingest'] and files[0]['replaces'] == [old_id]
+    assert client.deleted == [] and client.attached == {old_id}
+
+    # Só depois de indexada a nova versão a antiga sai do store
+    client.slow_files = set()
+    files = sync_vector_store(client, tmp_path, 'vs_1', files, workers=1, poll_interval=0)
+    assert len(client.uploaded) == 2
+    assert client.deleted == [old_id] and client.attached == {files[0]['id']}
+
+
+def test_vector_stores_fall_back_to_the_beta_namespace():
+    client = FakeOpenAI()
+    assert vector_stores(client) is client.vector_stores
+    # Versões anteriores à 1.66 só têm client.beta.vector_stores
+    old = SimpleNamespace(beta=SimpleNamespace(vector_stores=client.vector_stores))
+    assert vector_stores(old) is client.vector_stores
+
+
+def test_installed_openai_has_the_vector_store_endpoints():
+    openai = pytest.importorskip('openai')
+    stores = vector_stores(openai.OpenAI(api_key='sk-teste'))
+    for endpoint in (stores.create, stores.files.delete, stores.file_batches.create,
+                     stores.file_batches.retrieve, stores.file_batches.list_files):
+        assert callable(endpoint)